@@ -0,0 +1,71 @@
+"""
+Alembic 마이그레이션 환경 설정
+
+데이터베이스 URL은 애플리케이션 설정(settings.get_database_url)에서 가져오고,
+대상 메타데이터는 app.db.base에서 모든 모델이 등록된 Base를 사용합니다.
+
+사용법 (backend 디렉토리에서):
+    alembic upgrade head
+"""
+
+from logging.config import fileConfig
+
+from sqlalchemy import engine_from_config
+from sqlalchemy import pool
+
+from alembic import context
+
+from app.core.config import settings
+from app.db.base import Base
+
+# Alembic Config 객체 (alembic.ini 값에 접근)
+config = context.config
+config.set_main_option("sqlalchemy.url", settings.get_database_url().replace("%", "%%"))
+
+# 로깅 설정
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+# autogenerate 지원을 위한 모델 메타데이터
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    """
+    오프라인 모드 마이그레이션 (DB 연결 없이 SQL 스크립트 출력)
+    """
+    url = config.get_main_option("sqlalchemy.url")
+    context.configure(
+        url=url,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """
+    온라인 모드 마이그레이션 (DB에 직접 적용)
+    """
+    connectable = engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+
+    with connectable.connect() as connection:
+        context.configure(
+            connection=connection, target_metadata=target_metadata
+        )
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,64 @@
+"""posture_records (user_id, created_at) 복합 인덱스 추가
+
+Revision ID: 0001_posture_user_created_idx
+Revises:
+Create Date: 2026-10-17 00:00:00
+
+기존 테이블은 init_db(create_all)로 생성되므로 이 리비전은 인덱스만 추가합니다.
+데이터가 있는 운영 테이블에서도 쓰기를 막지 않도록 온라인으로 생성합니다.
+- MySQL: ALGORITHM=INPLACE, LOCK=NONE (InnoDB 온라인 DDL)
+- PostgreSQL: CREATE INDEX CONCURRENTLY
+- 그 외(SQLite 등): 일반 CREATE INDEX
+init_db로 새로 만든 테이블에는 이미 인덱스가 있으므로 건너뜁니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0001_posture_user_created_idx'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE_NAME = "posture_records"
+INDEX_NAME = "ix_posture_records_user_id_created_at"
+INDEX_COLUMNS = ["user_id", "created_at"]
+
+
+def _index_exists(offline_default: bool) -> bool:
+    # 오프라인(--sql) 모드에서는 DB를 조회할 수 없으므로 기본값 사용
+    if op.get_context().as_sql:
+        return offline_default
+    inspector = sa.inspect(op.get_bind())
+    return any(index["name"] == INDEX_NAME for index in inspector.get_indexes(TABLE_NAME))
+
+
+def upgrade() -> None:
+    if _index_exists(offline_default=False):
+        return
+
+    dialect = op.get_bind().dialect.name
+    if dialect == "mysql":
+        op.execute(
+            f"ALTER TABLE {TABLE_NAME} ADD INDEX {INDEX_NAME} ({', '.join(INDEX_COLUMNS)}), "
+            "ALGORITHM=INPLACE, LOCK=NONE"
+        )
+    elif dialect == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index(INDEX_NAME, TABLE_NAME, INDEX_COLUMNS, postgresql_concurrently=True)
+    else:
+        op.create_index(INDEX_NAME, TABLE_NAME, INDEX_COLUMNS)
+
+
+def downgrade() -> None:
+    if not _index_exists(offline_default=True):
+        return
+
+    dialect = op.get_bind().dialect.name
+    if dialect == "mysql":
+        op.execute(f"ALTER TABLE {TABLE_NAME} DROP INDEX {INDEX_NAME}, ALGORITHM=INPLACE, LOCK=NONE")
+    else:
+        op.drop_index(INDEX_NAME, table_name=TABLE_NAME)
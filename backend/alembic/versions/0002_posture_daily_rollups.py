@@ -0,0 +1,45 @@
+"""posture_daily_rollups 일일 집계 테이블 추가
+
+Revision ID: 0002_posture_daily_rollups
+Revises: 0001_posture_user_created_idx
+Create Date: 2026-10-17 00:00:00
+
+테이블 생성 후 기존 기록은 백필 스크립트로 반영합니다.
+    python rebuild_rollups.py
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0002_posture_daily_rollups'
+down_revision: Union[str, None] = '0001_posture_user_created_idx'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if not op.get_context().as_sql and sa.inspect(op.get_bind()).has_table("posture_daily_rollups"):
+        return
+
+    op.create_table(
+        "posture_daily_rollups",
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False, comment="사용자 ID"),
+        sa.Column("date", sa.Date(), nullable=False, comment="집계 날짜"),
+        sa.Column("record_count", sa.Integer(), nullable=False, comment="기록 수"),
+        sa.Column("score_sum", sa.Float(), nullable=False, comment="종합 점수 합계"),
+        sa.Column("neck_angle_sum", sa.Float(), nullable=False, comment="목 각도 합계"),
+        sa.Column("forward_head_distance_sum", sa.Float(), nullable=False, comment="전방 머리 거리 합계"),
+        sa.Column("neck_angle_normal_count", sa.Integer(), nullable=False, comment="목 각도 정상 기록 수"),
+        sa.Column("forward_head_normal_count", sa.Integer(), nullable=False, comment="전방 머리 정상 기록 수"),
+        sa.Column("head_tilt_normal_count", sa.Integer(), nullable=False, comment="머리 기울기 정상 기록 수"),
+        sa.Column("all_normal_count", sa.Integer(), nullable=False, comment="세 기준 모두 정상인 기록 수"),
+        sa.Column("last_created_at", sa.DateTime(timezone=True), nullable=True, comment="해당 날짜 마지막 측정 시간"),
+        sa.PrimaryKeyConstraint("user_id", "date"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("posture_daily_rollups")
@@ -0,0 +1,62 @@
+"""posture_analyses (record_id, analysis_version) 유니크 인덱스 추가
+
+Revision ID: 0003_posture_analysis_record_idx
+Revises: 0002_posture_daily_rollups
+Create Date: 2026-10-17 00:00:00
+
+백그라운드 분석 워커가 미분석 기록을 찾는 NOT EXISTS 조회와 기록별 분석 결과 조회에 사용하며,
+같은 기록을 같은 규칙 버전으로 두 번 저장하지 않도록 막습니다.
+0001과 같은 방식으로 온라인 생성합니다 (MySQL INPLACE / PostgreSQL CONCURRENTLY).
+기존 분석 결과는 replay_analyses.py로 채웁니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0003_posture_analysis_record_idx'
+down_revision: Union[str, None] = '0002_posture_daily_rollups'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE_NAME = "posture_analyses"
+INDEX_NAME = "uq_posture_analyses_record_version"
+INDEX_COLUMNS = ["record_id", "analysis_version"]
+
+
+def _index_exists(offline_default: bool) -> bool:
+    # 오프라인(--sql) 모드에서는 DB를 조회할 수 없으므로 기본값 사용
+    if op.get_context().as_sql:
+        return offline_default
+    inspector = sa.inspect(op.get_bind())
+    return any(index["name"] == INDEX_NAME for index in inspector.get_indexes(TABLE_NAME))
+
+
+def upgrade() -> None:
+    if _index_exists(offline_default=False):
+        return
+
+    dialect = op.get_bind().dialect.name
+    if dialect == "mysql":
+        op.execute(
+            f"ALTER TABLE {TABLE_NAME} ADD UNIQUE INDEX {INDEX_NAME} ({', '.join(INDEX_COLUMNS)}), "
+            "ALGORITHM=INPLACE, LOCK=NONE"
+        )
+    elif dialect == "postgresql":
+        with op.get_context().autocommit_block():
+            op.create_index(INDEX_NAME, TABLE_NAME, INDEX_COLUMNS, unique=True, postgresql_concurrently=True)
+    else:
+        op.create_index(INDEX_NAME, TABLE_NAME, INDEX_COLUMNS, unique=True)
+
+
+def downgrade() -> None:
+    if not _index_exists(offline_default=True):
+        return
+
+    dialect = op.get_bind().dialect.name
+    if dialect == "mysql":
+        op.execute(f"ALTER TABLE {TABLE_NAME} DROP INDEX {INDEX_NAME}, ALGORITHM=INPLACE, LOCK=NONE")
+    else:
+        op.drop_index(INDEX_NAME, table_name=TABLE_NAME)
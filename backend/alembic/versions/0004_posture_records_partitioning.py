@@ -0,0 +1,178 @@
+"""posture_records created_at 월 단위 범위 파티션으로 변환
+
+Revision ID: 0004_posture_records_partitions
+Revises: 0003_posture_analysis_record_idx
+Create Date: 2026-10-17 00:00:00
+
+보존 정책에서 오래된 기록을 DELETE 대신 파티션 단위로 삭제/보관하기 위해 변환합니다.
+(파티션 생성/보존 정책은 app/crud/posture_partition.py, maintain_partitions.py)
+
+- MySQL: 파티션 테이블은 외래 키를 지원하지 않고 모든 유니크 키에 파티션 컬럼이 포함되어야 하므로
+  posture_records의 외래 키와 posture_analyses.record_id 외래 키를 제거하고
+  기본 키를 (id, created_at)으로 바꾼 뒤 RANGE COLUMNS(created_at)으로 파티션 지정
+  (가장 오래된 기록의 달부터 POSTURE_PARTITION_PREMAKE_MONTHS개월 뒤까지 + p_future)
+  테이블을 다시 만드는 작업이므로 기록이 많으면 점검 시간에 실행합니다.
+- PostgreSQL: 기존 테이블을 posture_records_legacy로 이름을 바꾸어 새 파티션 테이블의
+  (MINVALUE ~ 다음 달) 파티션으로 연결하고 이후 월 파티션과 DEFAULT 파티션 생성
+  (파티션 테이블을 참조하는 외래 키는 파티션 컬럼이 필요하므로 posture_analyses.record_id 외래 키 제거)
+- SQLite 등: 변환하지 않음 (기간별 테이블로 흉내냄)
+
+되돌리기는 파티션만 제거하고 외래 키는 다시 만들지 않습니다. (MySQL만 지원)
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.config import settings
+from app.crud.posture_partition import FUTURE_PARTITION, DEFAULT_PARTITION, add_months, month_start
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0004_posture_records_partitions'
+down_revision: Union[str, None] = '0003_posture_analysis_record_idx'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLE_NAME = "posture_records"
+LEGACY_TABLE = f"{TABLE_NAME}_legacy"
+
+
+def _literal(value: datetime) -> str:
+    return f"'{value:%Y-%m-%d %H:%M:%S}'"
+
+
+def _is_partitioned(dialect: str) -> bool:
+    # 오프라인(--sql) 모드에서는 DB를 조회할 수 없으므로 변환 전으로 간주
+    if op.get_context().as_sql:
+        return False
+    bind = op.get_bind()
+    if dialect == "mysql":
+        return bind.execute(sa.text(
+            "SELECT COUNT(*) FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND PARTITION_NAME IS NOT NULL"
+        ), {"table": TABLE_NAME}).scalar() > 0
+    return bind.execute(sa.text(
+        "SELECT relkind = 'p' FROM pg_class WHERE relname = :table"
+    ), {"table": TABLE_NAME}).scalar() is True
+
+
+def _first_month(current: datetime) -> datetime:
+    """가장 오래된 기록의 달 (오프라인 모드거나 기록이 없으면 이번 달)"""
+    if op.get_context().as_sql:
+        return current
+    oldest = op.get_bind().execute(sa.text(f"SELECT MIN(created_at) FROM {TABLE_NAME}")).scalar()
+    return min(month_start(oldest), current) if oldest else current
+
+
+# 오프라인(--sql) 모드에서 제거할 외래 키 (create_all 기본 이름)
+OFFLINE_FOREIGN_KEYS = {
+    "mysql": [(TABLE_NAME, "posture_records_ibfk_1"), ("posture_analyses", "posture_analyses_ibfk_1")],
+    "postgresql": [(TABLE_NAME, "posture_records_user_id_fkey"), ("posture_analyses", "posture_analyses_record_id_fkey")],
+}
+
+
+def _drop_foreign_keys(dialect: str) -> None:
+    """posture_records의 외래 키와 posture_records를 참조하는 외래 키 제거"""
+    if op.get_context().as_sql:
+        foreign_keys = OFFLINE_FOREIGN_KEYS[dialect]
+    else:
+        inspector = sa.inspect(op.get_bind())
+        foreign_keys = [
+            (table, foreign_key["name"])
+            for table in (TABLE_NAME, "posture_analyses")
+            for foreign_key in inspector.get_foreign_keys(table)
+            if table == TABLE_NAME or foreign_key["referred_table"] == TABLE_NAME
+        ]
+    for table, name in foreign_keys:
+        op.drop_constraint(name, table, type_="foreignkey")
+
+
+def _upgrade_mysql() -> None:
+    current = month_start(datetime.now())
+    months = []
+    month = _first_month(current)
+    while month <= add_months(current, settings.POSTURE_PARTITION_PREMAKE_MONTHS):
+        months.append(month)
+        month = add_months(month, 1)
+
+    _drop_foreign_keys("mysql")
+    op.execute(f"UPDATE {TABLE_NAME} SET created_at = CURRENT_TIMESTAMP WHERE created_at IS NULL")
+    op.execute(
+        f"ALTER TABLE {TABLE_NAME} "
+        "MODIFY created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP COMMENT '생성 시간', "
+        "DROP PRIMARY KEY, ADD PRIMARY KEY (id, created_at)"
+    )
+    definitions = ", ".join(
+        f"PARTITION p{month:%Y%m} VALUES LESS THAN ({_literal(add_months(month, 1))})" for month in months
+    )
+    op.execute(
+        f"ALTER TABLE {TABLE_NAME} PARTITION BY RANGE COLUMNS(created_at) "
+        f"({definitions}, PARTITION {FUTURE_PARTITION} VALUES LESS THAN (MAXVALUE))"
+    )
+
+
+def _upgrade_postgresql() -> None:
+    current = month_start(datetime.now())
+    legacy_end = add_months(current, 1)
+
+    _drop_foreign_keys("postgresql")
+    bind = op.get_bind()
+    sequence = f"{TABLE_NAME}_id_seq" if op.get_context().as_sql else bind.execute(
+        sa.text("SELECT pg_get_serial_sequence(:table, 'id')"), {"table": TABLE_NAME}
+    ).scalar()
+    index_names = [f"ix_{TABLE_NAME}_id", f"ix_{TABLE_NAME}_user_id_created_at"] if op.get_context().as_sql else [
+        index["name"] for index in sa.inspect(bind).get_indexes(TABLE_NAME)
+    ]
+
+    # 기존 테이블 → legacy 파티션 (기본 키는 파티션 테이블에서 (id, created_at)으로 다시 생성)
+    op.execute(f"ALTER TABLE {TABLE_NAME} RENAME TO {LEGACY_TABLE}")
+    op.execute(f"ALTER TABLE {LEGACY_TABLE} DROP CONSTRAINT {TABLE_NAME}_pkey")
+    for name in index_names:
+        op.execute(f"ALTER INDEX {name} RENAME TO {name}_legacy")
+    op.execute(f"UPDATE {LEGACY_TABLE} SET created_at = now() WHERE created_at IS NULL")
+    op.execute(f"ALTER TABLE {LEGACY_TABLE} ALTER COLUMN created_at SET NOT NULL")
+
+    op.execute(
+        f"CREATE TABLE {TABLE_NAME} (LIKE {LEGACY_TABLE} INCLUDING DEFAULTS INCLUDING COMMENTS) "
+        "PARTITION BY RANGE (created_at)"
+    )
+    op.execute(f"ALTER TABLE {TABLE_NAME} ADD PRIMARY KEY (id, created_at)")
+    if sequence:
+        # legacy 파티션을 보존 정책으로 삭제해도 ID 시퀀스는 남도록 소유 테이블 변경
+        op.execute(f"ALTER SEQUENCE {sequence} OWNED BY {TABLE_NAME}.id")
+    op.execute(f"ALTER TABLE {TABLE_NAME} ATTACH PARTITION {LEGACY_TABLE} FOR VALUES FROM (MINVALUE) TO ({_literal(legacy_end)})")
+    # 같은 정의의 legacy 인덱스는 파티션 인덱스로 연결됨
+    op.execute(f"CREATE INDEX ix_{TABLE_NAME}_id ON {TABLE_NAME} (id)")
+    op.execute(f"CREATE INDEX ix_{TABLE_NAME}_user_id_created_at ON {TABLE_NAME} (user_id, created_at)")
+
+    month = legacy_end
+    while month <= add_months(current, settings.POSTURE_PARTITION_PREMAKE_MONTHS):
+        op.execute(
+            f"CREATE TABLE {TABLE_NAME}_p{month:%Y%m} PARTITION OF {TABLE_NAME} "
+            f"FOR VALUES FROM ({_literal(month)}) TO ({_literal(add_months(month, 1))})"
+        )
+        month = add_months(month, 1)
+    op.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {TABLE_NAME} DEFAULT")
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect not in ("mysql", "postgresql") or _is_partitioned(dialect):
+        return
+
+    if dialect == "mysql":
+        _upgrade_mysql()
+    else:
+        _upgrade_postgresql()
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect != "mysql":
+        raise NotImplementedError("파티션 해제는 MySQL만 지원합니다")
+    if not op.get_context().as_sql and not _is_partitioned(dialect):
+        return
+    op.execute(f"ALTER TABLE {TABLE_NAME} REMOVE PARTITIONING")
+    op.execute(f"ALTER TABLE {TABLE_NAME} DROP PRIMARY KEY, ADD PRIMARY KEY (id)")
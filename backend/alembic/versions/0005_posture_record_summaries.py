@@ -0,0 +1,48 @@
+"""posture_record_summaries 자세 기록 요약 테이블 추가
+
+Revision ID: 0005_posture_record_summaries
+Revises: 0004_posture_records_partitions
+Create Date: 2026-10-17 00:00:00
+
+오래된 원본 기록은 압축 스크립트로 요약 행으로 바꿉니다. (app/crud/posture_summary.py)
+    python compact_records.py --older-than-days 30
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0005_posture_record_summaries'
+down_revision: Union[str, None] = '0004_posture_records_partitions'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if not op.get_context().as_sql and sa.inspect(op.get_bind()).has_table("posture_record_summaries"):
+        return
+
+    op.create_table(
+        "posture_record_summaries",
+        sa.Column("id", sa.Integer(), primary_key=True, comment="요약 고유 ID"),
+        sa.Column("user_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=False, comment="사용자 ID"),
+        sa.Column("resolution", sa.String(10), nullable=False, comment="요약 단위 (session, minute)"),
+        sa.Column("session_id", sa.String(50), nullable=True, comment="세션 ID"),
+        sa.Column("period_start", sa.DateTime(timezone=True), nullable=False, comment="구간 첫 측정 시간"),
+        sa.Column("period_end", sa.DateTime(timezone=True), nullable=False, comment="구간 마지막 측정 시간"),
+        sa.Column("record_count", sa.Integer(), nullable=False, comment="원본 기록 수"),
+        sa.Column("neck_angle_normal_count", sa.Integer(), nullable=False, comment="목 각도 정상 기록 수"),
+        sa.Column("forward_head_normal_count", sa.Integer(), nullable=False, comment="전방 머리 정상 기록 수"),
+        sa.Column("head_tilt_normal_count", sa.Integer(), nullable=False, comment="머리 기울기 정상 기록 수"),
+        sa.Column("metrics", sa.JSON(), nullable=False, comment="지표별 건수/최소/최대/평균/표준편차"),
+    )
+    op.create_index("ix_posture_record_summaries_id", "posture_record_summaries", ["id"])
+    op.create_index(
+        "ix_posture_record_summaries_user_id_period_start", "posture_record_summaries", ["user_id", "period_start"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("posture_record_summaries")
@@ -0,0 +1,112 @@
+"""posture_sessions 세션 ID/누적 집계 컬럼과 세션 ID 인덱스 추가
+
+Revision ID: 0006_posture_sessions_aggregates
+Revises: 0005_posture_record_summaries
+Create Date: 2026-10-17 00:00:00
+
+/analysis/start, /analysis/stop에서 세션 행을 저장하고 기록 저장 시 누적 집계를 갱신합니다.
+(app/crud/posture_session.py)
+- posture_sessions: session_id(유니크), device_info, 누적 집계 컬럼, created_at 추가
+  (기존 행의 session_id는 id 문자열로 채움)
+- posture_records.session_id 인덱스 추가 (SQLite 기간별 테이블 포함)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0006_posture_sessions_aggregates'
+down_revision: Union[str, None] = '0005_posture_record_summaries'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SESSIONS_TABLE = "posture_sessions"
+RECORDS_TABLE = "posture_records"
+RECORDS_INDEX = "ix_posture_records_session_id"
+
+
+def _session_columns():
+    return [
+        sa.Column("session_id", sa.String(50), nullable=True, comment="세션 ID (posture_records.session_id)"),
+        sa.Column("device_info", sa.String(200), nullable=True, comment="기기 정보"),
+        sa.Column("total_records", sa.Integer(), nullable=False, server_default="0", comment="기록 수"),
+        sa.Column("score_sum", sa.Float(), nullable=False, server_default="0", comment="종합 점수 합계"),
+        sa.Column("all_normal_count", sa.Integer(), nullable=False, server_default="0", comment="세 기준 모두 정상인 기록 수"),
+        sa.Column("average_score", sa.Float(), nullable=True, comment="평균 종합 점수"),
+        sa.Column("last_record_at", sa.DateTime(timezone=True), nullable=True, comment="마지막 측정 시간"),
+        sa.Column("duration_seconds", sa.Integer(), nullable=True, comment="세션 길이 (초, 종료 시 계산)"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), comment="생성 시간"),
+    ]
+
+
+def _existing_columns() -> set:
+    # 오프라인(--sql) 모드에서는 DB를 조회할 수 없으므로 추가 전으로 간주
+    if op.get_context().as_sql:
+        return set()
+    return {column["name"] for column in sa.inspect(op.get_bind()).get_columns(SESSIONS_TABLE)}
+
+
+def _index_names(table: str) -> set:
+    if op.get_context().as_sql:
+        return set()
+    return {index["name"] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def _upgrade_sessions() -> None:
+    existing = _existing_columns()
+    # SQLite는 기본값이 식(now())인 컬럼을 ALTER TABLE ADD COLUMN으로 추가할 수 없으므로 batch (테이블 재생성)
+    recreate = "always" if op.get_bind().dialect.name == "sqlite" else "auto"
+    with op.batch_alter_table(SESSIONS_TABLE, recreate=recreate) as batch_op:
+        for column in _session_columns():
+            if column.name not in existing:
+                batch_op.add_column(column)
+
+    sessions = sa.table(SESSIONS_TABLE, sa.column("id", sa.Integer()), sa.column("session_id", sa.String(50)))
+    op.execute(
+        sessions.update().where(sessions.c.session_id.is_(None)).values(session_id=sa.cast(sessions.c.id, sa.String(50)))
+    )
+    with op.batch_alter_table(SESSIONS_TABLE) as batch_op:
+        batch_op.alter_column(
+            "session_id", existing_type=sa.String(50), nullable=False,
+            existing_comment="세션 ID (posture_records.session_id)"
+        )
+
+    indexes = _index_names(SESSIONS_TABLE)
+    if "uq_posture_sessions_session_id" not in indexes:
+        op.create_index("uq_posture_sessions_session_id", SESSIONS_TABLE, ["session_id"], unique=True)
+    if "ix_posture_sessions_user_id_start_time" not in indexes:
+        op.create_index("ix_posture_sessions_user_id_start_time", SESSIONS_TABLE, ["user_id", "start_time"])
+
+
+def _upgrade_records_index() -> None:
+    dialect = op.get_bind().dialect.name
+    if RECORDS_INDEX not in _index_names(RECORDS_TABLE):
+        if dialect == "mysql":
+            op.execute(f"ALTER TABLE {RECORDS_TABLE} ADD INDEX {RECORDS_INDEX} (session_id), ALGORITHM=INPLACE, LOCK=NONE")
+        else:
+            # PostgreSQL 파티션 테이블은 CONCURRENTLY를 지원하지 않음 (부모 인덱스가 각 파티션에 생성됨)
+            op.create_index(RECORDS_INDEX, RECORDS_TABLE, ["session_id"])
+
+    if dialect == "sqlite" and not op.get_context().as_sql:
+        # 기간별 테이블 (crud/posture_partition.py)
+        period_tables = op.get_bind().execute(sa.text(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name GLOB :pattern"
+        ), {"pattern": f"{RECORDS_TABLE}_p[0-9][0-9][0-9][0-9][0-9][0-9]"}).scalars().all()
+        for name in period_tables:
+            op.execute(f'CREATE INDEX IF NOT EXISTS "ix_{name}_session_id" ON "{name}" (session_id)')
+
+
+def upgrade() -> None:
+    _upgrade_sessions()
+    _upgrade_records_index()
+
+
+def downgrade() -> None:
+    op.drop_index(RECORDS_INDEX, table_name=RECORDS_TABLE)
+    op.drop_index("ix_posture_sessions_user_id_start_time", table_name=SESSIONS_TABLE)
+    op.drop_index("uq_posture_sessions_session_id", table_name=SESSIONS_TABLE)
+    with op.batch_alter_table(SESSIONS_TABLE) as batch_op:
+        for column in reversed(_session_columns()):
+            batch_op.drop_column(column.name)
@@ -1,120 +1,241 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import ValidationError
+from typing import Iterator, List, Optional, Tuple
 from datetime import datetime, timedelta
+import asyncio
 import json
+import logging
 import uuid
 import time
 
-from ....db.session import get_db
+from ....db.session import get_db, get_async_db, SessionLocal
 from ....schemas.posture import (
     PostureRecordCreate, PostureRecord, PostureStats, PostureTrend, MedicalStandards,
-    PostureDataSave, PostureAnalysisConfig, PostureAnalysisSession
+    PostureDataSave, PostureAnalysisConfig, PostureAnalysisSession,
+    PostureBatchSave, PostureBatchItemResult, PostureBatchSaveResult, PostureRecordPage,
+    PostureAnalyzeBatch, PostureAnalyzeBatchResult, PostureAnalysis, PostureRecordSummary,
+    PostureSession
 )
-from ....crud.posture import posture_record
+from ....crud.posture import posture_record, posture_analysis, async_posture_record, decode_cursor
+from ....crud.posture_buffer import posture_write_buffer, WriteBufferFullError
+from ....crud.posture_analysis_worker import posture_analysis_worker
+from ....crud.posture_export import posture_exporter, EXPORT_FORMATS
+from ....crud.posture_session import posture_session
 from ....core.config import settings
+from ....core.cache import query_cache, user_namespace
+from ....core.session_store import session_store
+from ....core.posture_analysis import posture_analysis_engine
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
 
-# 활성 세션 저장소 (실제 프로덕션에서는 Redis나 DB 사용 권장)
-active_sessions = {}
+def _parse_date_range(start_date: Optional[str], end_date: Optional[str]) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """YYYY-MM-DD 기간 파싱 (종료 날짜는 해당 일 전체 포함)"""
+    start_dt = datetime.strptime(start_date, "%Y-%m-%d") if start_date else None
+    end_dt = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1) if end_date else None
+    return start_dt, end_dt
+
+def _iter_records_ndjson(user_id: int, start_dt: Optional[datetime], end_dt: Optional[datetime]) -> Iterator[str]:
+    """자세 기록 NDJSON 생성 (StreamingResponse가 스레드풀에서 순회, 전용 세션 사용)"""
+    chunk_size = settings.POSTURE_RECORDS_STREAM_CHUNK_SIZE
+    db = SessionLocal()
+    try:
+        lines = []
+        for row in posture_record.iter_by_user(db, user_id, start_dt, end_dt, chunk_size):
+            lines.append(PostureRecord.model_validate(row).model_dump_json())
+            if len(lines) >= chunk_size:
+                yield "\n".join(lines) + "\n"
+                lines = []
+        if lines:
+            yield "\n".join(lines) + "\n"
+    finally:
+        db.close()
+
+def _issues_to_text(issues: Optional[List[dict]]) -> str:
+    """issues를 읽기 쉬운 문자열로 변환"""
+    if not issues:
+        return ""
+    
+    issue_messages = []
+    for issue in issues:
+        if isinstance(issue, dict):
+            # dict에서 문제점 메시지 추출
+            if 'problem' in issue:
+                issue_messages.append(issue['problem'])
+            elif 'message' in issue:
+                issue_messages.append(issue['message'])
+            elif 'type' in issue:
+                issue_messages.append(issue['type'])
+            else:
+                issue_messages.append(str(issue))
+        else:
+            issue_messages.append(str(issue))
+    
+    # 여러 문제점을 쉼표로 구분하여 하나의 문자열로 만들기
+    return ", ".join(issue_messages)
+
+def _to_record_create(posture_data: PostureDataSave, issues_text: str) -> PostureRecordCreate:
+    """PostureDataSave를 PostureRecordCreate 형태로 변환 (camelCase에서 snake_case로 변환)"""
+    return PostureRecordCreate(
+        neck_angle=posture_data.neckAngle,
+        shoulder_slope=posture_data.shoulderSlope,
+        head_forward=posture_data.headForward,
+        shoulder_height_diff=posture_data.shoulderHeightDiff,
+        score=posture_data.score,
+        cervical_lordosis=posture_data.cervicalLordosis,
+        forward_head_distance=posture_data.forwardHeadDistance,
+        head_tilt=posture_data.headTilt,
+        left_shoulder_height_diff=0.0,  # 기본값 설정
+        left_scapular_winging=0.0,      # 기본값 설정
+        right_scapular_winging=0.0,     # 기본값 설정
+        shoulder_forward_movement=posture_data.shoulderForwardMovement,
+        head_rotation=posture_data.headRotation,
+        issues=issues_text,
+        session_id=posture_data.sessionId or str(int(time.time())),
+        device_info=posture_data.deviceInfo
+    )
+
+def _format_validation_error(e: ValidationError) -> str:
+    """검증 오류를 '필드: 메시지' 형태의 한 줄 문자열로 변환"""
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in e.errors()
+    )
 
 @router.post("/save", response_model=PostureRecord)
-def save_posture_data(
+async def save_posture_data(
     posture_data: PostureDataSave,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """웹캠을 통한 자세 측정 데이터 저장"""
     try:
-        print(f"받은 데이터: {posture_data}")
-        
-        # issues를 읽기 쉬운 문자열로 변환
-        issues_text = ""
-        if posture_data.issues:
-            issue_messages = []
-            for issue in posture_data.issues:
-                if isinstance(issue, dict):
-                    # dict에서 문제점 메시지 추출
-                    if 'problem' in issue:
-                        issue_messages.append(issue['problem'])
-                    elif 'message' in issue:
-                        issue_messages.append(issue['message'])
-                    elif 'type' in issue:
-                        issue_messages.append(issue['type'])
-                    else:
-                        issue_messages.append(str(issue))
-                else:
-                    issue_messages.append(str(issue))
-            
-            # 여러 문제점을 쉼표로 구분하여 하나의 문자열로 만들기
-            issues_text = ", ".join(issue_messages)
-        
-        print(f"변환된 issues: {issues_text}")
+        issues_text = _issues_to_text(posture_data.issues)
+        record_data = _to_record_create(posture_data, issues_text)
         
-        # PostureRecordCreate 형태로 변환 (camelCase에서 snake_case로 변환)
-        record_data = PostureRecordCreate(
-            neck_angle=posture_data.neckAngle,
-            shoulder_slope=posture_data.shoulderSlope,
-            head_forward=posture_data.headForward,
-            shoulder_height_diff=posture_data.shoulderHeightDiff,
-            score=posture_data.score,
-            cervical_lordosis=posture_data.cervicalLordosis,
-            forward_head_distance=posture_data.forwardHeadDistance,
-            head_tilt=posture_data.headTilt,
-            left_shoulder_height_diff=0.0,  # 기본값 설정
-            left_scapular_winging=0.0,      # 기본값 설정
-            right_scapular_winging=0.0,     # 기본값 설정
-            shoulder_forward_movement=posture_data.shoulderForwardMovement,
-            head_rotation=posture_data.headRotation,
-            issues=issues_text,
-            session_id=posture_data.sessionId or str(int(time.time())),
-            device_info=posture_data.deviceInfo
+        # 기록마다 호출되므로 샘플링
+        logger.debug(
+            "자세 데이터 저장: %s", record_data,
+            extra={"sample": "posture.save", "user_id": posture_data.userId}
         )
         
-        print(f"생성된 record_data: {record_data}")
-        
-        result = posture_record.create(db, posture_data.userId, record_data)
+        result = await async_posture_record.create(db, posture_data.userId, record_data)
         
         # issues 필드를 JSON 문자열로 유지 (데이터베이스에서 가져온 그대로)
         # result.issues는 이미 JSON 문자열이므로 그대로 사용
         
         return result
+    except WriteBufferFullError:
+        raise HTTPException(status_code=503, detail="요청이 많아 자세 데이터를 저장할 수 없습니다. 잠시 후 다시 시도해주세요")
     except Exception as e:
-        import traceback
-        error_traceback = traceback.format_exc()
-        print(f"오류 발생: {str(e)}")
-        print(f"오류 상세: {error_traceback}")
+        logger.exception("자세 데이터 저장 실패", extra={"user_id": posture_data.userId})
         raise HTTPException(status_code=500, detail=f"자세 데이터 저장 실패: {str(e)}")
 
+@router.post("/save/batch", response_model=PostureBatchSaveResult)
+def save_posture_data_batch(
+    batch: PostureBatchSave,
+    db: Session = Depends(get_db)
+):
+    """웹캠을 통한 자세 측정 데이터 일괄 저장 (단일 트랜잭션, 다중 행 INSERT)"""
+    if len(batch.items) > settings.POSTURE_BATCH_MAX_SIZE:
+        raise HTTPException(
+            status_code=400,
+            detail=f"배치 크기가 최대값({settings.POSTURE_BATCH_MAX_SIZE})을 초과했습니다"
+        )
+    
+    # 항목별 검증: 잘못된 항목은 제외하고 나머지만 저장
+    results = []
+    valid_items = []
+    for index, item in enumerate(batch.items):
+        try:
+            posture_data = PostureDataSave(**item)
+            record_data = _to_record_create(posture_data, _issues_to_text(posture_data.issues))
+        except ValidationError as e:
+            results.append(PostureBatchItemResult(index=index, status="invalid", error=_format_validation_error(e)))
+            continue
+        valid_items.append((index, posture_data.userId, record_data))
+    
+    try:
+        posture_record.create_multi(db, [(user_id, record_data) for _, user_id, record_data in valid_items])
+        status = "saved"
+        error = None
+    except Exception as e:
+        status = "failed"
+        error = f"자세 데이터 저장 실패: {str(e)}"
+    
+    results.extend(
+        PostureBatchItemResult(index=index, status=status, error=error)
+        for index, _, _ in valid_items
+    )
+    results.sort(key=lambda result: result.index)
+    
+    saved = len(valid_items) if status == "saved" else 0
+    return PostureBatchSaveResult(
+        total=len(batch.items),
+        saved=saved,
+        failed=len(batch.items) - saved,
+        results=results
+    )
+
+@router.get("/write-buffer")
+def get_write_buffer_stats():
+    """쓰기 지연 버퍼 상태 조회 (큐 깊이, 저장 지연 시간 등)"""
+    return {
+        "enabled": settings.POSTURE_WRITE_BEHIND_ENABLED,
+        **posture_write_buffer.get_stats()
+    }
+
+@router.get("/analysis-worker")
+def get_analysis_worker_stats():
+    """자세 분석 워커 상태 조회 (분석/실패 건수, 재시도, 배치 처리 시간 등)"""
+    return {
+        "enabled": settings.POSTURE_ANALYSIS_WORKER_ENABLED,
+        **posture_analysis_worker.get_stats()
+    }
+
+@router.get("/cache")
+def get_query_cache_stats():
+    """통계/트렌드 조회 캐시 상태 조회 (적중/미적중/제거 카운터)"""
+    return query_cache.get_stats()
+
 @router.post("/analysis/start", response_model=PostureAnalysisSession)
 def start_posture_analysis(
     config: PostureAnalysisConfig,
     db: Session = Depends(get_db)
 ):
-    """실시간 자세 분석 세션 시작"""
+    """
+    실시간 자세 분석 세션 시작 (posture_sessions 행 생성)
+    
+    활성 세션 ID로 다시 요청하면 기존 세션을 반환하고, 종료된 세션 ID면 409
+    """
     try:
-        session_id = config.session_id or str(int(time.time()))
+        session_id = config.session_id or uuid.uuid4().hex
         
-        # 세션 정보 생성
-        session_info = PostureAnalysisSession(
+        try:
+            db_session = posture_session.start(db, session_id, config.user_id, datetime.now(), config.device_info)
+        except ValueError as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        
+        # 세션 저장소(WebSocket 연결 시 조회 캐시)에 저장
+        session_store.create({
+            "session_id": session_id,
+            "user_id": db_session.user_id,
+            "start_time": db_session.start_time,
+            "device_info": db_session.device_info,
+            "analysis_interval": config.analysis_interval
+        })
+        
+        return PostureAnalysisSession(
             session_id=session_id,
-            user_id=config.user_id,
-            start_time=datetime.now(),
+            user_id=db_session.user_id,
+            start_time=db_session.start_time,
             status="active",
-            device_info=config.device_info
+            device_info=db_session.device_info
         )
-        
-        # 활성 세션에 저장
-        active_sessions[session_id] = {
-            "user_id": config.user_id,
-            "start_time": session_info.start_time,
-            "status": "active",
-            "device_info": config.device_info,
-            "analysis_interval": config.analysis_interval,
-            "record_count": 0
-        }
-        
-        return session_info
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"자세 분석 세션 시작 실패: {str(e)}")
 
@@ -123,43 +244,52 @@ def stop_posture_analysis(
     session_id: str,
     db: Session = Depends(get_db)
 ):
-    """실시간 자세 분석 세션 중지"""
+    """
+    실시간 자세 분석 세션 중지 (posture_sessions 행 종료)
+    
+    기록 수/평균 점수는 저장 시 갱신된 누적 집계를 사용
+    (쓰기 지연 버퍼 큐의 기록은 먼저 저장, 이미 배치로 모으는 중인 기록은 저장 주기 안에 세션 집계에 반영)
+    """
     try:
-        if session_id not in active_sessions:
+        if posture_write_buffer.is_running:
+            posture_write_buffer.flush()
+        db_session = posture_session.stop(db, session_id, datetime.now())
+        if db_session is None:
             raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
         
-        # 세션 상태 업데이트
-        active_sessions[session_id]["status"] = "stopped"
-        active_sessions[session_id]["end_time"] = datetime.now()
-        
-        # 세션 통계 계산
-        session_data = active_sessions[session_id]
-        duration = (session_data["end_time"] - session_data["start_time"]).total_seconds()
+        # 세션 저장소(캐시)에도 반영하여 새 WebSocket 연결을 거부
+        session_store.stop(session_id)
         
         return {
             "session_id": session_id,
             "status": "stopped",
-            "duration_seconds": int(duration),
-            "total_records": session_data["record_count"],
+            "duration_seconds": db_session.duration_seconds,
+            "total_records": db_session.total_records,
+            "average_score": round(db_session.average_score, 2) if db_session.average_score is not None else None,
             "message": "자세 분석 세션이 성공적으로 중지되었습니다"
         }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"자세 분석 세션 중지 실패: {str(e)}")
 
 @router.get("/analysis/sessions")
-def get_active_sessions():
-    """활성 분석 세션 목록 조회"""
+def get_active_sessions(
+    limit: int = Query(100, ge=1, le=1000, description="조회할 세션 수"),
+    db: Session = Depends(get_db)
+):
+    """활성 분석 세션 목록 조회 (posture_sessions의 활성 세션, 최근 시작 순)"""
     try:
-        active_list = []
-        for session_id, session_data in active_sessions.items():
-            if session_data["status"] == "active":
-                active_list.append({
-                    "session_id": session_id,
-                    "user_id": session_data["user_id"],
-                    "start_time": session_data["start_time"],
-                    "device_info": session_data["device_info"],
-                    "record_count": session_data["record_count"]
-                })
+        active_list = [
+            {
+                "session_id": db_session.session_id,
+                "user_id": db_session.user_id,
+                "start_time": db_session.start_time,
+                "device_info": db_session.device_info,
+                "record_count": db_session.total_records
+            }
+            for db_session in posture_session.get_active(db, limit)
+        ]
         
         return {
             "active_sessions": active_list,
@@ -168,6 +298,188 @@ def get_active_sessions():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"활성 세션 조회 실패: {str(e)}")
 
+@router.get("/sessions", response_model=List[PostureSession])
+def get_posture_sessions(
+    user_id: int = Query(..., description="사용자 ID"),
+    limit: int = Query(50, ge=1, le=500, description="조회할 세션 수"),
+    db: Session = Depends(get_db)
+):
+    """사용자의 측정 세션 목록 조회 (최근 시작 순, 저장된 누적 집계 사용)"""
+    try:
+        return posture_session.get_by_user(db, user_id, limit)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"세션 목록 조회 실패: {str(e)}")
+
+@router.get("/sessions/{session_id}", response_model=PostureSession)
+def get_posture_session(
+    session_id: str,
+    db: Session = Depends(get_db)
+):
+    """측정 세션 조회 (기록 수, 평균 점수, 세션 길이)"""
+    try:
+        db_session = posture_session.get(db, session_id)
+        if db_session is None:
+            raise HTTPException(status_code=404, detail="세션을 찾을 수 없습니다")
+        return db_session
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"세션 조회 실패: {str(e)}")
+
+def _load_active_session(session_id: str) -> Optional[dict]:
+    """posture_sessions의 활성 세션을 세션 저장소에 다시 채우고 반환 (없거나 종료된 세션이면 None)"""
+    db = SessionLocal()
+    try:
+        db_session = posture_session.get(db, session_id)
+        if db_session is None or not db_session.is_active:
+            return None
+        session_data = {
+            "session_id": session_id,
+            "user_id": db_session.user_id,
+            "start_time": db_session.start_time,
+            "device_info": db_session.device_info,
+            "analysis_interval": None
+        }
+        session_store.create(session_data)
+        return {**session_data, "status": "active"}
+    finally:
+        db.close()
+
+@router.websocket("/analysis/{session_id}/stream")
+async def stream_posture_data(websocket: WebSocket, session_id: str):
+    """
+    실시간 자세 데이터 스트리밍 (WebSocket)
+    
+    /analysis/start로 시작한 세션에 연결하여 하나의 연결로 측정 프레임을 전송
+    - 클라이언트 → 서버: PostureDataSave 형식의 프레임 1개 또는 프레임 목록 (JSON)
+      (userId는 세션 사용자로 고정, sessionId를 생략하면 현재 세션 ID 사용)
+    - 서버 → 클라이언트: 프레임별 분석 결과와 세션 누적 요약 ("analysis"),
+      저장 완료 알림 ("saved"), 오류 ("error")
+    - 저장: STREAM_BATCH_SIZE개가 모이거나 STREAM_FLUSH_INTERVAL초가 지나면 일괄 저장
+    - 바이너리 프레임을 받으면 모아 둔 프레임을 저장하고 1003으로 연결 종료
+    세션은 세션 저장소(캐시)에서 먼저 찾고, 없으면(만료/다른 워커의 프로세스 내 저장소) posture_sessions에서 조회
+    """
+    session_data = await run_in_threadpool(session_store.get, session_id)
+    if session_data is None:
+        session_data = await run_in_threadpool(_load_active_session, session_id)
+    if session_data is None or session_data["status"] != "active":
+        await websocket.close(code=4404, reason="세션을 찾을 수 없습니다")
+        return
+    
+    await websocket.accept()
+    
+    pending: List[PostureRecordCreate] = []
+    last_flush = time.monotonic()
+    frame_count = 0
+    valid_count = 0
+    score_sum = 0.0
+    normal_count = 0
+    
+    async def flush():
+        nonlocal pending, last_flush
+        last_flush = time.monotonic()
+        if not pending:
+            return
+        batch, pending = pending, []
+        db = SessionLocal()
+        try:
+            saved = await run_in_threadpool(
+                posture_record.create_multi, db, [(session_data["user_id"], record) for record in batch]
+            )
+        except Exception as e:
+            await websocket.send_json({"type": "error", "error": f"자세 데이터 저장 실패: {str(e)}", "dropped": len(batch)})
+            return
+        finally:
+            db.close()
+        await websocket.send_json({"type": "saved", "saved": saved})
+    
+    try:
+        while True:
+            # 저장 주기가 지나면 새 프레임이 없어도 저장
+            timeout = max(0.0, settings.STREAM_FLUSH_INTERVAL - (time.monotonic() - last_flush))
+            try:
+                message = await asyncio.wait_for(websocket.receive(), timeout=timeout)
+            except asyncio.TimeoutError:
+                await flush()
+                continue
+            if message["type"] == "websocket.disconnect":
+                break
+            if message.get("text") is None:
+                # 바이너리 프레임은 지원하지 않음: 모아 둔 프레임을 저장한 뒤 1003(Unsupported Data)으로 종료
+                await flush()
+                await websocket.close(code=1003, reason="텍스트(JSON) 프레임만 지원합니다")
+                break
+            
+            try:
+                payload = json.loads(message["text"])
+            except ValueError:
+                await websocket.send_json({"type": "error", "error": "JSON 형식이 아닙니다"})
+                continue
+            
+            frames = payload if isinstance(payload, list) else [payload]
+            results = []
+            for frame in frames:
+                index = frame_count
+                frame_count += 1
+                if not isinstance(frame, dict):
+                    results.append({"index": index, "status": "invalid", "error": "프레임은 JSON 객체여야 합니다"})
+                    continue
+                frame["userId"] = session_data["user_id"]
+                frame.setdefault("sessionId", session_id)
+                try:
+                    posture_data = PostureDataSave(**frame)
+                except ValidationError as e:
+                    results.append({"index": index, "status": "invalid", "error": _format_validation_error(e)})
+                    continue
+                
+                record_data = _to_record_create(posture_data, _issues_to_text(posture_data.issues))
+                pending.append(record_data)
+                
+                analysis = posture_analysis_engine.analyze_record(record_data)
+                # 프레임마다 호출되므로 샘플링
+                logger.debug(
+                    "스트리밍 프레임 분석: score=%s", record_data.score,
+                    extra={"sample": "posture.stream_frame", "session_id": session_id, "frame_index": index}
+                )
+                valid_count += 1
+                score_sum += record_data.score
+                if analysis["analysis"]["severity_level"] == "low":
+                    normal_count += 1
+                results.append({
+                    "index": index,
+                    "status": "ok",
+                    "analysis": analysis["analysis"],
+                    "deviations": analysis["deviations"]
+                })
+            
+            await websocket.send_json({
+                "type": "analysis",
+                "results": results,
+                "summary": {
+                    "frames": frame_count,
+                    "valid_frames": valid_count,
+                    "average_score": round(score_sum / valid_count, 2) if valid_count else 0,
+                    "normal_posture_rate": round(normal_count / valid_count * 100, 2) if valid_count else 0
+                }
+            })
+            
+            if len(pending) >= settings.STREAM_BATCH_SIZE:
+                await flush()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        # 연결 종료 시 남은 프레임 저장 (클라이언트에 알릴 수 없으므로 저장만 수행)
+        if pending:
+            db = SessionLocal()
+            try:
+                await run_in_threadpool(
+                    posture_record.create_multi, db, [(session_data["user_id"], record) for record in pending]
+                )
+            except Exception as e:
+                logger.error("스트리밍 잔여 프레임 저장 실패: %s", e, extra={"session_id": session_id})
+            finally:
+                db.close()
+
 @router.post("/record", response_model=PostureRecord)
 def create_posture_record(
     record: PostureRecordCreate,
@@ -176,59 +488,192 @@ def create_posture_record(
 ):
     """자세 기록 생성"""
     try:
-        result = posture_record.create(db, user_id, record)
-        return result
+        return posture_record.create(db, user_id, record)
+    except WriteBufferFullError:
+        raise HTTPException(status_code=503, detail="요청이 많아 자세 기록을 저장할 수 없습니다. 잠시 후 다시 시도해주세요")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"자세 기록 생성 실패: {str(e)}")
 
 @router.get("/records", response_model=List[PostureRecord])
-def get_posture_records(
+async def get_posture_records(
     user_id: int = Query(..., description="사용자 ID"),
     start_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
     limit: int = Query(100, description="조회할 기록 수"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """사용자의 자세 기록 조회"""
     try:
-        # 날짜 파싱
-        start_dt = None
-        end_dt = None
-        
-        if start_date:
-            start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-        if end_date:
-            end_dt = datetime.strptime(end_date, "%Y-%m-%d") + timedelta(days=1)
-        
-        records = posture_record.get_by_user(db, user_id, start_dt, end_dt, limit)
+        start_dt, end_dt = _parse_date_range(start_date, end_date)
+        records = await async_posture_record.get_by_user(db, user_id, start_dt, end_dt, limit)
         return records
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"날짜 형식 오류: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"자세 기록 조회 실패: {str(e)}")
 
+@router.get("/records/page", response_model=PostureRecordPage)
+async def get_posture_records_page(
+    user_id: int = Query(..., description="사용자 ID"),
+    start_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
+    limit: int = Query(100, ge=1, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """사용자의 자세 기록 커서 페이지 조회 (최신순, next_cursor가 없으면 마지막 페이지)"""
+    try:
+        if limit > settings.POSTURE_RECORDS_PAGE_MAX_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=f"한 페이지는 최대 {settings.POSTURE_RECORDS_PAGE_MAX_SIZE}건까지 조회할 수 있습니다"
+            )
+        try:
+            start_dt, end_dt = _parse_date_range(start_date, end_date)
+            if cursor:
+                decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"요청 형식 오류: {str(e)}")
+        
+        records, next_cursor = await async_posture_record.get_page(db, user_id, start_dt, end_dt, limit, cursor)
+        return PostureRecordPage(items=records, next_cursor=next_cursor)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"자세 기록 조회 실패: {str(e)}")
+
+@router.get("/records/summary", response_model=List[PostureRecordSummary])
+async def get_posture_record_summaries(
+    user_id: int = Query(..., description="사용자 ID"),
+    start_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
+    limit: int = Query(100, ge=1, description="조회할 요약 행 수"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    사용자의 자세 기록을 세션/분 단위 요약 해상도로 조회 (최신순)
+    
+    압축된 기간은 저장된 요약 행, 아직 원본이 남은 최근 기간은 원본 기록을 같은 단위로 요약하여 반환
+    """
+    try:
+        start_dt, end_dt = _parse_date_range(start_date, end_date)
+        return await async_posture_record.get_by_user(db, user_id, start_dt, end_dt, limit, resolution="summary")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"날짜 형식 오류: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"자세 기록 요약 조회 실패: {str(e)}")
+
+@router.get("/records/stream")
+def stream_posture_records(
+    user_id: int = Query(..., description="사용자 ID"),
+    start_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)")
+):
+    """
+    사용자의 자세 기록 전체를 NDJSON으로 스트리밍 (최신순, 한 줄에 기록 1건)
+    
+    서버 측 커서에서 나누어 읽어 바로 전송하므로 기간 제한 없이 내려받을 수 있음
+    """
+    try:
+        start_dt, end_dt = _parse_date_range(start_date, end_date)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"날짜 형식 오류: {str(e)}")
+    
+    return StreamingResponse(
+        _iter_records_ndjson(user_id, start_dt, end_dt),
+        media_type="application/x-ndjson"
+    )
+
+@router.get("/records/{record_id}/analysis", response_model=PostureAnalysis)
+def get_posture_record_analysis(
+    record_id: int,
+    db: Session = Depends(get_db)
+):
+    """
+    자세 기록의 분석 결과 조회 (현재 분석 규칙 버전)
+    
+    분석은 저장 후 백그라운드 워커가 수행하므로 아직 분석되지 않았으면 404
+    """
+    try:
+        analysis = posture_analysis.get_by_record(db, record_id)
+        if analysis is None:
+            raise HTTPException(status_code=404, detail="분석 결과가 없습니다. 잠시 후 다시 조회해주세요")
+        return analysis
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"분석 결과 조회 실패: {str(e)}")
+
+@router.get("/export")
+def export_posture_records(
+    user_id: Optional[int] = Query(None, description="사용자 ID (없으면 기간 내 전체 사용자)"),
+    start_date: Optional[str] = Query(None, description="시작 날짜 (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="종료 날짜 (YYYY-MM-DD)"),
+    format: str = Query("csv", description="내보내기 형식 (csv, arrow, parquet)")
+):
+    """
+    자세 기록 대량 내보내기 (분석용, 오래된 순)
+    
+    DB 커서에서 청크 단위로 읽어 바로 CSV / Arrow IPC stream / Parquet으로 전송
+    arrow, parquet 형식은 서버에 pyarrow가 설치되어 있어야 함
+    """
+    try:
+        start_dt, end_dt = _parse_date_range(start_date, end_date)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"날짜 형식 오류: {str(e)}")
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"지원하지 않는 형식입니다: {format} (csv, arrow, parquet)")
+    
+    db = SessionLocal()
+    try:
+        content = posture_exporter.export(
+            db, format, user_id, start_dt, end_dt, settings.POSTURE_EXPORT_CHUNK_SIZE
+        )
+    except RuntimeError as e:
+        db.close()
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    def _stream():
+        try:
+            yield from content
+        finally:
+            db.close()
+    
+    filename = f"posture_records{f'_user{user_id}' if user_id is not None else ''}.{format}"
+    return StreamingResponse(
+        _stream(),
+        media_type=EXPORT_FORMATS[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
 @router.get("/stats", response_model=PostureStats)
-def get_posture_stats(
+async def get_posture_stats(
     user_id: int = Query(..., description="사용자 ID"),
     days: int = Query(30, description="통계 기간 (일)"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """자세 통계 조회"""
     try:
-        stats = posture_record.get_stats(db, user_id, days)
+        stats = await query_cache.get_or_load_async(
+            user_namespace(user_id), ("stats", days),
+            lambda: async_posture_record.get_stats(db, user_id, days)
+        )
         return PostureStats(**stats)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"자세 통계 조회 실패: {str(e)}")
 
 @router.get("/trends", response_model=List[PostureTrend])
-def get_posture_trends(
+async def get_posture_trends(
     user_id: int = Query(..., description="사용자 ID"),
     days: int = Query(7, description="트렌드 기간 (일)"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """자세 변화 트렌드 조회"""
     try:
-        trends = posture_record.get_trends(db, user_id, days)
+        trends = await query_cache.get_or_load_async(
+            user_namespace(user_id), ("trends", days),
+            lambda: async_posture_record.get_trends(db, user_id, days)
+        )
         return [PostureTrend(**trend) for trend in trends]
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"자세 트렌드 조회 실패: {str(e)}")
@@ -239,76 +684,63 @@ def analyze_posture(
 ):
     """자세 분석 (실시간)"""
     try:
-        # 의학적 기준 판단
-        is_neck_angle_normal = (
-            settings.NECK_ANGLE_NORMAL_MIN <= record.neck_angle <= settings.NECK_ANGLE_NORMAL_MAX
-        )
-        is_forward_head_normal = record.forward_head_distance <= settings.FORWARD_HEAD_DISTANCE_MAX
-        is_head_tilt_normal = (
-            settings.HEAD_TILT_NORMAL_MIN <= record.head_tilt <= settings.HEAD_TILT_NORMAL_MAX
-        )
-        
-        # 문제점 분석
-        problems = []
-        suggestions = []
-        
-        if not is_neck_angle_normal:
-            problems.append("목 각도가 정상 범위를 벗어났습니다")
-            suggestions.append("목을 중앙으로 돌려주세요")
-        
-        if not is_forward_head_normal:
-            problems.append("머리가 너무 앞으로 나와있습니다")
-            suggestions.append("턱을 뒤로 당겨주세요")
-        
-        if not is_head_tilt_normal:
-            problems.append("머리가 측면으로 기울어져 있습니다")
-            suggestions.append("머리를 중앙으로 정렬해주세요")
-        
-        # 심각도 판단
-        problem_count = len(problems)
-        if problem_count >= 2:
-            severity_level = "high"
-        elif problem_count == 1:
-            severity_level = "medium"
-        else:
-            severity_level = "low"
-        
-        # 편차 계산
-        neck_angle_deviation = abs(record.neck_angle - (settings.NECK_ANGLE_NORMAL_MIN + settings.NECK_ANGLE_NORMAL_MAX) / 2)
-        forward_head_deviation = max(0, record.forward_head_distance - settings.FORWARD_HEAD_DISTANCE_MAX)
-        head_tilt_deviation = abs(record.head_tilt - (settings.HEAD_TILT_NORMAL_MIN + settings.HEAD_TILT_NORMAL_MAX) / 2)
-        
-        return {
-            "analysis": {
-                "is_neck_angle_normal": is_neck_angle_normal,
-                "is_forward_head_normal": is_forward_head_normal,
-                "is_head_tilt_normal": is_head_tilt_normal,
-                "problems": problems,
-                "suggestions": suggestions,
-                "severity_level": severity_level
-            },
-            "deviations": {
-                "neck_angle_deviation": neck_angle_deviation,
-                "forward_head_deviation": forward_head_deviation,
-                "head_tilt_deviation": head_tilt_deviation
-            },
-            "medical_standards": {
-                "neck_angle_range": (settings.NECK_ANGLE_NORMAL_MIN, settings.NECK_ANGLE_NORMAL_MAX),
-                "forward_head_max": settings.FORWARD_HEAD_DISTANCE_MAX,
-                "head_tilt_range": (settings.HEAD_TILT_NORMAL_MIN, settings.HEAD_TILT_NORMAL_MAX)
-            }
-        }
+        return posture_analysis_engine.analyze_record(record)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"자세 분석 실패: {str(e)}")
 
+@router.post("/analyze/batch", response_model=PostureAnalyzeBatchResult)
+def analyze_posture_batch(
+    batch: PostureAnalyzeBatch
+):
+    """
+    자세 일괄 분석 (/analyze와 같은 규칙, 지표별 배열 입력 → 배열 결과)
+    
+    행 i의 결과는 각 결과 배열의 i번째 값이며, /analyze 응답과 정확히 일치
+    """
+    try:
+        count = max((len(values) for values in batch.columns.values()), default=0)
+        if count > settings.POSTURE_ANALYZE_BATCH_MAX_SIZE:
+            raise HTTPException(
+                status_code=400,
+                detail=f"한 번에 최대 {settings.POSTURE_ANALYZE_BATCH_MAX_SIZE}건까지 분석할 수 있습니다"
+            )
+        try:
+            result = posture_analysis_engine.analyze_arrays(batch.columns)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        problem_mask = result.pop("problem_mask")
+        return PostureAnalyzeBatchResult(
+            count=len(problem_mask),
+            results={name: values.tolist() for name, values in result.items()},
+            problems=posture_analysis_engine.problems_for(problem_mask),
+            suggestions=posture_analysis_engine.suggestions_for(problem_mask),
+            medical_standards=posture_analysis_engine.medical_standards()
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"자세 일괄 분석 실패: {str(e)}")
+
 @router.get("/medical-standards")
 def get_medical_standards():
-    """의학적 기준 조회"""
-    standards = MedicalStandards()
+    """의학적 기준 조회 (분석 규칙 세트 기준)"""
+    legacy = posture_analysis_engine.medical_standards()
+    ruleset = posture_analysis_engine.describe()
+    standards = MedicalStandards(
+        neck_angle_normal_range=legacy["neck_angle_range"],
+        forward_head_normal_max=legacy["forward_head_max"],
+        head_tilt_normal_range=legacy["head_tilt_range"],
+        version=ruleset["version"],
+        metrics=ruleset["metrics"]
+    )
     return {
         "neck_angle_normal_range": standards.neck_angle_normal_range,
         "forward_head_normal_max": standards.forward_head_normal_max,
         "head_tilt_normal_range": standards.head_tilt_normal_range,
+        "version": standards.version,
+        "metrics": standards.metrics,
+        "severity": ruleset["severity"],
         "description": {
             "neck_angle": "목 각도 정상 범위 (도)",
             "forward_head_distance": "전방 머리 거리 최대 정상값 (mm)",
@@ -1,16 +1,24 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import timedelta
 from pydantic import BaseModel
+import logging
 
-from ....db.session import get_db
+from ....db.session import get_db, get_async_db
 from ....schemas.user import UserCreate, User, UserUpdate
-from ....crud.user import user as user_crud
+from ....crud.user import user as user_crud, async_user as async_user_crud
 from ....core.security import create_access_token, get_current_user, get_password_hash, verify_password, create_password_reset_token, verify_password_reset_token
+from ....core.password_hasher import PasswordHasherBusyError
 from ....core.config import settings
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+
+def _password_hasher_busy(e: PasswordHasherBusyError) -> HTTPException:
+    """비밀번호 해싱 대기열 초과 → 429 (클라이언트는 Retry-After 후 재시도)"""
+    return HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "1"})
 
 # 로그인 스키마
 class UserLogin(BaseModel):
@@ -51,25 +59,25 @@ class PasswordCheckResponse(BaseModel):
     message: str
 
 @router.post("/login", response_model=Token)
-def login(
+async def login(
     user_credentials: UserLogin,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """사용자 로그인"""
     try:
-        print(f"🔍 로그인 시도: email={user_credentials.email}")
+        logger.debug("로그인 시도: email=%s", user_credentials.email)
         
         # 사용자 인증 (이메일로 사용자 찾기)
-        user = user_crud.authenticate_by_email(db, email=user_credentials.email, password=user_credentials.password)
+        user = await async_user_crud.authenticate_by_email(db, email=user_credentials.email, password=user_credentials.password)
         if not user:
-            print(f"❌ 로그인 실패: 잘못된 이메일 또는 비밀번호 - {user_credentials.email}")
+            logger.info("로그인 실패: 잘못된 이메일 또는 비밀번호", extra={"email": user_credentials.email})
             raise HTTPException(status_code=401, detail="잘못된 이메일 또는 비밀번호입니다")
         
-        if not user_crud.is_active(user):
-            print(f"❌ 로그인 실패: 비활성화된 사용자 - {user_credentials.email}")
+        if not async_user_crud.is_active(user):
+            logger.info("로그인 실패: 비활성화된 사용자", extra={"email": user_credentials.email})
             raise HTTPException(status_code=400, detail="비활성화된 사용자입니다")
         
-        print(f"✅ 로그인 성공: username={user.username}, user_id={user.id}")
+        logger.info("로그인 성공", extra={"user_id": user.id})
         
         # 액세스 토큰 생성
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -85,8 +93,10 @@ def login(
         }
     except HTTPException:
         raise
+    except PasswordHasherBusyError as e:
+        raise _password_hasher_busy(e)
     except Exception as e:
-        print(f"❌ 로그인 오류: {str(e)}")
+        logger.exception("로그인 오류")
         raise HTTPException(status_code=500, detail=f"로그인 실패: {str(e)}")
 
 @router.post("/check-password", response_model=PasswordCheckResponse)
@@ -96,12 +106,12 @@ def check_password(
 ):
     """이메일과 비밀번호 확인 (개발/테스트용)"""
     try:
-        print(f"🔍 비밀번호 확인 시도: email={password_data.email}")
+        logger.debug("비밀번호 확인 시도: email=%s", password_data.email)
         
         # 이메일로 사용자 찾기
         user = user_crud.get_by_email(db, email=password_data.email)
         if not user:
-            print(f"❌ 사용자를 찾을 수 없음: {password_data.email}")
+            logger.debug("사용자를 찾을 수 없음: %s", password_data.email)
             return PasswordCheckResponse(
                 email=password_data.email,
                 username="",
@@ -109,16 +119,16 @@ def check_password(
                 message="사용자를 찾을 수 없습니다"
             )
         
-        print(f"✅ 사용자 발견: username={user.username}, user_id={user.id}")
+        logger.debug("사용자 발견: username=%s, user_id=%s", user.username, user.id)
         
         # 비밀번호 확인
         is_password_correct = verify_password(password_data.password, user.hashed_password)
         
         if is_password_correct:
-            print(f"✅ 비밀번호 일치: {password_data.email}")
+            logger.debug("비밀번호 일치: %s", password_data.email)
             message = "비밀번호가 일치합니다"
         else:
-            print(f"❌ 비밀번호 불일치: {password_data.email}")
+            logger.debug("비밀번호 불일치: %s", password_data.email)
             message = "비밀번호가 일치하지 않습니다"
         
         return PasswordCheckResponse(
@@ -128,8 +138,10 @@ def check_password(
             message=message
         )
         
+    except PasswordHasherBusyError as e:
+        raise _password_hasher_busy(e)
     except Exception as e:
-        print(f"❌ 비밀번호 확인 오류: {str(e)}")
+        logger.exception("비밀번호 확인 오류")
         raise HTTPException(status_code=500, detail=f"비밀번호 확인 실패: {str(e)}")
 
 @router.post("/forgot-password", response_model=PasswordResetResponse)
@@ -139,12 +151,12 @@ def forgot_password(
 ):
     """비밀번호 찾기 - 재설정 토큰 생성"""
     try:
-        print(f"🔍 비밀번호 찾기 요청: email={password_reset.email}")
+        logger.debug("비밀번호 찾기 요청: email=%s", password_reset.email)
         
         # 이메일로 사용자 찾기
         user = user_crud.get_by_email(db, email=password_reset.email)
         if not user:
-            print(f"❌ 사용자를 찾을 수 없음: {password_reset.email}")
+            logger.debug("사용자를 찾을 수 없음: %s", password_reset.email)
             # 보안상 사용자가 존재하지 않아도 같은 메시지 반환
             return PasswordResetResponse(
                 email=password_reset.email,
@@ -152,12 +164,12 @@ def forgot_password(
                 reset_token=""
             )
         
-        print(f"✅ 사용자 발견: username={user.username}, user_id={user.id}")
+        logger.debug("사용자 발견: username=%s, user_id=%s", user.username, user.id)
         
         # 비밀번호 재설정 토큰 생성 (1시간 유효)
         reset_token = create_password_reset_token(email=password_reset.email)
         
-        print(f"✅ 비밀번호 재설정 토큰 생성: {reset_token[:20]}...")
+        logger.info("비밀번호 재설정 토큰 생성", extra={"user_id": user.id})
         
         # 실제 프로덕션에서는 여기서 이메일 발송 로직 추가
         # send_password_reset_email(user.email, reset_token)
@@ -169,7 +181,7 @@ def forgot_password(
         )
         
     except Exception as e:
-        print(f"❌ 비밀번호 찾기 오류: {str(e)}")
+        logger.exception("비밀번호 찾기 오류")
         raise HTTPException(status_code=500, detail=f"비밀번호 찾기 실패: {str(e)}")
 
 @router.post("/reset-password", response_model=PasswordResetConfirmResponse)
@@ -179,27 +191,27 @@ def reset_password(
 ):
     """비밀번호 재설정"""
     try:
-        print(f"🔍 비밀번호 재설정 시도: email={password_reset.email}")
+        logger.debug("비밀번호 재설정 시도: email=%s", password_reset.email)
         
         # 토큰 검증
         email_from_token = verify_password_reset_token(password_reset.reset_token)
         if not email_from_token or email_from_token != password_reset.email:
-            print(f"❌ 유효하지 않은 토큰: {password_reset.email}")
+            logger.info("비밀번호 재설정 실패: 유효하지 않은 토큰", extra={"email": password_reset.email})
             raise HTTPException(status_code=400, detail="유효하지 않은 재설정 토큰입니다")
         
         # 사용자 찾기
         user = user_crud.get_by_email(db, email=password_reset.email)
         if not user:
-            print(f"❌ 사용자를 찾을 수 없음: {password_reset.email}")
+            logger.debug("사용자를 찾을 수 없음: %s", password_reset.email)
             raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
         
-        print(f"✅ 사용자 발견: username={user.username}, user_id={user.id}")
+        logger.debug("사용자 발견: username=%s, user_id=%s", user.username, user.id)
         
         # 새 비밀번호로 업데이트
         user_update = UserUpdate(password=password_reset.new_password)
         updated_user = user_crud.update(db, db_obj=user, obj_in=user_update)
         
-        print(f"✅ 비밀번호 재설정 완료: {password_reset.email}")
+        logger.info("비밀번호 재설정 완료", extra={"user_id": user.id})
         
         return PasswordResetConfirmResponse(
             email=password_reset.email,
@@ -208,8 +220,10 @@ def reset_password(
         
     except HTTPException:
         raise
+    except PasswordHasherBusyError as e:
+        raise _password_hasher_busy(e)
     except Exception as e:
-        print(f"❌ 비밀번호 재설정 오류: {str(e)}")
+        logger.exception("비밀번호 재설정 오류")
         raise HTTPException(status_code=500, detail=f"비밀번호 재설정 실패: {str(e)}")
 
 @router.post("/register", response_model=User)
@@ -219,28 +233,30 @@ def create_user(
 ):
     """새 사용자 등록"""
     try:
-        print(f"🔍 회원가입 시도: username={user_in.username}, email={user_in.email}")
+        logger.debug("회원가입 시도: username=%s, email=%s", user_in.username, user_in.email)
         
         # 이메일 중복 확인
         existing_user = user_crud.get_by_email(db, email=user_in.email)
         if existing_user:
-            print(f"❌ 이메일 중복: {user_in.email}")
+            logger.debug("이메일 중복: %s", user_in.email)
             raise HTTPException(status_code=400, detail="이미 등록된 이메일입니다")
         
         # 사용자명 중복 확인
         existing_username = user_crud.get_by_username(db, username=user_in.username)
         if existing_username:
-            print(f"❌ 사용자명 중복: {user_in.username}")
+            logger.debug("사용자명 중복: %s", user_in.username)
             raise HTTPException(status_code=400, detail="이미 사용 중인 사용자명입니다")
         
-        print(f"✅ 중복 확인 완료, 사용자 생성 중...")
+        logger.debug("중복 확인 완료, 사용자 생성 중")
         user = user_crud.create(db, obj_in=user_in)
-        print(f"✅ 사용자 생성 완료: ID={user.id}")
+        logger.info("사용자 생성 완료", extra={"user_id": user.id})
         return user
     except HTTPException:
         raise
+    except PasswordHasherBusyError as e:
+        raise _password_hasher_busy(e)
     except Exception as e:
-        print(f"❌ 회원가입 실패: {str(e)}")
+        logger.exception("회원가입 실패")
         raise HTTPException(status_code=500, detail=f"사용자 등록 실패: {str(e)}")
 
 @router.get("/me", response_model=User)
@@ -290,6 +306,8 @@ def update_current_user(
         return user
     except HTTPException:
         raise
+    except PasswordHasherBusyError as e:
+        raise _password_hasher_busy(e)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"사용자 정보 업데이트 실패: {str(e)}")
 
@@ -313,8 +331,7 @@ def delete_current_user(
 ):
     """현재 사용자 계정 삭제"""
     try:
-        db.delete(current_user)
-        db.commit()
+        user_crud.remove(db, db_obj=current_user)
         return {"message": "사용자 계정이 성공적으로 삭제되었습니다"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"사용자 계정 삭제 실패: {str(e)}")
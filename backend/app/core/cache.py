@@ -0,0 +1,387 @@
+"""
+Posture Check App Backend - 캐시 모듈
+
+조회 결과를 위한 읽기 캐시(read-through) 계층을 제공합니다.
+- CacheBackend: 캐시 백엔드 인터페이스
+- MemoryCache: 프로세스 내 LRU + TTL 캐시 (기본값)
+- RedisCache: Redis 호환 저장소 캐시 (redis 패키지 필요, 워커 간 공유)
+
+항목은 네임스페이스(예: 사용자)별로 묶여 있어 쓰기 시 네임스페이스 단위로 무효화합니다.
+네임스페이스마다 무효화 세대(generation)를 두어, 조회 중에 무효화되면 조회 결과를 저장하지 않습니다.
+(MemoryCache는 조회가 진행 중인 네임스페이스의 세대만 유지하고, 조회가 모두 끝나면 세대를 삭제합니다.)
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from .config import settings
+
+
+class CacheBackend:
+    """캐시 백엔드 인터페이스"""
+
+    # 호출마다 네트워크 I/O를 하는 백엔드 (비동기 경로에서는 이벤트 루프를 막지 않도록 스레드 풀에서 호출)
+    blocking = False
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """(적중 여부, 값) 반환"""
+        raise NotImplementedError
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        namespace: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        generation: Optional[int] = None,
+        generation_namespace: Optional[str] = None
+    ) -> None:
+        """
+        값 저장 (ttl_seconds를 지정하면 해당 항목만 기본 TTL 대신 사용)
+
+        generation을 지정하면 네임스페이스 세대가 그 값과 다를 때(조회 후 무효화됨) 저장하지 않음
+        (generation_namespace를 지정하면 namespace 대신 그 네임스페이스의 세대와 비교)
+        """
+        raise NotImplementedError
+
+    def begin_load(self, namespace: str) -> int:
+        """조회 시작 (현재 네임스페이스 세대 반환, 조회가 끝나면 end_load 호출)"""
+        raise NotImplementedError
+
+    def end_load(self, namespace: str) -> None:
+        """조회 종료"""
+
+    def invalidate(self, namespace: str) -> None:
+        """네임스페이스에 속한 모든 항목 삭제 (세대 증가)"""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """모든 항목 삭제 (진행 중인 조회 결과도 저장되지 않도록 세대 증가)"""
+        raise NotImplementedError
+
+    def get_stats(self) -> Dict:
+        raise NotImplementedError
+
+
+class MemoryCache(CacheBackend):
+    """
+    프로세스 내 LRU + TTL 캐시
+
+    max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 제거하고,
+    ttl_seconds가 지난 항목은 조회 시 만료 처리
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, Any, Optional[str]]]" = OrderedDict()
+        self._namespaces: Dict[str, set] = {}
+        # 조회가 진행 중인 네임스페이스의 세대와 진행 중인 조회 수 (조회가 모두 끝나면 삭제)
+        self._generations: Dict[str, int] = {}
+        self._loading: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        # 카운터
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            expires_at, value, namespace = entry
+            if expires_at <= time.monotonic():
+                self._remove(key, namespace)
+                self.expirations += 1
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        namespace: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        generation: Optional[int] = None,
+        generation_namespace: Optional[str] = None
+    ) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            if generation is not None and self._generations.get(generation_namespace or namespace, 0) != generation:
+                return
+            if key in self._entries:
+                self._remove(key, self._entries[key][2])
+            self._entries[key] = (time.monotonic() + ttl, value, namespace)
+            if namespace is not None:
+                self._namespaces.setdefault(namespace, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                oldest_key, (_, _, oldest_namespace) = next(iter(self._entries.items()))
+                self._remove(oldest_key, oldest_namespace)
+                self.evictions += 1
+
+    def begin_load(self, namespace: str) -> int:
+        with self._lock:
+            self._loading[namespace] = self._loading.get(namespace, 0) + 1
+            return self._generations.setdefault(namespace, 0)
+
+    def end_load(self, namespace: str) -> None:
+        with self._lock:
+            remaining = self._loading.get(namespace, 0) - 1
+            if remaining > 0:
+                self._loading[namespace] = remaining
+            else:
+                self._loading.pop(namespace, None)
+                self._generations.pop(namespace, None)
+
+    def invalidate(self, namespace: str) -> None:
+        with self._lock:
+            if namespace in self._generations:
+                self._generations[namespace] += 1
+            keys = self._namespaces.pop(namespace, None)
+            if not keys:
+                return
+            for key in keys:
+                self._entries.pop(key, None)
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._namespaces.clear()
+            for namespace in self._generations:
+                self._generations[namespace] += 1
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": "memory",
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups * 100, 2) if lookups else 0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations
+            }
+
+    def _remove(self, key: str, namespace: Optional[str]) -> None:
+        self._entries.pop(key, None)
+        if namespace is not None:
+            keys = self._namespaces.get(namespace)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._namespaces[namespace]
+
+
+class RedisCache(CacheBackend):
+    """
+    Redis 호환 저장소 캐시
+
+    값은 JSON으로 저장하며(datetime은 ISO 문자열), 만료는 Redis TTL에 맡김
+    네임스페이스별 키 목록은 Redis SET, 무효화 세대는 INCR 카운터(네임스페이스별 + clear용 전체)로 관리 (워커 간 공유)
+    """
+
+    blocking = True
+
+    def __init__(self, url: str, ttl_seconds: float, prefix: str = "posture-cache:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("Redis 캐시를 사용하려면 redis 패키지를 설치해주세요 (pip install redis)") from e
+
+        self.client = redis.Redis.from_url(url)
+        self.ttl_seconds = ttl_seconds
+        self.prefix = prefix
+        self._lock = threading.Lock()
+
+        # 카운터 (프로세스별)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        raw = self.client.get(self.prefix + key)
+        with self._lock:
+            if raw is None:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+        return True, json.loads(raw)
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        namespace: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        generation: Optional[int] = None,
+        generation_namespace: Optional[str] = None
+    ) -> None:
+        """
+        값 저장
+
+        generation을 지정하면 저장과 같은 트랜잭션에서 세대를 다시 읽어, 그 사이 무효화되었으면 저장한 항목을 삭제
+        (invalidate는 세대를 먼저 올린 뒤 키 목록을 읽으므로, 세대 확인 뒤의 무효화는 이 항목도 삭제함)
+        """
+        ttl_ms = int((self.ttl_seconds if ttl_seconds is None else ttl_seconds) * 1000)
+        pipe = self.client.pipeline()
+        pipe.set(self.prefix + key, json.dumps(value, default=str), px=ttl_ms)
+        if namespace is not None:
+            namespace_key = self.prefix + "ns:" + namespace
+            pipe.sadd(namespace_key, key)
+            pipe.pexpire(namespace_key, ttl_ms)
+        generation_namespace = generation_namespace or namespace
+        if generation_namespace is not None and generation is not None:
+            pipe.mget(self.prefix + "gen:" + generation_namespace, self.prefix + "epoch")
+        results = pipe.execute()
+        if generation_namespace is not None and generation is not None and self._generation(results[-1]) != generation:
+            self.client.delete(self.prefix + key)
+
+    def begin_load(self, namespace: str) -> int:
+        return self._generation(self.client.mget(self.prefix + "gen:" + namespace, self.prefix + "epoch"))
+
+    @staticmethod
+    def _generation(counters) -> int:
+        """네임스페이스 세대 + 전체(clear) 세대 (둘 다 증가만 하므로 합이 같으면 그 사이 무효화 없음)"""
+        return sum(int(counter or 0) for counter in counters)
+
+    def invalidate(self, namespace: str) -> None:
+        namespace_key = self.prefix + "ns:" + namespace
+        generation_key = self.prefix + "gen:" + namespace
+        # 세대 카운터는 진행 중인 조회보다 오래 남도록 항목 TTL의 2배로 유지
+        pipe = self.client.pipeline()
+        pipe.incr(generation_key)
+        pipe.pexpire(generation_key, int(self.ttl_seconds * 2000))
+        pipe.execute()
+        keys = self.client.smembers(namespace_key)
+        if not keys:
+            return
+        self.client.delete(namespace_key, *(self.prefix + key.decode() for key in keys))
+        with self._lock:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        # 전체 세대를 먼저 올린 뒤 항목 삭제 (세대 카운터는 줄어들지 않도록 남겨 둠)
+        self.client.incr(self.prefix + "epoch")
+        counter_prefixes = ((self.prefix + "gen:").encode(), (self.prefix + "epoch").encode())
+        keys = [key for key in self.client.scan_iter(match=self.prefix + "*") if not key.startswith(counter_prefixes)]
+        if keys:
+            self.client.delete(*keys)
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": "redis",
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups * 100, 2) if lookups else 0,
+                "invalidations": self.invalidations
+            }
+
+
+class QueryCache:
+    """
+    조회 결과 읽기 캐시
+
+    get_or_load로 조회하고, 데이터가 바뀌면 invalidate로 네임스페이스 단위 무효화
+    캐시 미스 시 loader 호출 전에 네임스페이스 세대를 읽어 두고, loader가 끝나기 전에 무효화되었으면
+    (loader가 쓰기 이전 데이터를 읽었을 수 있으므로) 결과를 반환만 하고 저장하지 않음
+    enabled가 False이면 항상 loader를 호출
+    """
+
+    def __init__(self, backend: CacheBackend, enabled: bool = True):
+        self.backend = backend
+        self.enabled = enabled
+
+    def get_or_load(self, namespace: str, key: Tuple[Hashable, ...], loader: Callable[[], Any]) -> Any:
+        if not self.enabled:
+            return loader()
+        cache_key = ":".join(str(part) for part in (namespace, *key))
+        hit, value = self.backend.get(cache_key)
+        if hit:
+            return value
+        generation = self.backend.begin_load(namespace)
+        try:
+            value = loader()
+            self.backend.set(cache_key, value, namespace=namespace, generation=generation)
+        finally:
+            self.backend.end_load(namespace)
+        return value
+
+    async def get_or_load_async(
+        self, namespace: str, key: Tuple[Hashable, ...], loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """get_or_load의 비동기 버전 (loader는 코루틴 함수, blocking 백엔드는 스레드 풀에서 조회/저장)"""
+        if not self.enabled:
+            return await loader()
+        cache_key = ":".join(str(part) for part in (namespace, *key))
+        hit, value = await self._call_async(self.backend.get, cache_key)
+        if hit:
+            return value
+        generation = await self._call_async(self.backend.begin_load, namespace)
+        try:
+            value = await loader()
+            await self._call_async(self.backend.set, cache_key, value, namespace=namespace, generation=generation)
+        finally:
+            await self._call_async(self.backend.end_load, namespace)
+        return value
+
+    def invalidate(self, namespace: str) -> None:
+        if self.enabled:
+            self.backend.invalidate(namespace)
+
+    async def invalidate_async(self, namespace: str) -> None:
+        """invalidate의 비동기 버전 (blocking 백엔드는 스레드 풀에서 삭제)"""
+        if self.enabled:
+            await self._call_async(self.backend.invalidate, namespace)
+
+    async def _call_async(self, fn: Callable, *args, **kwargs) -> Any:
+        if self.backend.blocking:
+            return await run_in_threadpool(fn, *args, **kwargs)
+        return fn(*args, **kwargs)
+
+    def get_stats(self) -> Dict:
+        return {"enabled": self.enabled, **self.backend.get_stats()}
+
+
+def create_cache_backend(backend: str, ttl_seconds: float, max_entries: int, redis_url: Optional[str] = None) -> CacheBackend:
+    """설정 값으로 캐시 백엔드 생성"""
+    if backend == "redis":
+        return RedisCache(redis_url, ttl_seconds)
+    return MemoryCache(max_entries, ttl_seconds)
+
+
+# 자세 통계/트렌드 조회 캐시 인스턴스 (네임스페이스: 사용자)
+query_cache = QueryCache(
+    create_cache_backend(
+        settings.QUERY_CACHE_BACKEND,
+        ttl_seconds=settings.QUERY_CACHE_TTL_SECONDS,
+        max_entries=settings.QUERY_CACHE_MAX_ENTRIES,
+        redis_url=settings.QUERY_CACHE_REDIS_URL
+    ),
+    enabled=settings.QUERY_CACHE_ENABLED
+)
+
+
+def user_namespace(user_id: int) -> str:
+    """사용자 캐시 네임스페이스"""
+    return f"user:{user_id}"
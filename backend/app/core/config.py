@@ -46,6 +46,16 @@ class Settings(BaseSettings):
     ALGORITHM: str = os.getenv("ALGORITHM", "HS256")                          # JWT 알고리즘
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))  # 토큰 만료 시간
     
+    # bcrypt 해싱 워커 풀 (0이면 요청 스레드에서 직접 실행)
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))           # 워커 프로세스 수
+    PASSWORD_HASH_MAX_PENDING: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "32"))  # 실행 + 대기 최대 작업 수 (초과 시 429)
+    
+    # 인증 캐시 (프로세스 내, 디코딩된 토큰은 만료 시각까지, 사용자 정보는 짧은 TTL 동안 재사용)
+    AUTH_CACHE_ENABLED: bool = os.getenv("AUTH_CACHE_ENABLED", "true").lower() == "true"
+    AUTH_TOKEN_CACHE_MAX_ENTRIES: int = int(os.getenv("AUTH_TOKEN_CACHE_MAX_ENTRIES", "10000"))      # 디코딩된 토큰 최대 항목 수
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: float = float(os.getenv("AUTH_PRINCIPAL_CACHE_TTL_SECONDS", "30"))  # 사용자 정보 캐시 유지 시간
+    AUTH_PRINCIPAL_CACHE_MAX_ENTRIES: int = int(os.getenv("AUTH_PRINCIPAL_CACHE_MAX_ENTRIES", "10000"))  # 사용자 정보 최대 항목 수
+    
     # ==================== CORS 설정 ====================
     BACKEND_CORS_ORIGINS: str = "*"  # 모든 도메인 허용 (간단하게 문자열로 설정)
     
@@ -56,6 +66,81 @@ class Settings(BaseSettings):
             return ["*"]
         return [origin.strip() for origin in self.BACKEND_CORS_ORIGINS.split(",")]
     
+    # ==================== 헬스 체크 설정 ====================
+    HEALTH_READINESS_CACHE_SECONDS: float = float(os.getenv("HEALTH_READINESS_CACHE_SECONDS", "2.0"))  # readiness DB 확인 결과 캐시 시간 (초)
+    
+    # ==================== 성능 지표 설정 ====================
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"  # /metrics 및 요청/SQL 계측
+    
+    # ==================== 쿼리 예산 설정 ====================
+    # 요청별 SQL 실행 횟수/DB 시간 응답 헤더 및 라우트별 쿼리 예산 검사 (운영 환경에서는 기본 비활성화)
+    QUERY_PROFILING_ENABLED: bool = os.getenv("QUERY_PROFILING_ENABLED", "false").lower() == "true"
+    QUERY_BUDGET_STRICT: bool = os.getenv("QUERY_BUDGET_STRICT", "false").lower() == "true"  # 예산 초과 시 500 응답 (테스트/스테이징)
+    
+    # ==================== 로깅 설정 ====================
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")                  # 루트 로그 레벨
+    LOG_LEVELS: str = os.getenv("LOG_LEVELS", "")                    # 모듈별 레벨 ("app.crud.user=DEBUG,sqlalchemy.engine=WARNING")
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "json")                # json 또는 text
+    LOG_QUEUE_SIZE: int = int(os.getenv("LOG_QUEUE_SIZE", "10000"))  # 출력 대기 큐 크기 (가득 차면 버림)
+    LOG_SAMPLE_RATES: str = os.getenv("LOG_SAMPLE_RATES", "")        # 이벤트별 샘플링 비율 ("posture.save=0.01,posture.stream_frame=0.001")
+    LOG_SAMPLE_DEFAULT_RATE: float = float(os.getenv("LOG_SAMPLE_DEFAULT_RATE", "0.1"))  # 샘플링 이벤트 기본 비율
+    
+    # ==================== 데이터 수집 설정 ====================
+    POSTURE_BATCH_MAX_SIZE: int = int(os.getenv("POSTURE_BATCH_MAX_SIZE", "500"))  # 배치 저장 최대 항목 수
+    
+    # 쓰기 지연(write-behind) 모드: 단건 저장을 큐에 모아 백그라운드에서 일괄 저장
+    POSTURE_WRITE_BEHIND_ENABLED: bool = os.getenv("POSTURE_WRITE_BEHIND_ENABLED", "false").lower() == "true"
+    POSTURE_WRITE_BEHIND_MAX_QUEUE: int = int(os.getenv("POSTURE_WRITE_BEHIND_MAX_QUEUE", "10000"))         # 큐 최대 크기
+    POSTURE_WRITE_BEHIND_BATCH_SIZE: int = int(os.getenv("POSTURE_WRITE_BEHIND_BATCH_SIZE", "500"))         # 1회 저장 최대 행 수
+    POSTURE_WRITE_BEHIND_FLUSH_INTERVAL: float = float(os.getenv("POSTURE_WRITE_BEHIND_FLUSH_INTERVAL", "1.0"))  # 저장 주기 (초)
+    POSTURE_WRITE_BEHIND_PUT_TIMEOUT: float = float(os.getenv("POSTURE_WRITE_BEHIND_PUT_TIMEOUT", "0.0"))   # 큐가 가득 찼을 때 대기 시간 (초, 0이면 즉시 503)
+    
+    # ==================== 조회 캐시 설정 ====================
+    # 자세 통계/트렌드 조회 결과 캐시 (자세 기록 저장 시 해당 사용자 캐시 무효화)
+    QUERY_CACHE_ENABLED: bool = os.getenv("QUERY_CACHE_ENABLED", "true").lower() == "true"
+    QUERY_CACHE_BACKEND: str = os.getenv("QUERY_CACHE_BACKEND", "memory")                # memory 또는 redis
+    QUERY_CACHE_TTL_SECONDS: float = float(os.getenv("QUERY_CACHE_TTL_SECONDS", "30"))   # 캐시 유효 시간 (초)
+    QUERY_CACHE_MAX_ENTRIES: int = int(os.getenv("QUERY_CACHE_MAX_ENTRIES", "10000"))    # 메모리 캐시 최대 항목 수
+    QUERY_CACHE_REDIS_URL: Optional[str] = os.getenv("QUERY_CACHE_REDIS_URL")            # Redis 캐시 연결 URL
+    
+    # ==================== 실시간 분석 세션 설정 ====================
+    SESSION_STORE_BACKEND: str = os.getenv("SESSION_STORE_BACKEND", "memory")                      # memory 또는 redis (여러 워커 사용 시)
+    SESSION_STORE_REDIS_URL: Optional[str] = os.getenv("SESSION_STORE_REDIS_URL")                  # Redis 세션 저장소 연결 URL
+    SESSION_IDLE_TTL_SECONDS: float = float(os.getenv("SESSION_IDLE_TTL_SECONDS", "3600"))         # 활성 세션 캐시 유지 시간 (초, 만료 후 DB에서 다시 채움)
+    SESSION_STOPPED_TTL_SECONDS: float = float(os.getenv("SESSION_STOPPED_TTL_SECONDS", "300"))    # 중지된 세션 보관 시간 (초)
+    SESSION_SWEEP_INTERVAL_SECONDS: float = float(os.getenv("SESSION_SWEEP_INTERVAL_SECONDS", "60"))  # 만료 세션 정리 주기 (초)
+    
+    # ==================== 기록 조회 설정 ====================
+    POSTURE_RECORDS_PAGE_MAX_SIZE: int = int(os.getenv("POSTURE_RECORDS_PAGE_MAX_SIZE", "1000"))          # 커서 페이지 최대 크기
+    POSTURE_RECORDS_STREAM_CHUNK_SIZE: int = int(os.getenv("POSTURE_RECORDS_STREAM_CHUNK_SIZE", "1000"))  # NDJSON 스트림 서버 커서 fetch 크기
+    POSTURE_EXPORT_CHUNK_SIZE: int = int(os.getenv("POSTURE_EXPORT_CHUNK_SIZE", "10000"))                # 내보내기 청크 크기 (CSV 청크 / Parquet row group)
+    
+    # ==================== 파티션/보존 설정 ====================
+    # posture_records 월 단위 파티션 및 보존 정책 (maintain_partitions.py에서 적용)
+    POSTURE_PARTITION_PREMAKE_MONTHS: int = int(os.getenv("POSTURE_PARTITION_PREMAKE_MONTHS", "3"))           # 미리 만들어 둘 다음 달 파티션 수
+    POSTURE_RETENTION_MONTHS: int = int(os.getenv("POSTURE_RETENTION_MONTHS", "0"))                           # 이번 달 외 보존 개월 수 (0이면 무기한)
+    POSTURE_RETENTION_MODE: str = os.getenv("POSTURE_RETENTION_MODE", "drop")                                 # drop 또는 archive (보관 테이블로 분리)
+    POSTURE_PARTITION_CACHE_SECONDS: float = float(os.getenv("POSTURE_PARTITION_CACHE_SECONDS", "60"))        # SQLite 기간별 테이블 목록 캐시 시간 (초)
+    
+    # ==================== 기록 압축 설정 ====================
+    # 오래된 원본 기록을 세션/분 단위 요약 행으로 압축 (compact_records.py에서 적용)
+    POSTURE_COMPACTION_AFTER_DAYS: int = int(os.getenv("POSTURE_COMPACTION_AFTER_DAYS", "0"))                # 원본 기록 보존 일수 (0이면 압축 안 함)
+    POSTURE_COMPACTION_RESOLUTION: str = os.getenv("POSTURE_COMPACTION_RESOLUTION", "session")                # session (세션/날짜별) 또는 minute (세션/분별)
+    
+    # ==================== 실시간 스트리밍 설정 ====================
+    STREAM_BATCH_SIZE: int = int(os.getenv("STREAM_BATCH_SIZE", "50"))                # WebSocket 스트림 일괄 저장 프레임 수
+    STREAM_FLUSH_INTERVAL: float = float(os.getenv("STREAM_FLUSH_INTERVAL", "2.0"))   # WebSocket 스트림 최대 저장 지연 (초)
+    
+    # ==================== 자세 분석 설정 ====================
+    POSTURE_ANALYZE_BATCH_MAX_SIZE: int = int(os.getenv("POSTURE_ANALYZE_BATCH_MAX_SIZE", "50000"))  # 일괄 분석 최대 행 수
+    POSTURE_RULESET_PATH: Optional[str] = os.getenv("POSTURE_RULESET_PATH")                          # 분석 규칙 세트 JSON 파일 (없으면 기본 규칙)
+    POSTURE_ANALYSIS_WORKER_ENABLED: bool = os.getenv("POSTURE_ANALYSIS_WORKER_ENABLED", "true").lower() == "true"  # 저장된 기록 백그라운드 분석
+    POSTURE_ANALYSIS_WORKER_BATCH_SIZE: int = int(os.getenv("POSTURE_ANALYSIS_WORKER_BATCH_SIZE", "500"))      # 한 번에 분석/저장할 기록 수
+    POSTURE_ANALYSIS_WORKER_INTERVAL: float = float(os.getenv("POSTURE_ANALYSIS_WORKER_INTERVAL", "1.0"))      # 새 기록 확인 주기 (초)
+    POSTURE_ANALYSIS_WORKER_MAX_RETRIES: int = int(os.getenv("POSTURE_ANALYSIS_WORKER_MAX_RETRIES", "3"))      # 일괄 저장 실패 시 재시도 횟수
+    POSTURE_ANALYSIS_WORKER_RETRY_BACKOFF: float = float(os.getenv("POSTURE_ANALYSIS_WORKER_RETRY_BACKOFF", "0.5"))  # 재시도 대기 시간 (초, 재시도마다 2배)
+    POSTURE_ANALYSIS_WORKER_RESCAN_WINDOW: int = int(os.getenv("POSTURE_ANALYSIS_WORKER_RESCAN_WINDOW", "1000"))  # 늦게 커밋된 기록을 찾기 위해 다시 확인할 ID 범위
+    
     # ==================== 의학적 기준 설정 ====================
     # 실제 의료 기준을 반영한 자세 판단 기준값들
     NECK_ANGLE_NORMAL_MIN: float = -30.0    # 목 각도 정상 범위 최소값 (도)
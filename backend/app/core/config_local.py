@@ -35,6 +35,14 @@ class LocalSettings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32
+    
+    AUTH_CACHE_ENABLED: bool = True
+    AUTH_TOKEN_CACHE_MAX_ENTRIES: int = 10000
+    AUTH_PRINCIPAL_CACHE_TTL_SECONDS: float = 30
+    AUTH_PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    
     # ==================== CORS 설정 ====================
     BACKEND_CORS_ORIGINS: List[str] = ["*"]
     
@@ -46,6 +54,75 @@ class LocalSettings(BaseSettings):
             return v
         raise ValueError(v)
     
+    # ==================== 헬스 체크 설정 ====================
+    HEALTH_READINESS_CACHE_SECONDS: float = 2.0
+    
+    # ==================== 성능 지표 설정 ====================
+    METRICS_ENABLED: bool = True
+    
+    # ==================== 쿼리 예산 설정 ====================
+    QUERY_PROFILING_ENABLED: bool = True
+    QUERY_BUDGET_STRICT: bool = False
+    
+    # ==================== 로깅 설정 ====================
+    LOG_LEVEL: str = "INFO"
+    LOG_LEVELS: str = ""
+    LOG_FORMAT: str = "text"
+    LOG_QUEUE_SIZE: int = 10000
+    LOG_SAMPLE_RATES: str = ""
+    LOG_SAMPLE_DEFAULT_RATE: float = 0.1
+    
+    # ==================== 데이터 수집 설정 ====================
+    POSTURE_BATCH_MAX_SIZE: int = 500
+    POSTURE_WRITE_BEHIND_ENABLED: bool = False
+    POSTURE_WRITE_BEHIND_MAX_QUEUE: int = 10000
+    POSTURE_WRITE_BEHIND_BATCH_SIZE: int = 500
+    POSTURE_WRITE_BEHIND_FLUSH_INTERVAL: float = 1.0
+    POSTURE_WRITE_BEHIND_PUT_TIMEOUT: float = 0.0
+    
+    # ==================== 조회 캐시 설정 ====================
+    QUERY_CACHE_ENABLED: bool = True
+    QUERY_CACHE_BACKEND: str = "memory"
+    QUERY_CACHE_TTL_SECONDS: float = 30
+    QUERY_CACHE_MAX_ENTRIES: int = 10000
+    QUERY_CACHE_REDIS_URL: Optional[str] = None
+    
+    # ==================== 실시간 분석 세션 설정 ====================
+    SESSION_STORE_BACKEND: str = "memory"
+    SESSION_STORE_REDIS_URL: Optional[str] = None
+    SESSION_IDLE_TTL_SECONDS: float = 3600
+    SESSION_STOPPED_TTL_SECONDS: float = 300
+    SESSION_SWEEP_INTERVAL_SECONDS: float = 60
+    
+    # ==================== 기록 조회 설정 ====================
+    POSTURE_RECORDS_PAGE_MAX_SIZE: int = 1000
+    POSTURE_RECORDS_STREAM_CHUNK_SIZE: int = 1000
+    POSTURE_EXPORT_CHUNK_SIZE: int = 10000
+    
+    # ==================== 파티션/보존 설정 ====================
+    POSTURE_PARTITION_PREMAKE_MONTHS: int = 3
+    POSTURE_RETENTION_MONTHS: int = 0
+    POSTURE_RETENTION_MODE: str = "drop"
+    POSTURE_PARTITION_CACHE_SECONDS: float = 60.0
+    
+    # ==================== 기록 압축 설정 ====================
+    POSTURE_COMPACTION_AFTER_DAYS: int = 0
+    POSTURE_COMPACTION_RESOLUTION: str = "session"
+    
+    # ==================== 실시간 스트리밍 설정 ====================
+    STREAM_BATCH_SIZE: int = 50
+    STREAM_FLUSH_INTERVAL: float = 2.0
+    
+    # ==================== 자세 분석 설정 ====================
+    POSTURE_ANALYZE_BATCH_MAX_SIZE: int = 50000
+    POSTURE_RULESET_PATH: Optional[str] = None
+    POSTURE_ANALYSIS_WORKER_ENABLED: bool = True
+    POSTURE_ANALYSIS_WORKER_BATCH_SIZE: int = 500
+    POSTURE_ANALYSIS_WORKER_INTERVAL: float = 1.0
+    POSTURE_ANALYSIS_WORKER_MAX_RETRIES: int = 3
+    POSTURE_ANALYSIS_WORKER_RETRY_BACKOFF: float = 0.5
+    POSTURE_ANALYSIS_WORKER_RESCAN_WINDOW: int = 1000
+    
     # ==================== 의학적 기준 설정 ====================
     NECK_ANGLE_NORMAL_MIN: float = -30.0
     NECK_ANGLE_NORMAL_MAX: float = 30.0
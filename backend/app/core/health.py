@@ -0,0 +1,99 @@
+"""
+Posture Check App Backend - 헬스 체크
+
+로드 밸런서/업타임 모니터의 잦은 호출을 견딜 수 있도록
+- liveness: 프로세스 응답 여부만 확인 (DB 접근 없음)
+- readiness: 기존 SQLAlchemy 연결 풀에서 연결을 빌려 SELECT 1 실행,
+  결과는 HEALTH_READINESS_CACHE_SECONDS 동안 캐시 (동시에 만료되어도 DB 확인은 1번만 수행하고,
+  확인 중에 들어온 요청은 직전 결과를 반환)
+연결 풀 상태(크기, 사용 중, 오버플로우)는 I/O 없이 매 요청 최신값을 반환합니다.
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from .config import settings
+from ..db.session import engine, async_engine
+
+
+def pool_stats(target: Engine) -> Dict[str, Any]:
+    """연결 풀 상태 (QueuePool이 아니면 지원하는 항목만)"""
+    pool = target.pool
+    stats: Dict[str, Any] = {"type": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        method = getattr(pool, name, None)
+        if callable(method):
+            stats[name] = method()
+    return stats
+
+
+class ReadinessChecker:
+    def __init__(self, target: Engine, cache_seconds: float):
+        self.target = target
+        self.cache_seconds = cache_seconds
+        self._result: Optional[Dict[str, Any]] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+        # 카운터
+        self.checks = 0
+        self.cache_hits = 0
+
+    def check(self) -> Dict[str, Any]:
+        """
+        DB 연결 가능 여부 (캐시된 결과가 유효하면 DB에 접근하지 않음)
+
+        반환값: ready, database, latency_ms, checked_at, (실패 시) error
+        """
+        result = self._cached()
+        if result is not None:
+            return result
+
+        # 다른 스레드가 확인 중이면 (DB 응답이 느려도) 기다리지 않고 직전 결과 반환
+        if not self._lock.acquire(blocking=self._result is None):
+            return self._result
+        try:
+            result = self._cached()
+            if result is not None:
+                return result
+
+            started = time.perf_counter()
+            try:
+                with self.target.connect() as connection:
+                    connection.execute(text("SELECT 1"))
+                result = {"ready": True, "database": "connected"}
+            except Exception as e:
+                result = {"ready": False, "database": "disconnected", "error": str(e)}
+            result["latency_ms"] = round((time.perf_counter() - started) * 1000, 2)
+            result["checked_at"] = datetime.now(timezone.utc).isoformat()
+
+            self._result = result
+            self._checked_at = time.monotonic()
+            self.checks += 1
+            return result
+        finally:
+            self._lock.release()
+
+    def _cached(self) -> Optional[Dict[str, Any]]:
+        if self._result is not None and time.monotonic() - self._checked_at < self.cache_seconds:
+            self.cache_hits += 1
+            return self._result
+        return None
+
+    def report(self) -> Dict[str, Any]:
+        """readiness 결과 + 연결 풀 상태"""
+        return {
+            **self.check(),
+            "pool": pool_stats(self.target),
+            "async_pool": pool_stats(async_engine.sync_engine),
+            "cache_seconds": self.cache_seconds
+        }
+
+
+# readiness 확인 인스턴스 (동기 엔진 연결 풀 사용)
+readiness_checker = ReadinessChecker(engine, settings.HEALTH_READINESS_CACHE_SECONDS)
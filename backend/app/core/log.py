@@ -0,0 +1,179 @@
+"""
+Posture Check App Backend - 로깅 설정
+
+표준 logging을 JSON Lines 형식으로 출력합니다.
+- 요청 처리 스레드는 QueueHandler로 레코드를 큐에 넣기만 하고,
+  실제 출력(stdout)은 QueueListener 백그라운드 스레드가 수행
+- 큐가 가득 차면 요청을 막지 않고 레코드를 버림 (버린 건수는 get_stats)
+- LOG_LEVEL(루트)과 LOG_LEVELS("모듈=레벨,...")로 모듈별 레벨 지정
+- 빈도가 높은 이벤트는 extra={"sample": "이벤트 이름"}으로 기록하면
+  LOG_SAMPLE_RATES("이벤트=비율,...", 기본 LOG_SAMPLE_DEFAULT_RATE) 비율만 출력
+  (WARNING 이상은 샘플링하지 않음)
+
+각 모듈은 logging.getLogger(__name__)으로 로거를 만들어 사용합니다.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from .config import settings
+
+# JSON 출력에서 제외할 LogRecord 기본 속성 (나머지 extra 값은 필드로 출력)
+_RESERVED_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "sample"}
+
+
+def _parse_mapping(value: str) -> Dict[str, str]:
+    """"a=1,b=2" 형식 설정 해석"""
+    mapping = {}
+    for item in (value or "").split(","):
+        if "=" in item:
+            key, _, val = item.partition("=")
+            mapping[key.strip()] = val.strip()
+    return mapping
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드 1건을 JSON 한 줄로 변환"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            "thread": record.threadName,
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    extra={"sample": 이벤트 이름}이 붙은 레코드를 이벤트별 비율만큼만 통과
+
+    무작위가 아닌 누적 방식(이벤트마다 비율만큼 누적하여 1이 될 때마다 1건)이라 출력 건수가 일정하고,
+    비율이 1/정수가 아니어도(예: 0.3) 실제 통과 비율이 설정 비율과 같음
+    통과한 레코드에는 sample_rate 필드가 붙음 (집계 시 1/sample_rate를 곱해 환산)
+    """
+
+    def __init__(self, rates: Dict[str, float], default_rate: float):
+        super().__init__()
+        self.rates = rates
+        self.default_rate = default_rate
+        self._credits: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        event = getattr(record, "sample", None)
+        if event is None or record.levelno >= logging.WARNING:
+            return True
+        rate = self.rates.get(event, self.default_rate)
+        if rate >= 1.0:
+            return True
+        if rate <= 0.0:
+            return False
+        with self._lock:
+            # 이벤트의 첫 레코드는 통과
+            credit = self._credits[event] + rate if event in self._credits else 1.0
+            passed = credit >= 1.0
+            self._credits[event] = credit - 1.0 if passed else credit
+        if not passed:
+            return False
+        record.sample_rate = rate
+        return True
+
+
+class _NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """큐가 가득 차면 대기하지 않고 버리는 QueueHandler"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 메시지와 예외 정보만 문자열로 만들어 두고 extra 필드는 유지 (포맷은 리스너 스레드에서)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        record.stack_info = None
+        return record
+
+
+class LoggingManager:
+    def __init__(self):
+        self._handler: Optional[_NonBlockingQueueHandler] = None
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_configured(self) -> bool:
+        return self._listener is not None
+
+    def setup(self) -> None:
+        """루트 로거에 큐 핸들러 설치 및 출력 스레드 시작 (여러 번 호출해도 한 번만 설정)"""
+        with self._lock:
+            if self._listener is not None:
+                return
+
+            output = logging.StreamHandler(sys.stdout)
+            if settings.LOG_FORMAT == "json":
+                output.setFormatter(JsonFormatter())
+            else:
+                output.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+
+            self._handler = _NonBlockingQueueHandler(queue.Queue(maxsize=settings.LOG_QUEUE_SIZE))
+            self._handler.addFilter(SamplingFilter(
+                {event: float(rate) for event, rate in _parse_mapping(settings.LOG_SAMPLE_RATES).items()},
+                settings.LOG_SAMPLE_DEFAULT_RATE
+            ))
+            self._listener = logging.handlers.QueueListener(self._handler.queue, output, respect_handler_level=False)
+
+            root = logging.getLogger()
+            root.handlers = [self._handler]
+            root.setLevel(settings.LOG_LEVEL.upper())
+            for name, level in _parse_mapping(settings.LOG_LEVELS).items():
+                logging.getLogger(name).setLevel(level.upper())
+
+            self._listener.start()
+            atexit.register(self.shutdown)
+
+    def shutdown(self) -> None:
+        """큐에 남은 로그를 모두 출력하고 출력 스레드 종료"""
+        with self._lock:
+            if self._listener is None:
+                return
+            self._listener.stop()
+            self._listener = None
+
+    def get_stats(self) -> Dict:
+        """로그 큐 상태 반환"""
+        handler = self._handler
+        return {
+            "configured": self.is_configured,
+            "queue_depth": handler.queue.qsize() if handler else 0,
+            "queue_max_size": settings.LOG_QUEUE_SIZE,
+            "dropped": handler.dropped if handler else 0
+        }
+
+
+# 로깅 설정 인스턴스 (애플리케이션 import 시 setup)
+logging_manager = LoggingManager()
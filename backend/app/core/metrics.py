@@ -0,0 +1,357 @@
+"""
+Posture Check App Backend - 성능 지표 (Prometheus 텍스트 형식)
+
+운영 환경에서 항상 켜둘 수 있도록 외부 패키지 없이 최소한의 연산만 수행합니다.
+- 기록: 잠금 1회 + 버킷 위치 계산(bisect)만 수행, 문자열 생성은 /metrics 조회 시에만
+- 라벨은 라우트 템플릿(/api/v1/posture/records/{record_id}/analysis 등)을 사용하여 종류 수를 제한
+- 연결 풀, 쓰기 버퍼 큐 깊이 등 현재 상태 값은 조회 시점에 콜백으로 수집
+
+제공 지표:
+- http_request_duration_seconds{method, route, status}: 요청 처리 시간 히스토그램
+- http_requests_in_flight: 처리 중인 요청 수
+- http_request_db_queries{method, route}: 요청당 SQL 실행 횟수 히스토그램
+- db_queries_total / db_query_seconds_total{route}: 라우트별 SQL 실행 횟수 / 시간 합계
+- db_query_duration_seconds: SQL 1건 실행 시간 히스토그램 (백그라운드 작업 포함)
+- db_pool_*{pool}: 연결 풀 크기 / 사용 중 / 오버플로우
+- password_hash_duration_seconds{operation}: 비밀번호 해싱/검증 시간 (대기 포함)
+- posture_records_saved_total{path} / posture_analyses_saved_total: 저장 건수 (rate()로 초당 저장 건수)
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+LabelValues = Tuple[str, ...]
+
+HTTP_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+PASSWORD_HASH_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Iterable[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    type = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}", *self._samples()]
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class _ValueMetric(_Metric):
+    """
+    라벨별 단일 값 지표
+
+    callback을 지정하면 조회 시점에 callback() 결과({라벨 값 튜플: 값})를 사용
+    (다른 모듈이 이미 관리하는 카운터/상태 값을 그대로 노출할 때)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        callback: Optional[Callable[[], Dict[LabelValues, float]]] = None
+    ):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self.callback = callback
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def _samples(self) -> List[str]:
+        if self.callback is not None:
+            try:
+                values = list(self.callback().items())
+            except Exception:
+                values = []
+        else:
+            with self._lock:
+                values = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in values]
+
+
+class Counter(_ValueMetric):
+    type = "counter"
+
+
+class Gauge(_ValueMetric):
+    type = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set(self, value: float, *labels: str) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(_Metric):
+    type = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = HTTP_BUCKETS):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 값 → [버킷별 건수(+Inf 포함, 비누적), 합계, 건수]
+        self._values: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(labels)
+            if state is None:
+                state = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            values = [(key, list(state[0]), state[1], state[2]) for key, state in self._values.items()]
+        lines = []
+        for key, counts, total, count in values:
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, float("inf")), counts):
+                cumulative += bucket_count
+                le = 'le="' + _format_value(bound) + '"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = (), callback=None) -> Counter:
+        return self.register(Counter(name, help, labelnames, callback))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = (), callback=None) -> Gauge:
+        return self.register(Gauge(name, help, labelnames, callback))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = HTTP_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, help, labelnames, buckets))
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식 (version 0.0.4)"""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class RequestStats:
+    """요청 1건의 SQL 실행 횟수 / 시간 (ContextVar로 요청 처리 스레드/태스크에 전달)"""
+    __slots__ = ("queries", "db_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+
+
+# 현재 요청의 SQL 통계 (요청 밖의 백그라운드 작업에서는 None)
+current_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("current_request_stats", default=None)
+
+# 지표 레지스트리 및 지표 인스턴스
+metrics_registry = MetricsRegistry()
+
+http_request_duration = metrics_registry.histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간", ("method", "route", "status"), HTTP_BUCKETS
+)
+http_requests_in_flight = metrics_registry.gauge("http_requests_in_flight", "처리 중인 HTTP 요청 수")
+http_requests_in_flight.set(0)
+http_request_db_queries = metrics_registry.histogram(
+    "http_request_db_queries", "요청당 SQL 실행 횟수", ("method", "route"), QUERY_COUNT_BUCKETS
+)
+db_queries_total = metrics_registry.counter("db_queries_total", "라우트별 SQL 실행 횟수", ("route",))
+db_query_seconds_total = metrics_registry.counter("db_query_seconds_total", "라우트별 SQL 실행 시간 합계", ("route",))
+db_query_duration = metrics_registry.histogram(
+    "db_query_duration_seconds", "SQL 1건 실행 시간 (백그라운드 작업 포함)", (), DB_BUCKETS
+)
+password_hash_duration = metrics_registry.histogram(
+    "password_hash_duration_seconds", "비밀번호 해싱/검증 시간 (워커 풀 대기 포함)", ("operation",), PASSWORD_HASH_BUCKETS
+)
+posture_records_saved = metrics_registry.counter(
+    "posture_records_saved_total", "저장된 자세 기록 수", ("path",)
+)
+posture_analyses_saved = metrics_registry.counter(
+    "posture_analyses_saved_total", "백그라운드 분석 워커가 저장한 분석 결과 수"
+)
+
+
+def route_template(scope) -> str:
+    """
+    요청이 일치한 라우트 템플릿 (예: /api/v1/posture/records/{record_id}/analysis)
+
+    include_router로 등록된 라우트는 scope["route"].path에 접두사가 빠져 있으므로
+    FastAPI가 기록한 전체 경로(effective_route_context)를 우선 사용
+    """
+    context = scope.get("fastapi", {}).get("effective_route_context")
+    path = getattr(context, "path_format", None)
+    if path:
+        return path
+    route = scope.get("route")
+    return getattr(route, "path_format", None) or getattr(route, "path", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    HTTP 요청 처리 시간 / 처리 중 요청 수 / 요청별 SQL 통계 기록 (ASGI 미들웨어)
+
+    라우트 템플릿은 라우팅 후 scope["route"]에서 가져오며, 일치하는 라우트가 없으면 "unmatched"
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        # 바깥 미들웨어(쿼리 프로파일러)가 이미 만든 통계가 있으면 함께 사용
+        stats = current_request_stats.get()
+        token = None
+        if stats is None:
+            stats = RequestStats()
+            token = current_request_stats.set(stats)
+        http_requests_in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_requests_in_flight.dec()
+            if token is not None:
+                current_request_stats.reset(token)
+
+            route = route_template(scope)
+            method = scope["method"]
+            http_request_duration.observe(elapsed, method, route, str(status_code))
+            http_request_db_queries.observe(stats.queries, method, route)
+            if stats.queries:
+                db_queries_total.inc(route, amount=stats.queries)
+                db_query_seconds_total.inc(route, amount=stats.db_seconds)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_metrics_started", None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    db_query_duration.observe(elapsed)
+    stats = current_request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+
+
+def instrument_engine(engine: Engine) -> None:
+    """엔진의 SQL 실행 시간 기록 (before/after_cursor_execute 이벤트, 여러 번 호출해도 한 번만 등록)"""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+_setup_done = False
+
+
+def setup_metrics() -> None:
+    """DB 엔진 계측 및 상태 지표(연결 풀, 쓰기 버퍼, 해싱 워커, 로그 큐) 등록 (여러 번 호출해도 한 번만 등록)"""
+    global _setup_done
+    if _setup_done:
+        return
+    _setup_done = True
+
+    from ..db.session import engine, async_engine
+    from ..crud.posture_buffer import posture_write_buffer
+    from .health import pool_stats
+    from .log import logging_manager
+    from .password_hasher import password_hasher
+
+    instrument_engine(engine)
+    instrument_engine(async_engine.sync_engine)
+
+    pools = {"sync": engine, "async": async_engine.sync_engine}
+
+    def pool_value(name: str) -> Callable[[], Dict[LabelValues, float]]:
+        def collect() -> Dict[LabelValues, float]:
+            values = {}
+            for pool_name, target in pools.items():
+                stats = pool_stats(target)
+                if name in stats:
+                    values[(pool_name,)] = stats[name]
+            return values
+        return collect
+
+    metrics_registry.gauge("db_pool_size", "연결 풀 크기", ("pool",), pool_value("size"))
+    metrics_registry.gauge("db_pool_checked_out", "사용 중인 연결 수", ("pool",), pool_value("checkedout"))
+    metrics_registry.gauge("db_pool_checked_in", "대기 중인 연결 수", ("pool",), pool_value("checkedin"))
+    metrics_registry.gauge("db_pool_overflow", "풀 크기를 초과한 연결 수 (음수면 여유)", ("pool",), pool_value("overflow"))
+    metrics_registry.gauge(
+        "posture_write_buffer_queue_depth", "쓰기 지연 버퍼 대기 기록 수",
+        callback=lambda: {(): posture_write_buffer.get_stats()["queue_depth"]}
+    )
+    metrics_registry.gauge(
+        "password_hasher_in_flight", "처리 중인 비밀번호 해싱 작업 수",
+        callback=lambda: {(): password_hasher.get_stats()["in_flight"]}
+    )
+    metrics_registry.counter(
+        "password_hasher_rejected_total", "대기열 초과로 거절된 비밀번호 해싱 작업 수",
+        callback=lambda: {(): password_hasher.get_stats()["rejected"]}
+    )
+    metrics_registry.counter(
+        "log_records_dropped_total", "로그 큐 초과로 버려진 로그 수",
+        callback=lambda: {(): logging_manager.get_stats()["dropped"]}
+    )
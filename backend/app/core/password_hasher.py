@@ -0,0 +1,130 @@
+"""
+Posture Check App Backend - 비밀번호 해싱 워커 풀
+
+bcrypt 해싱/검증은 호출당 수백 ms의 CPU를 사용하므로 요청 스레드나 이벤트 루프에서
+직접 실행하지 않고 전용 프로세스 풀에서 실행합니다.
+- PASSWORD_HASH_WORKERS: 워커 프로세스 수 (0이면 호출한 스레드에서 직접 실행)
+- PASSWORD_HASH_MAX_PENDING: 실행 중 + 대기 중인 작업 최대 수
+  초과 시 PasswordHasherBusyError 발생 (API에서 429 응답)
+
+이 모듈은 워커 프로세스에서도 import되므로 데이터베이스 관련 모듈을 import하지 않습니다.
+"""
+
+import asyncio
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Dict, Optional
+
+from passlib.context import CryptContext
+
+from .config import settings
+
+# 비밀번호 해싱 컨텍스트
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+class PasswordHasherBusyError(Exception):
+    """비밀번호 해싱 대기열이 가득 참"""
+
+
+class PasswordHasherPool:
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._stats_lock = threading.Lock()
+
+        # 카운터
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """비밀번호 검증 (완료될 때까지 호출 스레드 대기)"""
+        if self.workers <= 0:
+            return _verify(plain_password, hashed_password)
+        return self._submit(_verify, plain_password, hashed_password).result()
+
+    def hash(self, password: str) -> str:
+        """비밀번호 해싱 (완료될 때까지 호출 스레드 대기)"""
+        if self.workers <= 0:
+            return _hash(password)
+        return self._submit(_hash, password).result()
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        """비밀번호 검증 (이벤트 루프를 막지 않음)"""
+        if self.workers <= 0:
+            return await asyncio.to_thread(_verify, plain_password, hashed_password)
+        return await asyncio.wrap_future(self._submit(_verify, plain_password, hashed_password))
+
+    async def hash_async(self, password: str) -> str:
+        """비밀번호 해싱 (이벤트 루프를 막지 않음)"""
+        if self.workers <= 0:
+            return await asyncio.to_thread(_hash, password)
+        return await asyncio.wrap_future(self._submit(_hash, password))
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+    def get_stats(self) -> Dict:
+        with self._stats_lock:
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "in_flight": self.in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected
+            }
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # 첫 사용 시 생성 (스레드가 있는 프로세스에서 fork하지 않도록 spawn 사용)
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def _submit(self, fn: Callable, *args) -> Future:
+        if not self._slots.acquire(blocking=False):
+            with self._stats_lock:
+                self.rejected += 1
+            raise PasswordHasherBusyError("비밀번호 처리 요청이 많습니다. 잠시 후 다시 시도해주세요")
+        with self._stats_lock:
+            self.in_flight += 1
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except Exception:
+            self._release(None)
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    def _release(self, future: Optional[Future]) -> None:
+        with self._stats_lock:
+            self.in_flight -= 1
+            if future is not None:
+                self.completed += 1
+        self._slots.release()
+
+
+# 비밀번호 해싱 워커 풀 인스턴스 (첫 사용 시 프로세스 생성)
+password_hasher = PasswordHasherPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING
+)
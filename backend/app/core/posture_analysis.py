@@ -0,0 +1,347 @@
+"""
+Posture Check App Backend - 자세 분석 엔진
+
+선언형 규칙 세트(posture_rules)를 시작 시 한 번 컴파일하여
+의학적 기준 판단(정상 여부, 문제점/개선 제안, 심각도, 편차)을 수행합니다.
+- analyze / analyze_record: 기록 1건 (순수 Python, 실시간 분석용)
+- analyze_arrays: 지표별 NumPy 배열 (과거 기록 재분석 등 대량 처리용)
+
+두 경로는 같은 규칙과 같은 float64 연산을 사용하므로 결과가 정확히 일치합니다.
+값이 없는 지표(None / NaN / 배열 누락)는 측정되지 않은 것으로 보고 정상, 편차 0으로 처리합니다.
+"""
+
+import hashlib
+import json
+import math
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .config import settings
+from .posture_rules import load_ruleset
+
+DEVIATION_MODES = ("center", "over_max", "outside")
+
+
+class AnalysisRule:
+    """
+    지표 1개에 대한 정상 범위 규칙 (컴파일된 형태)
+
+    - minimum / maximum이 None이면 해당 방향은 검사하지 않음
+    - deviation_mode: "center" = 정상 범위 중앙값과의 절대 차이,
+                      "over_max" = 최대값 초과량 (초과하지 않으면 0),
+                      "outside" = 정상 범위 밖으로 벗어난 양 (범위 안이면 0)
+    """
+
+    def __init__(
+        self,
+        metric: str,
+        flag: str,
+        deviation: str,
+        minimum: Optional[float],
+        maximum: Optional[float],
+        deviation_mode: str,
+        weight: float,
+        problem: str,
+        suggestion: str,
+        label: str = "",
+        unit: str = "",
+        region: Optional[str] = None
+    ):
+        if deviation_mode not in DEVIATION_MODES:
+            raise ValueError(f"{metric}: 지원하지 않는 deviation_mode입니다: {deviation_mode}")
+        if deviation_mode == "center" and (minimum is None or maximum is None):
+            raise ValueError(f"{metric}: center 편차는 min과 max가 모두 필요합니다")
+        if deviation_mode == "over_max" and maximum is None:
+            raise ValueError(f"{metric}: over_max 편차는 max가 필요합니다")
+
+        self.metric = metric
+        self.flag = flag
+        self.deviation = deviation
+        self.minimum = None if minimum is None else float(minimum)
+        self.maximum = None if maximum is None else float(maximum)
+        self.deviation_mode = deviation_mode
+        self.weight = float(weight)
+        self.problem = problem
+        self.suggestion = suggestion
+        self.label = label
+        self.unit = unit
+        self.region = region
+        self.center = (self.minimum + self.maximum) / 2 if deviation_mode == "center" else None
+
+    def is_normal(self, value: float) -> bool:
+        if self.minimum is not None and not value >= self.minimum:
+            return False
+        if self.maximum is not None and not value <= self.maximum:
+            return False
+        return True
+
+    def is_normal_array(self, values: np.ndarray) -> np.ndarray:
+        is_normal = np.ones(len(values), dtype=bool)
+        if self.minimum is not None:
+            is_normal &= values >= self.minimum
+        if self.maximum is not None:
+            is_normal &= values <= self.maximum
+        return is_normal
+
+    def deviation_of(self, value: float) -> float:
+        if self.deviation_mode == "center":
+            return abs(value - self.center)
+        if self.deviation_mode == "over_max":
+            return max(0.0, value - self.maximum)
+        below = self.minimum - value if self.minimum is not None else 0.0
+        above = value - self.maximum if self.maximum is not None else 0.0
+        return max(0.0, below, above)
+
+    def deviation_array(self, values: np.ndarray) -> np.ndarray:
+        if self.deviation_mode == "center":
+            return np.abs(values - self.center)
+        if self.deviation_mode == "over_max":
+            return np.maximum(0.0, values - self.maximum)
+        below = self.minimum - values if self.minimum is not None else np.zeros(len(values))
+        above = values - self.maximum if self.maximum is not None else np.zeros(len(values))
+        return np.maximum(np.maximum(0.0, below), above)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "metric": self.metric,
+            "label": self.label,
+            "unit": self.unit,
+            "region": self.region,
+            "min": self.minimum,
+            "max": self.maximum,
+            "weight": self.weight
+        }
+
+
+class PostureAnalysisEngine:
+    """
+    컴파일된 규칙 세트
+
+    위반 규칙 조합별 문제점/개선 제안 목록은 조합마다 한 번만 만들고, analyze 결과에는 복사본을 담음
+    """
+
+    def __init__(
+        self,
+        rules: List[AnalysisRule],
+        version: str,
+        severity_high: float = 2.0,
+        severity_medium: float = 1.0
+    ):
+        self.rules = rules
+        self.version = version
+        self.severity_high = severity_high
+        self.severity_medium = severity_medium
+        self.metrics = [rule.metric for rule in rules]
+        self._rules_by_metric = {rule.metric: rule for rule in rules}
+        self._messages_by_mask: Dict[int, Tuple[List[str], List[str]]] = {}
+        self._medical_standards = self._build_medical_standards()
+
+    def severity_of(self, weight_sum: float) -> str:
+        """위반한 규칙 가중치 합에 따른 심각도"""
+        if weight_sum >= self.severity_high:
+            return "high"
+        elif weight_sum >= self.severity_medium:
+            return "medium"
+        return "low"
+
+    def analyze(self, values: Mapping[str, Optional[float]]) -> Dict[str, Any]:
+        """기록 1건 분석 (values: 지표 이름 → 값)"""
+        return self._evaluate(tuple(values.get(metric) for metric in self.metrics))
+
+    def analyze_record(self, record: Any) -> Dict[str, Any]:
+        """PostureRecordCreate 등 지표 속성을 가진 객체 1건 분석"""
+        return self.analyze({metric: getattr(record, metric, None) for metric in self.metrics})
+
+    def evaluate_flags(self, values: Mapping[str, Optional[float]]) -> Dict[str, bool]:
+        """지표별 정상 여부만 판단 (flag 이름 → 정상 여부)"""
+        return {
+            rule.flag: value is None or math.isnan(value) or rule.is_normal(value)
+            for rule, value in ((rule, values.get(rule.metric)) for rule in self.rules)
+        }
+
+    def _evaluate(self, values: Tuple[Optional[float], ...]) -> Dict[str, Any]:
+        flags = {}
+        deviations = {}
+        mask = 0
+        weight_sum = 0.0
+        for bit, (rule, value) in enumerate(zip(self.rules, values)):
+            if value is None or math.isnan(value):
+                flags[rule.flag] = True
+                deviations[rule.deviation] = 0.0
+                continue
+            is_normal = rule.is_normal(value)
+            flags[rule.flag] = is_normal
+            deviations[rule.deviation] = rule.deviation_of(value)
+            if not is_normal:
+                mask |= 1 << bit
+                weight_sum += rule.weight
+
+        problems, suggestions = self._messages_for(mask)
+        return {
+            "analysis": {
+                **flags,
+                "problems": list(problems),
+                "suggestions": list(suggestions),
+                "severity_level": self.severity_of(weight_sum)
+            },
+            "deviations": deviations,
+            "medical_standards": dict(self._medical_standards),
+            "rule_version": self.version
+        }
+
+    def analyze_arrays(self, columns: Mapping[str, Sequence[float]]) -> Dict[str, np.ndarray]:
+        """
+        지표별 배열로 여러 건을 한 번에 분석
+
+        columns: 지표 이름 → 값 배열 (모든 배열의 길이가 같아야 함, 없는 지표는 측정 안 됨으로 처리)
+        반환값: 정상 여부 플래그, 편차, problem_mask(위반 규칙 비트마스크), severity_level 배열
+        """
+        present = {metric: columns[metric] for metric in self.metrics if metric in columns}
+        if not present:
+            raise ValueError(f"분석할 지표가 없습니다 (지원 지표: {', '.join(self.metrics)})")
+        arrays = {metric: np.asarray(values, dtype=np.float64) for metric, values in present.items()}
+        lengths = {len(values) for values in arrays.values()}
+        if len(lengths) > 1:
+            raise ValueError("지표별 배열의 길이가 서로 다릅니다")
+        count = lengths.pop()
+
+        result: Dict[str, np.ndarray] = {}
+        problem_mask = np.zeros(count, dtype=np.int64)
+        weight_sum = np.zeros(count, dtype=np.float64)
+        for bit, rule in enumerate(self.rules):
+            values = arrays.get(rule.metric)
+            if values is None:
+                result[rule.flag] = np.ones(count, dtype=bool)
+                result[rule.deviation] = np.zeros(count, dtype=np.float64)
+                continue
+            measured = ~np.isnan(values)
+            violated = measured & ~rule.is_normal_array(values)
+            result[rule.flag] = ~violated
+            result[rule.deviation] = np.where(measured, rule.deviation_array(values), 0.0)
+            problem_mask |= violated.astype(np.int64) << bit
+            weight_sum += np.where(violated, rule.weight, 0.0)
+
+        result["problem_mask"] = problem_mask
+        result["severity_level"] = np.where(
+            weight_sum >= self.severity_high, "high",
+            np.where(weight_sum >= self.severity_medium, "medium", "low")
+        )
+        return result
+
+    def problems_for(self, problem_mask: np.ndarray) -> List[List[str]]:
+        """problem_mask 배열 → 행별 문제점 목록"""
+        return [self._messages_for(mask)[0] for mask in problem_mask.tolist()]
+
+    def suggestions_for(self, problem_mask: np.ndarray) -> List[List[str]]:
+        """problem_mask 배열 → 행별 개선 제안 목록"""
+        return [self._messages_for(mask)[1] for mask in problem_mask.tolist()]
+
+    def region_scores(self, result: Mapping[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        analyze_arrays 결과 → 부위별 점수 배열 (0-100)
+
+        부위(region)에 속한 규칙 중 정상인 규칙의 비율 (심각도 가중치와 무관하게 규칙마다 같은 비중)
+        """
+        scores = {}
+        for region in sorted({rule.region for rule in self.rules if rule.region}):
+            rules = [rule for rule in self.rules if rule.region == region]
+            normal = sum(result[rule.flag].astype(np.float64) for rule in rules)
+            scores[region] = np.round(normal / len(rules) * 100, 2)
+        return scores
+
+    def to_records(self, result: Mapping[str, np.ndarray]) -> List[Dict[str, Any]]:
+        """analyze_arrays 결과를 analyze와 같은 형식의 행별 dict 목록으로 변환"""
+        flags = {rule.flag: result[rule.flag].tolist() for rule in self.rules}
+        deviations = {rule.deviation: result[rule.deviation].tolist() for rule in self.rules}
+        messages = [self._messages_for(mask) for mask in result["problem_mask"].tolist()]
+        severity_levels = result["severity_level"].tolist()
+
+        return [
+            {
+                "analysis": {
+                    **{flag: values[index] for flag, values in flags.items()},
+                    "problems": list(messages[index][0]),
+                    "suggestions": list(messages[index][1]),
+                    "severity_level": severity_levels[index]
+                },
+                "deviations": {name: values[index] for name, values in deviations.items()},
+                "medical_standards": dict(self._medical_standards),
+                "rule_version": self.version
+            }
+            for index in range(len(severity_levels))
+        ]
+
+    def medical_standards(self) -> Dict[str, Any]:
+        """기존 응답 형식의 의학적 기준 (목 각도, 전방 머리 거리, 머리 기울기)"""
+        return self._medical_standards
+
+    def describe(self) -> Dict[str, Any]:
+        """규칙 세트 버전과 지표별 기준"""
+        return {
+            "version": self.version,
+            "severity": {"high": self.severity_high, "medium": self.severity_medium},
+            "metrics": [rule.to_dict() for rule in self.rules]
+        }
+
+    def _messages_for(self, mask: int) -> Tuple[List[str], List[str]]:
+        # 위반 규칙 조합별 문제점/개선 제안 목록 (조합마다 한 번만 생성)
+        messages = self._messages_by_mask.get(mask)
+        if messages is None:
+            violated = [rule for bit, rule in enumerate(self.rules) if mask & (1 << bit)]
+            messages = ([rule.problem for rule in violated], [rule.suggestion for rule in violated])
+            self._messages_by_mask[mask] = messages
+        return messages
+
+    def _build_medical_standards(self) -> Dict[str, Any]:
+        neck_angle = self._rules_by_metric.get("neck_angle")
+        forward_head = self._rules_by_metric.get("forward_head_distance")
+        head_tilt = self._rules_by_metric.get("head_tilt")
+        return {
+            "neck_angle_range": (neck_angle.minimum, neck_angle.maximum) if neck_angle else None,
+            "forward_head_max": forward_head.maximum if forward_head else None,
+            "head_tilt_range": (head_tilt.minimum, head_tilt.maximum) if head_tilt else None
+        }
+
+
+def compile_ruleset(spec: Dict) -> PostureAnalysisEngine:
+    """
+    선언형 규칙 세트를 분석 엔진으로 컴파일
+
+    버전 태그는 "<version>-<규칙 해시 8자리>" 형식으로, 설정으로 기준값이 바뀌어도
+    저장된 분석 결과(analysis_version)에서 구분할 수 있음
+    """
+    rules = [
+        AnalysisRule(
+            metric=rule["metric"],
+            flag=rule.get("flag", f"is_{rule['metric']}_normal"),
+            deviation=rule.get("deviation", f"{rule['metric']}_deviation"),
+            minimum=rule.get("min"),
+            maximum=rule.get("max"),
+            deviation_mode=rule.get("deviation_mode", "center"),
+            weight=rule.get("weight", 1.0),
+            problem=rule["problem"],
+            suggestion=rule["suggestion"],
+            label=rule.get("label", rule["metric"]),
+            unit=rule.get("unit", ""),
+            region=rule.get("region")
+        )
+        for rule in spec["rules"]
+    ]
+    if len({rule.metric for rule in rules}) != len(rules):
+        raise ValueError("규칙 세트에 중복된 지표가 있습니다")
+
+    severity = spec.get("severity", {})
+    digest = hashlib.sha1(
+        json.dumps({"rules": spec["rules"], "severity": severity}, sort_keys=True, ensure_ascii=False).encode()
+    ).hexdigest()[:8]
+    return PostureAnalysisEngine(
+        rules,
+        version=f"{spec['version']}-{digest}",
+        severity_high=severity.get("high", 2.0),
+        severity_medium=severity.get("medium", 1.0)
+    )
+
+
+# 자세 분석 엔진 인스턴스 (import 시 규칙 세트를 한 번 컴파일)
+posture_analysis_engine = compile_ruleset(load_ruleset(settings.POSTURE_RULESET_PATH))
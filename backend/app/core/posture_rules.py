@@ -0,0 +1,152 @@
+"""
+Posture Check App Backend - 자세 분석 규칙 정의
+
+13개 자세 지표의 정상 범위, 가중치, 메시지를 선언형 규칙 세트로 정의합니다.
+규칙 세트는 애플리케이션 시작 시 한 번 컴파일되어(posture_analysis.compile_ruleset)
+실시간 분석, 일괄 분석, 기록 저장 시 정상 여부 판단, 의학적 기준 조회에서 함께 사용됩니다.
+
+규칙 항목:
+- metric: 지표 이름 (posture_records 컬럼명)
+- flag / deviation: 분석 결과의 정상 여부 / 편차 키
+- min / max: 정상 범위 (None이면 해당 방향은 검사하지 않음)
+- deviation_mode: center(정상 범위 중앙값과의 차이), over_max(최대값 초과량), outside(범위 밖으로 벗어난 양)
+- weight: 심각도 계산 가중치 (위반한 규칙 가중치 합이 severity 기준 이상이면 해당 심각도)
+  기본 규칙 세트는 기존 3개 기준(목 각도, 전방 머리 거리, 머리 기울기)만 1이고 나머지는 0이므로
+  심각도는 이전과 같이 세 기준 위반 수로 정해지고, 추가 지표는 정상 여부/편차/메시지로만 보고됨
+- region: 부위 (neck / shoulder, 저장되는 분석 결과의 부위별 점수 계산에 사용)
+- problem / suggestion: 위반 시 문제점 / 개선 제안 메시지
+
+목 각도, 전방 머리 거리, 머리 기울기 범위는 설정(NECK_ANGLE_NORMAL_* 등)을 따르며,
+POSTURE_RULESET_PATH로 같은 형식의 JSON 파일을 지정하면 기본 규칙 세트 대신 사용합니다.
+규칙을 바꿀 때는 version을 올려야 저장된 분석 결과(analysis_version)와 구분됩니다.
+"""
+
+import json
+from typing import Dict, Optional
+
+from .config import settings
+
+# 기본 규칙 세트 버전
+RULESET_VERSION = "3"
+
+
+def default_ruleset() -> Dict:
+    """기본 규칙 세트 (13개 지표)"""
+    return {
+        "version": RULESET_VERSION,
+        "severity": {"high": 2.0, "medium": 1.0},
+        "rules": [
+            {
+                "metric": "neck_angle", "label": "목 각도", "unit": "도", "region": "neck",
+                "flag": "is_neck_angle_normal", "deviation": "neck_angle_deviation",
+                "min": settings.NECK_ANGLE_NORMAL_MIN, "max": settings.NECK_ANGLE_NORMAL_MAX,
+                "deviation_mode": "center", "weight": 1.0,
+                "problem": "목 각도가 정상 범위를 벗어났습니다",
+                "suggestion": "목을 중앙으로 돌려주세요"
+            },
+            {
+                "metric": "shoulder_slope", "label": "어깨 기울기", "unit": "도", "region": "shoulder",
+                "flag": "is_shoulder_slope_normal", "deviation": "shoulder_slope_deviation",
+                "min": -5.0, "max": 5.0,
+                "deviation_mode": "center", "weight": 0.0,
+                "problem": "어깨가 한쪽으로 기울어져 있습니다",
+                "suggestion": "양쪽 어깨가 수평이 되도록 바르게 앉아주세요"
+            },
+            {
+                "metric": "head_forward", "label": "머리 전방 이동", "unit": "도", "region": "neck",
+                "flag": "is_head_forward_normal", "deviation": "head_forward_deviation",
+                "min": -15.0, "max": 15.0,
+                "deviation_mode": "center", "weight": 0.0,
+                "problem": "머리가 앞으로 숙여져 있습니다",
+                "suggestion": "고개를 들고 화면을 눈높이에 맞춰주세요"
+            },
+            {
+                "metric": "shoulder_height_diff", "label": "어깨 높이 차이", "unit": "mm", "region": "shoulder",
+                "flag": "is_shoulder_height_diff_normal", "deviation": "shoulder_height_diff_deviation",
+                "min": -20.0, "max": 20.0,
+                "deviation_mode": "center", "weight": 0.0,
+                "problem": "양쪽 어깨 높이 차이가 큽니다",
+                "suggestion": "한쪽으로 기대지 말고 바르게 앉아주세요"
+            },
+            {
+                "metric": "score", "label": "종합 점수", "unit": "점", "region": None,
+                "flag": "is_score_normal", "deviation": "score_deviation",
+                "min": 60.0, "max": 100.0,
+                "deviation_mode": "outside", "weight": 0.0,
+                "problem": "종합 자세 점수가 낮습니다",
+                "suggestion": "전체적인 자세를 점검해주세요"
+            },
+            {
+                "metric": "cervical_lordosis", "label": "경추 전만각", "unit": "도", "region": "neck",
+                "flag": "is_cervical_lordosis_normal", "deviation": "cervical_lordosis_deviation",
+                "min": None, "max": 45.0,
+                "deviation_mode": "over_max", "weight": 0.0,
+                "problem": "경추 전만이 과도합니다",
+                "suggestion": "턱을 살짝 당기고 목 뒤를 길게 늘려주세요"
+            },
+            {
+                "metric": "forward_head_distance", "label": "전방 머리 거리", "unit": "mm", "region": "neck",
+                "flag": "is_forward_head_normal", "deviation": "forward_head_deviation",
+                "min": None, "max": settings.FORWARD_HEAD_DISTANCE_MAX,
+                "deviation_mode": "over_max", "weight": 1.0,
+                "problem": "머리가 너무 앞으로 나와있습니다",
+                "suggestion": "턱을 뒤로 당겨주세요"
+            },
+            {
+                "metric": "head_tilt", "label": "머리 기울기", "unit": "도", "region": "neck",
+                "flag": "is_head_tilt_normal", "deviation": "head_tilt_deviation",
+                "min": settings.HEAD_TILT_NORMAL_MIN, "max": settings.HEAD_TILT_NORMAL_MAX,
+                "deviation_mode": "center", "weight": 1.0,
+                "problem": "머리가 측면으로 기울어져 있습니다",
+                "suggestion": "머리를 중앙으로 정렬해주세요"
+            },
+            {
+                "metric": "left_shoulder_height_diff", "label": "왼쪽 어깨 높이 차이", "unit": "mm", "region": "shoulder",
+                "flag": "is_left_shoulder_height_diff_normal", "deviation": "left_shoulder_height_diff_deviation",
+                "min": -20.0, "max": 20.0,
+                "deviation_mode": "center", "weight": 0.0,
+                "problem": "왼쪽 어깨 높이가 비대칭입니다",
+                "suggestion": "왼쪽 어깨의 긴장을 풀고 내려주세요"
+            },
+            {
+                "metric": "left_scapular_winging", "label": "왼쪽 견갑골 날개", "unit": "도", "region": "shoulder",
+                "flag": "is_left_scapular_winging_normal", "deviation": "left_scapular_winging_deviation",
+                "min": None, "max": 10.0,
+                "deviation_mode": "over_max", "weight": 0.0,
+                "problem": "왼쪽 견갑골이 들려 있습니다",
+                "suggestion": "날개뼈를 뒤로 모으고 아래로 내려주세요"
+            },
+            {
+                "metric": "right_scapular_winging", "label": "오른쪽 견갑골 날개", "unit": "도", "region": "shoulder",
+                "flag": "is_right_scapular_winging_normal", "deviation": "right_scapular_winging_deviation",
+                "min": None, "max": 10.0,
+                "deviation_mode": "over_max", "weight": 0.0,
+                "problem": "오른쪽 견갑골이 들려 있습니다",
+                "suggestion": "날개뼈를 뒤로 모으고 아래로 내려주세요"
+            },
+            {
+                "metric": "shoulder_forward_movement", "label": "어깨 전방 이동", "unit": "도", "region": "shoulder",
+                "flag": "is_shoulder_forward_movement_normal", "deviation": "shoulder_forward_movement_deviation",
+                "min": None, "max": 15.0,
+                "deviation_mode": "over_max", "weight": 0.0,
+                "problem": "어깨가 앞으로 말려 있습니다",
+                "suggestion": "가슴을 펴고 어깨를 뒤로 당겨주세요"
+            },
+            {
+                "metric": "head_rotation", "label": "머리 회전", "unit": "도", "region": "neck",
+                "flag": "is_head_rotation_normal", "deviation": "head_rotation_deviation",
+                "min": -15.0, "max": 15.0,
+                "deviation_mode": "center", "weight": 0.0,
+                "problem": "머리가 한쪽으로 돌아가 있습니다",
+                "suggestion": "정면을 바라봐주세요"
+            },
+        ]
+    }
+
+
+def load_ruleset(path: Optional[str] = None) -> Dict:
+    """규칙 세트 로드 (path가 있으면 JSON 파일, 없으면 기본 규칙 세트)"""
+    if not path:
+        return default_ruleset()
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
@@ -0,0 +1,257 @@
+"""
+Posture Check App Backend - 합성 자세 데이터 생성기
+
+벤치마크와 용량 산정을 위해 실제와 비슷한 분포의 사용자별 자세 측정 스트림을 생성합니다.
+- 사용자별 기준값: 13개 지표마다 모집단 평균 주변의 개인 기준값 (자세 습관)
+- 측정 세션: 하루 세션 수(주말 감소), 시작 시각(오전/오후/저녁 업무 시간대 가중치),
+  세션 길이(로그 정규분포), sample_interval초마다 측정 1건
+- 세션 내 변화: 시간이 지날수록 목 숙임/전방 머리/어깨 말림이 커지는 피로 누적,
+  늦은 시각일수록 더 큰 피로, 세션 단위 컨디션 차이와 측정 잡음
+- 장기 추세: 사용자별로 기간에 걸쳐 자세가 좋아지거나 나빠짐
+- 정상 여부와 issues는 분석 엔진(analyze_arrays)으로 판단하여
+  save_posture_data가 저장하는 형식("문제점, 문제점")과 같게 생성
+- 측정 세션 행(posture_sessions): 생성한 기록을 세션별로 합산한 누적 집계 (SessionTotals)
+
+사용자별 난수는 (seed, user_id)로 정해지므로 워커 프로세스 수나 분할 방식과 관계없이 같은 데이터가 생성됩니다.
+생성/적재 CLI는 generate_posture_data.py를 사용합니다.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterator, List, Sequence
+
+import numpy as np
+
+from .posture_analysis import posture_analysis_engine
+
+# 지표별 (모집단 평균, 사용자 간 표준편차, 측정 잡음 표준편차, 세션 1시간당 피로 변화량)
+# 평균이 0인 좌우 대칭 지표는 사용자 기준값이 치우친 방향으로 피로 변화가 누적됨
+METRIC_PROFILES: Dict[str, tuple] = {
+    "neck_angle": (12.0, 8.0, 3.0, 8.0),
+    "shoulder_slope": (0.0, 2.0, 0.8, 0.8),
+    "head_forward": (6.0, 4.0, 1.5, 5.0),
+    "shoulder_height_diff": (0.0, 7.0, 2.0, 2.0),
+    "cervical_lordosis": (35.0, 5.0, 1.5, 4.0),
+    "forward_head_distance": (70.0, 15.0, 5.0, 25.0),
+    "head_tilt": (0.0, 4.0, 1.5, 2.0),
+    "left_shoulder_height_diff": (0.0, 6.0, 2.0, 2.0),
+    "left_scapular_winging": (4.0, 2.0, 0.8, 2.0),
+    "right_scapular_winging": (4.0, 2.0, 0.8, 2.0),
+    "shoulder_forward_movement": (7.0, 3.0, 1.2, 5.0),
+    "head_rotation": (0.0, 4.0, 2.0, 1.5),
+}
+
+# 종합 점수 감점 (지표, 이상적인 값, 감점 1점당 변화량)
+SCORE_PENALTIES = (
+    ("neck_angle", 5.0, 1.5),
+    ("forward_head_distance", 50.0, 6.0),
+    ("head_forward", 0.0, 2.0),
+    ("shoulder_forward_movement", 3.0, 2.0),
+    ("head_tilt", 0.0, 1.5),
+    ("shoulder_height_diff", 0.0, 4.0),
+    ("cervical_lordosis", 35.0, 3.0),
+)
+
+# 시각별 세션 시작 가중치 (0~23시, 오전/오후 업무 시간과 저녁에 집중)
+HOURLY_WEIGHTS = np.array([
+    0.2, 0.1, 0.05, 0.05, 0.05, 0.1, 0.3, 0.8, 1.5, 2.5, 3.0, 2.5,
+    1.5, 2.0, 2.8, 3.0, 2.8, 2.2, 1.5, 1.2, 1.8, 2.0, 1.5, 0.6
+])
+HOURLY_WEIGHTS = HOURLY_WEIGHTS / HOURLY_WEIGHTS.sum()
+
+DEVICES = ("Chrome / Windows", "Chrome / macOS", "Safari / macOS", "Edge / Windows", "Chrome / Android")
+
+# posture_records 컬럼 순서 (INSERT / LOAD DATA 파일 공통)
+RECORD_COLUMNS = (
+    "user_id", *METRIC_PROFILES.keys(), "score",
+    "session_id", "device_info", "issues",
+    "is_neck_angle_normal", "is_forward_head_normal", "is_head_tilt_normal",
+    "created_at",
+)
+
+# posture_sessions 컬럼 순서 (INSERT / LOAD DATA 파일 공통, 생성한 세션은 모두 종료 상태)
+SESSION_COLUMNS = (
+    "session_id", "user_id", "device_info", "start_time", "end_time", "is_active",
+    "total_records", "score_sum", "all_normal_count", "average_score", "last_record_at", "duration_seconds",
+)
+
+
+class PostureDataGenerator:
+    def __init__(self, start: datetime, days: int, sample_interval: float = 5.0, seed: int = 42):
+        self.start = start
+        self.days = days
+        self.sample_interval = sample_interval
+        self.seed = seed
+
+    def profile(self, rng: np.random.Generator) -> Dict:
+        """사용자별 기준값과 측정 습관"""
+        return {
+            "baseline": {
+                metric: mean + rng.normal(0, between_sd)
+                for metric, (mean, between_sd, _, _) in METRIC_PROFILES.items()
+            },
+            "sessions_per_day": 0.3 + rng.gamma(2.0, 0.85),  # 평균 2회
+            "session_minutes": rng.lognormal(np.log(20), 0.4),
+            "fatigue": rng.lognormal(0, 0.4),             # 피로 누적 정도
+            "trend": rng.normal(0, 0.3),                  # 기간 전체의 기준값 편차 변화율 (음수면 개선)
+            "device": DEVICES[rng.integers(len(DEVICES))],
+        }
+
+    def generate_user(self, user_id: int) -> Dict[str, np.ndarray]:
+        """사용자 1명의 기간 전체 측정 데이터 (RECORD_COLUMNS → 배열, created_at 순)"""
+        rng = np.random.default_rng([self.seed, user_id])
+        profile = self.profile(rng)
+
+        # 세션: 날짜별 세션 수 (주말은 60%), 시작 시각, 길이
+        day_index = np.arange(self.days)
+        weekend = (self.start.weekday() + day_index) % 7 >= 5
+        counts = rng.poisson(profile["sessions_per_day"] * np.where(weekend, 0.6, 1.0))
+        session_day = np.repeat(day_index, counts)
+        session_count = len(session_day)
+        if session_count == 0:
+            return {column: np.array([]) for column in RECORD_COLUMNS}
+        start_hour = rng.choice(24, size=session_count, p=HOURLY_WEIGHTS) + rng.random(session_count)
+        minutes = np.clip(rng.lognormal(np.log(profile["session_minutes"]), 0.5, session_count), 3, 180)
+        frames = np.maximum(1, (minutes * 60 // self.sample_interval).astype(np.int64))
+
+        # 측정 1건 단위로 펼치기
+        session = np.repeat(np.arange(session_count), frames)
+        frame = np.arange(len(session)) - np.repeat(np.cumsum(frames) - frames, frames)
+        elapsed = frame * self.sample_interval
+        seconds = session_day[session] * 86400.0 + start_hour[session] * 3600.0 + elapsed
+        count = len(session)
+
+        # 피로: 세션 경과 시간 + 늦은 시각(8시 이후 시간당 누적)
+        late = np.clip(start_hour[session] - 8, 0, 16) / 16
+        fatigue = profile["fatigue"] * (np.minimum(elapsed / 3600.0, 2.0) + 0.3 * late)
+        progress = session_day[session] / max(self.days - 1, 1)
+
+        columns: Dict[str, np.ndarray] = {"user_id": np.full(count, user_id, dtype=np.int64)}
+        for metric, (mean, _, noise_sd, drift) in METRIC_PROFILES.items():
+            baseline = profile["baseline"][metric]
+            offset = (baseline - mean) * (1 + profile["trend"] * progress)
+            direction = np.sign(baseline) if mean == 0 else 1.0
+            session_noise = rng.normal(0, noise_sd, session_count)[session]
+            columns[metric] = np.round(
+                mean + offset + direction * drift * fatigue + session_noise + rng.normal(0, noise_sd, count), 2
+            )
+        columns["left_scapular_winging"] = np.abs(columns["left_scapular_winging"])
+        columns["right_scapular_winging"] = np.abs(columns["right_scapular_winging"])
+
+        penalty = sum(np.abs(columns[metric] - ideal) / scale for metric, ideal, scale in SCORE_PENALTIES)
+        columns["score"] = np.round(np.clip(100 - penalty + rng.normal(0, 3, count), 0, 100), 1)
+
+        # 분석 엔진으로 정상 여부 / 문제점 판단
+        analysis = posture_analysis_engine.analyze_arrays({metric: columns[metric] for metric in posture_analysis_engine.metrics})
+        for flag in ("is_neck_angle_normal", "is_forward_head_normal", "is_head_tilt_normal"):
+            columns[flag] = analysis[flag]
+        columns["issues"] = np.array(
+            [", ".join(problems) for problems in posture_analysis_engine.problems_for(analysis["problem_mask"])],
+            dtype=object
+        )
+
+        session_start = np.datetime64(self.start, "s") + (session_day * 86400 + start_hour * 3600).astype("timedelta64[s]")
+        columns["session_id"] = np.array([f"{user_id}-{int(value)}" for value in session_start.astype(np.int64)], dtype=object)[session]
+        columns["device_info"] = np.full(count, profile["device"], dtype=object)
+        columns["created_at"] = np.datetime64(self.start, "us") + (seconds * 1e6).astype("timedelta64[us]")
+
+        order = np.argsort(columns["created_at"], kind="stable")
+        return {column: columns[column][order] for column in RECORD_COLUMNS}
+
+    def iter_chunks(self, user_ids: Sequence[int], chunk_size: int) -> Iterator[Dict[str, np.ndarray]]:
+        """여러 사용자의 데이터를 chunk_size행 이하 단위로 생성"""
+        pending: List[Dict[str, np.ndarray]] = []
+        pending_rows = 0
+        for user_id in user_ids:
+            columns = self.generate_user(user_id)
+            if len(columns["user_id"]) == 0:
+                continue
+            pending.append(columns)
+            pending_rows += len(columns["user_id"])
+            while pending_rows >= chunk_size:
+                merged = _concat(pending)
+                yield {column: values[:chunk_size] for column, values in merged.items()}
+                pending = [{column: values[chunk_size:] for column, values in merged.items()}]
+                pending_rows -= chunk_size
+        if pending_rows:
+            yield _concat(pending)
+
+
+def _concat(parts: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    if len(parts) == 1:
+        return parts[0]
+    return {column: np.concatenate([part[column] for part in parts]) for column in RECORD_COLUMNS}
+
+
+class SessionTotals:
+    """
+    생성한 기록 청크를 세션별로 합산 (청크 경계에 걸친 세션도 이어서 합산)
+
+    rows()는 저장 경로가 증분 갱신하는 것과 같은 posture_sessions 누적 컬럼 값을 반환
+    (시작/종료 시간은 세션의 첫/마지막 기록 시간)
+    """
+
+    def __init__(self):
+        # session_id → [user_id, device_info, 기록 수, 점수 합계, 모두 정상 수, 첫 기록(us), 마지막 기록(us)]
+        self._totals: Dict[str, list] = {}
+
+    def add(self, columns: Dict[str, np.ndarray]) -> None:
+        if len(columns["session_id"]) == 0:
+            return
+        keys, first_index, inverse = np.unique(
+            columns["session_id"].astype(str), return_index=True, return_inverse=True
+        )
+        counts = np.bincount(inverse)
+        score_sums = np.bincount(inverse, weights=columns["score"])
+        all_normal = columns["is_neck_angle_normal"] & columns["is_forward_head_normal"] & columns["is_head_tilt_normal"]
+        normal_counts = np.bincount(inverse, weights=all_normal)
+        timestamps = columns["created_at"].astype("datetime64[us]").astype(np.int64)
+        first = np.full(len(keys), np.iinfo(np.int64).max)
+        last = np.full(len(keys), np.iinfo(np.int64).min)
+        np.minimum.at(first, inverse, timestamps)
+        np.maximum.at(last, inverse, timestamps)
+
+        for index, session_id in enumerate(keys.tolist()):
+            total = self._totals.get(session_id)
+            if total is None:
+                row = first_index[index]
+                self._totals[session_id] = [
+                    int(columns["user_id"][row]), columns["device_info"][row], int(counts[index]),
+                    float(score_sums[index]), int(normal_counts[index]), int(first[index]), int(last[index])
+                ]
+                continue
+            total[2] += int(counts[index])
+            total[3] += float(score_sums[index])
+            total[4] += int(normal_counts[index])
+            total[5] = min(total[5], int(first[index]))
+            total[6] = max(total[6], int(last[index]))
+
+    def rows(self) -> List[Dict]:
+        rows = []
+        for session_id, (user_id, device_info, count, score_sum, normal_count, first, last) in self._totals.items():
+            start_time = _from_microseconds(first)
+            end_time = _from_microseconds(last)
+            rows.append({
+                "session_id": session_id,
+                "user_id": user_id,
+                "device_info": device_info,
+                "start_time": start_time,
+                "end_time": end_time,
+                "is_active": False,
+                "total_records": count,
+                "score_sum": score_sum,
+                "all_normal_count": normal_count,
+                "average_score": score_sum / count,
+                "last_record_at": end_time,
+                "duration_seconds": int((end_time - start_time).total_seconds())
+            })
+        return rows
+
+
+def _from_microseconds(value: int) -> datetime:
+    return np.datetime64(value, "us").astype(datetime)
+
+
+def to_rows(columns: Dict[str, np.ndarray]) -> List[Dict]:
+    """배열 묶음을 INSERT용 행 목록으로 변환 (NumPy 값은 Python 기본 타입으로)"""
+    values = [columns[column].tolist() for column in RECORD_COLUMNS]
+    return [dict(zip(RECORD_COLUMNS, row)) for row in zip(*values)]
@@ -0,0 +1,226 @@
+"""
+Posture Check App Backend - 요청별 SQL 프로파일링 / 쿼리 예산
+
+User의 posture_sessions / posture_records / posture_analyses 관계는 지연 로딩이고
+응답 모델은 from_attributes를 사용하므로, 응답 모델이나 직렬화 코드를 조금만 바꿔도
+사용자 전체 기록을 불러오는 N+1 쿼리가 생길 수 있습니다.
+이를 잡기 위해 요청마다 SQL 실행 횟수와 DB 시간을 집계합니다. (QUERY_PROFILING_ENABLED)
+- 응답 헤더: X-DB-Query-Count, X-DB-Time-Ms, (예산이 있는 라우트는) X-DB-Query-Budget
+- 라우트 템플릿별 최대 SQL 실행 횟수(QUERY_BUDGETS)를 넘으면 경고 로그를 남기고,
+  QUERY_BUDGET_STRICT이면 응답 대신 500을 반환 (테스트/스테이징, benchmarks/check_query_budgets.py)
+- 스트리밍 응답은 응답 시작 전까지의 쿼리로 헤더/엄격 모드를 판단하고,
+  응답이 끝난 뒤 전체 쿼리 수가 예산을 넘으면 위반으로 기록
+
+엔드포인트를 추가하거나 쿼리 수가 바뀌면 QUERY_BUDGETS도 함께 수정합니다.
+"""
+
+import json
+import logging
+import threading
+from collections import deque
+from typing import Dict, List, Optional
+
+from starlette.datastructures import MutableHeaders
+
+from .config import settings
+from .metrics import RequestStats, current_request_stats, instrument_engine, route_template
+
+logger = logging.getLogger(__name__)
+
+_API = settings.API_V1_STR
+
+# 라우트별 최대 SQL 실행 횟수 ("메서드 라우트 템플릿": 횟수)
+# 인증 의존성(get_current_user)은 인증 캐시가 비어 있을 때 기준 (사용자 조회 1회 포함)
+QUERY_BUDGETS: Dict[str, int] = {
+    # 자세 데이터 (endpoints/posture.py)
+    f"POST {_API}/posture/save": 4,
+    f"POST {_API}/posture/save/batch": 3,
+    f"GET {_API}/posture/write-buffer": 0,
+    f"GET {_API}/posture/analysis-worker": 0,
+    f"GET {_API}/posture/cache": 0,
+    f"POST {_API}/posture/analysis/start": 3,
+    f"POST {_API}/posture/analysis/stop": 3,
+    f"GET {_API}/posture/analysis/sessions": 1,
+    f"GET {_API}/posture/sessions": 1,
+    f"GET {_API}/posture/sessions/{{session_id}}": 1,
+    f"POST {_API}/posture/record": 4,
+    f"GET {_API}/posture/records": 1,
+    f"GET {_API}/posture/records/page": 1,
+    f"GET {_API}/posture/records/summary": 2,
+    f"GET {_API}/posture/records/stream": 1,
+    f"GET {_API}/posture/records/{{record_id}}/analysis": 1,
+    f"GET {_API}/posture/export": 1,
+    f"GET {_API}/posture/stats": 1,
+    f"GET {_API}/posture/trends": 1,
+    f"POST {_API}/posture/analyze": 0,
+    f"POST {_API}/posture/analyze/batch": 0,
+    f"GET {_API}/posture/medical-standards": 0,
+    # 사용자 (endpoints/user.py)
+    f"POST {_API}/users/login": 1,
+    f"POST {_API}/users/check-password": 1,
+    f"POST {_API}/users/forgot-password": 1,
+    f"POST {_API}/users/reset-password": 3,
+    f"POST {_API}/users/register": 4,
+    f"GET {_API}/users/me": 1,
+    f"GET {_API}/users/{{user_id}}": 1,
+    f"PUT {_API}/users/me": 4,
+    f"GET {_API}/users/": 1,
+    f"DELETE {_API}/users/me": 7,
+}
+
+
+class QueryBudgetTracker:
+    def __init__(self, budgets: Dict[str, int], recent_size: int = 50):
+        self.budgets = budgets
+        self._recent = deque(maxlen=recent_size)
+        self._lock = threading.Lock()
+
+        # 카운터
+        self.requests = 0
+        self.violations = 0
+
+    def budget_for(self, method: str, route: str) -> Optional[int]:
+        """라우트의 쿼리 예산 (없으면 None)"""
+        return self.budgets.get(f"{method} {route}")
+
+    def record(self, method: str, route: str, stats: RequestStats) -> Optional[int]:
+        """요청 1건 집계 후 예산을 넘었으면 위반으로 기록 (반환값: 예산)"""
+        budget = self.budget_for(method, route)
+        with self._lock:
+            self.requests += 1
+        if budget is not None and stats.queries > budget:
+            self.record_violation(method, route, stats, budget)
+        return budget
+
+    def record_violation(self, method: str, route: str, stats: RequestStats, budget: int) -> None:
+        with self._lock:
+            self.violations += 1
+            self._recent.append({
+                "route": f"{method} {route}",
+                "queries": stats.queries,
+                "budget": budget,
+                "db_ms": round(stats.db_seconds * 1000, 2)
+            })
+        logger.warning(
+            "쿼리 예산 초과: %s %s %d회 (예산 %d회)", method, route, stats.queries, budget,
+            extra={"route": route, "queries": stats.queries, "budget": budget}
+        )
+
+    def recent_violations(self) -> List[Dict]:
+        with self._lock:
+            return list(self._recent)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.violations = 0
+            self._recent.clear()
+
+    def get_stats(self) -> Dict:
+        """집계 요청 수 / 위반 수 / 최근 위반 목록 반환"""
+        with self._lock:
+            return {
+                "enabled": settings.QUERY_PROFILING_ENABLED,
+                "strict": settings.QUERY_BUDGET_STRICT,
+                "budgets": len(self.budgets),
+                "requests": self.requests,
+                "violations": self.violations,
+                "recent_violations": list(self._recent)
+            }
+
+
+# 쿼리 예산 집계 인스턴스
+query_budget_tracker = QueryBudgetTracker(QUERY_BUDGETS)
+
+
+class QueryProfilerMiddleware:
+    """
+    요청별 SQL 실행 횟수 / DB 시간 응답 헤더 추가 및 쿼리 예산 검사 (ASGI 미들웨어)
+
+    strict=True이면 예산을 넘은 요청의 응답을 500으로 바꿈
+    """
+
+    def __init__(self, app, strict: bool = False, tracker: QueryBudgetTracker = query_budget_tracker):
+        self.app = app
+        self.strict = strict
+        self.tracker = tracker
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # 바깥 미들웨어(성능 지표)가 이미 만든 통계가 있으면 함께 사용
+        stats = current_request_stats.get()
+        token = None
+        if stats is None:
+            stats = RequestStats()
+            token = current_request_stats.set(stats)
+
+        method = scope["method"]
+        queries_at_start: Optional[int] = None
+        rejected = False
+
+        async def send_wrapper(message):
+            nonlocal queries_at_start, rejected
+            if rejected:
+                return
+            if message["type"] == "http.response.start":
+                queries_at_start = stats.queries
+                route = route_template(scope)
+                budget = self.tracker.record(method, route, stats)
+                profile_headers = [
+                    ("X-DB-Query-Count", str(stats.queries)),
+                    ("X-DB-Time-Ms", f"{stats.db_seconds * 1000:.2f}")
+                ]
+                if budget is not None:
+                    profile_headers.append(("X-DB-Query-Budget", str(budget)))
+
+                if self.strict and budget is not None and stats.queries > budget:
+                    rejected = True
+                    body = json.dumps(
+                        {"detail": f"쿼리 예산 초과: {method} {route} {stats.queries}회 (예산 {budget}회)"},
+                        ensure_ascii=False
+                    ).encode("utf-8")
+                    headers = MutableHeaders(raw=[])
+                    headers["content-type"] = "application/json"
+                    headers["content-length"] = str(len(body))
+                    for name, value in profile_headers:
+                        headers[name] = value
+                    await send({"type": "http.response.start", "status": 500, "headers": headers.raw})
+                    await send({"type": "http.response.body", "body": body})
+                    return
+
+                headers = MutableHeaders(scope=message)
+                for name, value in profile_headers:
+                    headers.append(name, value)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if token is not None:
+                current_request_stats.reset(token)
+
+        # 스트리밍 응답: 응답 시작 후 실행된 쿼리까지 포함하여 다시 확인
+        if queries_at_start is not None and stats.queries > queries_at_start:
+            route = route_template(scope)
+            budget = self.tracker.budget_for(method, route)
+            if budget is not None and queries_at_start <= budget < stats.queries:
+                self.tracker.record_violation(method, route, stats, budget)
+
+
+_setup_done = False
+
+
+def setup_query_profiling() -> None:
+    """DB 엔진 계측 (성능 지표와 같은 이벤트 리스너 사용, 여러 번 호출해도 한 번만 등록)"""
+    global _setup_done
+    if _setup_done:
+        return
+    _setup_done = True
+
+    from ..db.session import engine, async_engine
+
+    instrument_engine(engine)
+    instrument_engine(async_engine.sync_engine)
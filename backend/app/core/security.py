@@ -1,19 +1,33 @@
+import time
 from datetime import datetime, timedelta
 from typing import Any, Union, Optional
 from jose import jwt
-from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
 from .config import settings
+from .cache import MemoryCache, user_namespace
+from .metrics import password_hash_duration
+from .password_hasher import pwd_context, password_hasher, PasswordHasherBusyError
 from ..db.session import get_db
 
-# 비밀번호 해싱 컨텍스트
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 # JWT Bearer 토큰 스키마
 security = HTTPBearer()
 
+# 인증 캐시 (프로세스 내)
+# - token_cache: 토큰 → subject, 토큰의 exp까지 유지 (서명 검증 생략)
+# - principal_cache: subject → 사용자 컬럼 값, 짧은 TTL 동안 유지 (DB 조회 생략)
+#   사용자 정보 변경/삭제 시 invalidate_principal로 무효화 (네임스페이스: 사용자 ID)
+token_cache = MemoryCache(
+    max_entries=settings.AUTH_TOKEN_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+)
+principal_cache = MemoryCache(
+    max_entries=settings.AUTH_PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AUTH_PRINCIPAL_CACHE_TTL_SECONDS
+)
+
 def create_access_token(
     subject: Union[str, Any], expires_delta: timedelta = None
 ) -> str:
@@ -59,29 +73,94 @@ def verify_password_reset_token(token: str) -> Optional[str]:
         return None
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """비밀번호 검증"""
-    return pwd_context.verify(plain_password, hashed_password)
+    """비밀번호 검증 (해싱 워커 풀에서 실행, 대기열이 가득 차면 PasswordHasherBusyError)"""
+    started = time.perf_counter()
+    result = password_hasher.verify(plain_password, hashed_password)
+    password_hash_duration.observe(time.perf_counter() - started, "verify")
+    return result
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (비동기 엔드포인트용)"""
+    started = time.perf_counter()
+    result = await password_hasher.verify_async(plain_password, hashed_password)
+    password_hash_duration.observe(time.perf_counter() - started, "verify")
+    return result
 
 def get_password_hash(password: str) -> str:
-    """비밀번호 해싱"""
-    return pwd_context.hash(password)
+    """비밀번호 해싱 (해싱 워커 풀에서 실행, 대기열이 가득 차면 PasswordHasherBusyError)"""
+    started = time.perf_counter()
+    result = password_hasher.hash(password)
+    password_hash_duration.observe(time.perf_counter() - started, "hash")
+    return result
 
 def verify_token(token: str) -> Optional[str]:
-    """JWT 토큰 검증"""
+    """JWT 토큰 검증 (검증된 토큰은 만료 시각까지 캐시)"""
+    if settings.AUTH_CACHE_ENABLED:
+        hit, username = token_cache.get(token)
+        if hit:
+            return username
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
         username: str = payload.get("sub")
         if username is None:
             return None
-        return username
     except jwt.JWTError:
         return None
+    
+    if settings.AUTH_CACHE_ENABLED and payload.get("exp") is not None:
+        remaining = payload["exp"] - time.time()
+        if remaining > 0:
+            token_cache.set(token, username, ttl_seconds=remaining)
+    return username
+
+# 사용자 정보 조회의 무효화 세대를 확인하는 공용 네임스페이스
+# (조회 전에는 사용자 ID를 모르므로, 어떤 사용자든 무효화되면 진행 중인 조회 결과를 저장하지 않음)
+PRINCIPAL_LOAD_NAMESPACE = "principals"
+
+def invalidate_principal(user_id: int) -> None:
+    """사용자 정보 캐시 무효화 (사용자 정보 변경/삭제 시 호출)"""
+    principal_cache.invalidate(user_namespace(user_id))
+    principal_cache.invalidate(PRINCIPAL_LOAD_NAMESPACE)
+
+def _load_principal(db: Session, username: str):
+    """
+    사용자명으로 사용자 조회 (캐시 적중 시 DB 조회 없음)
+    
+    캐시에는 컬럼 값만 저장하고, 적중 시 요청마다 새 인스턴스를 만들어
+    현재 세션에 영속 상태로 연결하므로 요청 간에 ORM 객체를 공유하지 않음
+    """
+    # 순환 import 방지를 위해 함수 내에서 import
+    from ..crud.user import user as user_crud
+    
+    if not settings.AUTH_CACHE_ENABLED:
+        return user_crud.get_by_username(db, username=username)
+    
+    hit, values = principal_cache.get(username)
+    if hit:
+        user = user_crud.model(**values)
+        make_transient_to_detached(user)
+        db.add(user)
+        return user
+    
+    # 조회 중에 사용자 정보가 변경/삭제되면 (비활성화 이전 값일 수 있으므로) 캐시에 저장하지 않음
+    generation = principal_cache.begin_load(PRINCIPAL_LOAD_NAMESPACE)
+    try:
+        user = user_crud.get_by_username(db, username=username)
+        if user is not None:
+            values = {attr.key: getattr(user, attr.key) for attr in inspect(user).mapper.column_attrs}
+            principal_cache.set(
+                username, values, namespace=user_namespace(user.id),
+                generation=generation, generation_namespace=PRINCIPAL_LOAD_NAMESPACE
+            )
+    finally:
+        principal_cache.end_load(PRINCIPAL_LOAD_NAMESPACE)
+    return user
 
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ):
-    """현재 인증된 사용자 조회"""
+    """현재 인증된 사용자 조회 (토큰/사용자 정보는 인증 캐시 사용)"""
     # 순환 import 방지를 위해 함수 내에서 import
     from ..crud.user import user as user_crud
     
@@ -94,7 +173,7 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    user = user_crud.get_by_username(db, username=username)
+    user = _load_principal(db, username)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -0,0 +1,223 @@
+"""
+Posture Check App Backend - 실시간 분석 세션 저장소
+
+/analysis/start에서 저장하고 실시간 스트리밍(WebSocket) 연결 시 조회하는 활성 세션 정보를 관리합니다.
+세션 상태의 기준은 posture_sessions 테이블이며, 이 저장소는 연결마다 DB를 조회하지 않기 위한 캐시입니다.
+- SessionStore: 세션 저장소 인터페이스 (주기적 만료 정리 스레드 포함)
+- MemorySessionStore: 프로세스 내 저장소 (단일 워커용, 기본값)
+- RedisSessionStore: Redis 호환 저장소 (여러 워커가 세션을 공유, redis 패키지 필요)
+
+활성 세션은 저장 후 SESSION_IDLE_TTL_SECONDS, 중지된 세션은 SESSION_STOPPED_TTL_SECONDS 후 삭제됩니다.
+(만료된 활성 세션은 WebSocket 연결 시 posture_sessions에서 다시 채움)
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SessionStore:
+    """세션 저장소 인터페이스"""
+
+    def __init__(self, idle_ttl_seconds: float, stopped_ttl_seconds: float, sweep_interval_seconds: float):
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self.stopped_ttl_seconds = stopped_ttl_seconds
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self._stop_event = threading.Event()
+        self._sweeper: Optional[threading.Thread] = None
+
+    def create(self, session: Dict) -> None:
+        """세션 생성 (session_id, user_id, start_time, device_info, analysis_interval 포함)"""
+        raise NotImplementedError
+
+    def get(self, session_id: str) -> Optional[Dict]:
+        raise NotImplementedError
+
+    def stop(self, session_id: str) -> Optional[Dict]:
+        """세션 중지 후 최종 세션 정보 반환 (없으면 None)"""
+        raise NotImplementedError
+
+    def sweep(self) -> int:
+        """만료된 세션 삭제 후 삭제 건수 반환"""
+        raise NotImplementedError
+
+    def start_sweeper(self) -> None:
+        """주기적 만료 정리 스레드 시작"""
+        if self._sweeper is not None and self._sweeper.is_alive():
+            return
+        self._stop_event.clear()
+        self._sweeper = threading.Thread(target=self._sweep_loop, name="session-store-sweeper", daemon=True)
+        self._sweeper.start()
+
+    def stop_sweeper(self) -> None:
+        self._stop_event.set()
+        if self._sweeper is not None:
+            self._sweeper.join()
+            self._sweeper = None
+
+    def _sweep_loop(self) -> None:
+        while not self._stop_event.wait(self.sweep_interval_seconds):
+            try:
+                self.sweep()
+            except Exception:
+                logger.exception("세션 만료 정리 실패")
+
+    @staticmethod
+    def _new_session(session: Dict) -> Dict:
+        return {
+            **session,
+            "status": "active",
+            "end_time": None
+        }
+
+
+class MemorySessionStore(SessionStore):
+    """프로세스 내 세션 저장소 (TTL 만료 + 주기적 정리)"""
+
+    def __init__(self, idle_ttl_seconds: float, stopped_ttl_seconds: float, sweep_interval_seconds: float):
+        super().__init__(idle_ttl_seconds, stopped_ttl_seconds, sweep_interval_seconds)
+        self._sessions: Dict[str, Dict] = {}
+        self._expires_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def create(self, session: Dict) -> None:
+        with self._lock:
+            self._sessions[session["session_id"]] = self._new_session(session)
+            self._expires_at[session["session_id"]] = time.monotonic() + self.idle_ttl_seconds
+
+    def get(self, session_id: str) -> Optional[Dict]:
+        with self._lock:
+            if not self._is_alive(session_id):
+                return None
+            return dict(self._sessions[session_id])
+
+    def stop(self, session_id: str) -> Optional[Dict]:
+        with self._lock:
+            if not self._is_alive(session_id):
+                return None
+            session = self._sessions[session_id]
+            if session["status"] == "active":
+                session["status"] = "stopped"
+                session["end_time"] = datetime.now()
+                self._expires_at[session_id] = time.monotonic() + self.stopped_ttl_seconds
+            return dict(session)
+
+    def sweep(self) -> int:
+        with self._lock:
+            now = time.monotonic()
+            expired = [session_id for session_id, expires_at in self._expires_at.items() if expires_at <= now]
+            for session_id in expired:
+                self._sessions.pop(session_id, None)
+                self._expires_at.pop(session_id, None)
+            return len(expired)
+
+    def _is_alive(self, session_id: str) -> bool:
+        expires_at = self._expires_at.get(session_id)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            self._sessions.pop(session_id, None)
+            self._expires_at.pop(session_id, None)
+            return False
+        return True
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Redis 호환 세션 저장소 (여러 워커 간 공유)
+
+    세션은 해시(prefix + session_id)로 저장하고 만료는 Redis TTL에 맡김 (정리 스레드가 할 일 없음)
+    """
+
+    DATETIME_FIELDS = ("start_time", "end_time")
+    INT_FIELDS = ("user_id", "analysis_interval")
+
+    def __init__(
+        self,
+        url: str,
+        idle_ttl_seconds: float,
+        stopped_ttl_seconds: float,
+        sweep_interval_seconds: float,
+        prefix: str = "posture-session:"
+    ):
+        super().__init__(idle_ttl_seconds, stopped_ttl_seconds, sweep_interval_seconds)
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("Redis 세션 저장소를 사용하려면 redis 패키지를 설치해주세요 (pip install redis)") from e
+
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self.prefix = prefix
+
+    def create(self, session: Dict) -> None:
+        session_id = session["session_id"]
+        pipe = self.client.pipeline()
+        pipe.delete(self.prefix + session_id)
+        pipe.hset(self.prefix + session_id, mapping=self._dump(self._new_session(session)))
+        pipe.expire(self.prefix + session_id, int(self.idle_ttl_seconds))
+        pipe.execute()
+
+    def get(self, session_id: str) -> Optional[Dict]:
+        data = self.client.hgetall(self.prefix + session_id)
+        return self._load(data) if data else None
+
+    def stop(self, session_id: str) -> Optional[Dict]:
+        key = self.prefix + session_id
+        data = self.client.hgetall(key)
+        if not data:
+            return None
+        if data.get("status") == "active":
+            end_time = datetime.now().isoformat()
+            pipe = self.client.pipeline()
+            pipe.hset(key, mapping={"status": "stopped", "end_time": end_time})
+            pipe.expire(key, int(self.stopped_ttl_seconds))
+            pipe.execute()
+            data.update({"status": "stopped", "end_time": end_time})
+        return self._load(data)
+
+    def sweep(self) -> int:
+        # 세션 해시는 Redis TTL로 만료됨
+        return 0
+
+    def _dump(self, session: Dict) -> Dict:
+        return {
+            field: value.isoformat() if isinstance(value, datetime) else value
+            for field, value in session.items()
+            if value is not None
+        }
+
+    def _load(self, data: Dict) -> Dict:
+        session = dict(data)
+        for field in self.DATETIME_FIELDS:
+            session[field] = datetime.fromisoformat(session[field]) if session.get(field) else None
+        for field in self.INT_FIELDS:
+            if session.get(field) is not None:
+                session[field] = int(session[field])
+        session.setdefault("device_info", None)
+        return session
+
+
+def create_session_store() -> SessionStore:
+    """설정 값으로 세션 저장소 생성"""
+    if settings.SESSION_STORE_BACKEND == "redis":
+        return RedisSessionStore(
+            settings.SESSION_STORE_REDIS_URL,
+            idle_ttl_seconds=settings.SESSION_IDLE_TTL_SECONDS,
+            stopped_ttl_seconds=settings.SESSION_STOPPED_TTL_SECONDS,
+            sweep_interval_seconds=settings.SESSION_SWEEP_INTERVAL_SECONDS
+        )
+    return MemorySessionStore(
+        idle_ttl_seconds=settings.SESSION_IDLE_TTL_SECONDS,
+        stopped_ttl_seconds=settings.SESSION_STOPPED_TTL_SECONDS,
+        sweep_interval_seconds=settings.SESSION_SWEEP_INTERVAL_SECONDS
+    )
+
+
+# 세션 저장소 인스턴스 (애플리케이션 시작 시 정리 스레드 시작)
+session_store = create_session_store()
@@ -1,27 +1,52 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
-from typing import List, Optional, Dict
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, and_, or_, case, insert, inspect, select
+from sqlalchemy.orm import aliased
+from starlette.concurrency import run_in_threadpool
+from typing import Iterator, List, Optional, Dict, Tuple
 from datetime import datetime, timedelta
+import base64
+import json
+import numpy as np
 from ..models.posture import PostureRecord, PostureSession, PostureAnalysis
 from ..schemas.posture import PostureRecordCreate, PostureAnalysisCreate
-from ..core.config import settings
+from ..core.cache import query_cache, user_namespace
+from ..core.metrics import posture_records_saved
+from ..core.posture_analysis import posture_analysis_engine
+from .posture_buffer import posture_write_buffer
+from .posture_partition import posture_partitions
+from .posture_rollup import posture_daily_rollup
+from .posture_session import posture_session
+from .posture_summary import posture_record_summary
+
+def encode_cursor(created_at: datetime, record_id: int) -> str:
+    """페이지 커서 생성 (마지막 기록의 (created_at, id)를 불투명 문자열로 인코딩)"""
+    raw = json.dumps([created_at.isoformat(), record_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """페이지 커서 해석 (형식이 잘못되면 ValueError)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, record_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), int(record_id)
+    except Exception as e:
+        raise ValueError("유효하지 않은 커서입니다") from e
 
 class CRUDPostureRecord:
-    def create(self, db: Session, user_id: int, obj_in: PostureRecordCreate) -> PostureRecord:
-        """자세 기록 생성"""
-        # 의학적 기준 판단
-        is_neck_angle_normal = (
-            settings.NECK_ANGLE_NORMAL_MIN <= obj_in.neck_angle <= settings.NECK_ANGLE_NORMAL_MAX
-        )
-        is_forward_head_normal = obj_in.forward_head_distance <= settings.FORWARD_HEAD_DISTANCE_MAX
-        is_head_tilt_normal = (
-            settings.HEAD_TILT_NORMAL_MIN <= obj_in.head_tilt <= settings.HEAD_TILT_NORMAL_MAX
-        )
+    def _build_values(self, user_id: int, obj_in: PostureRecordCreate, created_at: datetime) -> Dict:
+        """자세 기록 컬럼 값 구성 (의학적 기준 판단 포함)"""
+        # 의학적 기준 판단 (분석 규칙 세트 사용)
+        flags = posture_analysis_engine.evaluate_flags({
+            "neck_angle": obj_in.neck_angle,
+            "forward_head_distance": obj_in.forward_head_distance,
+            "head_tilt": obj_in.head_tilt
+        })
         
         # issues는 이미 문자열로 전달됨 (API에서 변환됨)
         issues_data = obj_in.issues or ""
         
-        db_obj = PostureRecord(
+        return dict(
             user_id=user_id,
             neck_angle=obj_in.neck_angle,
             shoulder_slope=obj_in.shoulder_slope,
@@ -39,143 +64,514 @@ class CRUDPostureRecord:
             issues=issues_data,  # 새로운 필드
             session_id=obj_in.session_id,
             device_info=obj_in.device_info,
-            is_neck_angle_normal=is_neck_angle_normal,
-            is_forward_head_normal=is_forward_head_normal,
-            is_head_tilt_normal=is_head_tilt_normal,
-            created_at=datetime.now()  # 명시적으로 생성 시간 설정
+            is_neck_angle_normal=flags["is_neck_angle_normal"],
+            is_forward_head_normal=flags["is_forward_head_normal"],
+            is_head_tilt_normal=flags["is_head_tilt_normal"],
+            created_at=created_at  # 명시적으로 생성 시간 설정
         )
+    
+    def create(self, db: Session, user_id: int, obj_in: PostureRecordCreate) -> PostureRecord:
+        """
+        자세 기록 생성
+        
+        쓰기 지연 버퍼가 동작 중이면 큐에 넣고 저장 전 객체(id 없음)를 반환
+        (큐가 가득 차면 WriteBufferFullError 발생)
+        """
+        values = self._build_values(user_id, obj_in, datetime.now())
+        if posture_write_buffer.is_running:
+            posture_write_buffer.put(values)
+            return PostureRecord(**values)
+        
+        db_obj = self._insert(db, values)
+        query_cache.invalidate(user_namespace(user_id))
+        return db_obj
+    
+    def _insert(self, db: Session, values: Dict) -> PostureRecord:
+        """기록 1건 즉시 저장 (일일 집계/세션 집계 포함, 캐시 무효화는 호출자가 담당)"""
+        db_obj = PostureRecord(**values)
         db.add(db_obj)
+        posture_daily_rollup.apply(db, [values])
+        posture_session.apply(db, [values])
         db.commit()
         db.refresh(db_obj)
+        posture_records_saved.inc("direct")
         return db_obj
     
+    def create_multi(self, db: Session, items: List[Tuple[int, PostureRecordCreate]]) -> int:
+        """
+        자세 기록 일괄 생성
+        
+        ORM 객체를 만들지 않고 단일 트랜잭션에서 다중 행 INSERT로 저장
+        (items: (user_id, PostureRecordCreate) 목록, 반환값: 저장된 행 수)
+        """
+        if not items:
+            return 0
+        
+        rows = self._build_rows(items)
+        self._insert_rows(db, rows)
+        for user_id in {user_id for user_id, _ in items}:
+            query_cache.invalidate(user_namespace(user_id))
+        return len(rows)
+    
+    def _build_rows(self, items: List[Tuple[int, PostureRecordCreate]]) -> List[Dict]:
+        created_at = datetime.now()
+        return [self._build_values(user_id, obj_in, created_at) for user_id, obj_in in items]
+    
+    def _insert_rows(self, db: Session, rows: List[Dict]) -> None:
+        """다중 행 INSERT (일일 집계/세션 집계 포함, 캐시 무효화는 호출자가 담당)"""
+        try:
+            db.execute(insert(PostureRecord), rows)
+            posture_daily_rollup.apply(db, rows)
+            posture_session.apply(db, rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        posture_records_saved.inc("batch", amount=len(rows))
+    
     def get_by_user(
         self, 
         db: Session, 
         user_id: int, 
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        limit: int = 100
+        limit: int = 100,
+        resolution: str = "raw"
     ) -> List[PostureRecord]:
-        """사용자의 자세 기록 조회"""
-        query = db.query(PostureRecord).filter(PostureRecord.user_id == user_id)
+        """
+        사용자의 자세 기록 조회
+        
+        resolution="summary"이면 세션/분 단위 요약 행(PostureRecordSummary) 목록 (crud/posture_summary.py)
+        """
+        if resolution == "summary":
+            return posture_record_summary.get_by_user(db, user_id, start_date, end_date, limit)
+        records = self._records(db, start_date, end_date)
+        query = db.query(records).filter(*self._range_filter(records, user_id, start_date, end_date))
+        return query.order_by(records.created_at.desc(), records.id.desc()).limit(limit).all()
+    
+    def _records(self, db: Session, start_date: Optional[datetime], end_date: Optional[datetime]):
+        """
+        created_at 범위의 기록을 조회할 엔티티
         
+        MySQL/PostgreSQL은 PostureRecord (created_at 조건으로 DB가 파티션 제외),
+        SQLite에서 기간별 테이블이 겹치면 UNION ALL 서브쿼리 별칭 (crud/posture_partition.py)
+        """
+        source = posture_partitions.source(db, start_date, end_date)
+        return PostureRecord if source is PostureRecord.__table__ else aliased(PostureRecord, source)
+    
+    def _range_filter(self, records, user_id: int, start_date: Optional[datetime], end_date: Optional[datetime]) -> List:
+        conditions = [records.user_id == user_id]
         if start_date:
-            query = query.filter(PostureRecord.created_at >= start_date)
+            conditions.append(records.created_at >= start_date)
         if end_date:
-            query = query.filter(PostureRecord.created_at <= end_date)
+            conditions.append(records.created_at <= end_date)
+        return conditions
+    
+    def get_page(
+        self,
+        db: Session,
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[PostureRecord], Optional[str]]:
+        """
+        사용자의 자세 기록 커서 페이지 조회 (최신순)
+        
+        (created_at, id) 기준 keyset 페이지네이션으로 OFFSET 없이
+        (user_id, created_at) 인덱스를 따라 다음 페이지를 읽음
+        반환값: (기록 목록, 다음 페이지 커서 - 마지막 페이지면 None)
+        """
+        cursor_created_at = cursor_id = None
+        if cursor:
+            cursor_created_at, cursor_id = decode_cursor(cursor)
+        
+        records = self._records(db, start_date, cursor_created_at or end_date)
+        conditions = self._range_filter(records, user_id, start_date, end_date)
+        if cursor:
+            # created_at 상한을 별도 조건으로 두어 커서 이후 기간의 파티션은 읽지 않음
+            conditions.append(records.created_at <= cursor_created_at)
+            conditions.append(or_(
+                records.created_at < cursor_created_at,
+                and_(records.created_at == cursor_created_at, records.id < cursor_id)
+            ))
+        
+        # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+        rows = db.query(records).filter(*conditions).order_by(
+            records.created_at.desc(), records.id.desc()
+        ).limit(limit + 1).all()
         
-        return query.order_by(PostureRecord.created_at.desc()).limit(limit).all()
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
+    
+    def iter_by_user(
+        self,
+        db: Session,
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        chunk_size: int = 1000
+    ) -> Iterator[Dict]:
+        """
+        사용자의 자세 기록 전체를 최신순으로 순회 (컬럼 값 dict)
+        
+        서버 측 커서(stream_results)에서 chunk_size씩 가져오므로
+        기간이 길어도 전체 결과를 메모리에 올리지 않음
+        """
+        records = self._records(db, start_date, end_date)
+        stmt = select(inspect(records).selectable).where(
+            *self._range_filter(records, user_id, start_date, end_date)
+        ).order_by(
+            records.created_at.desc(), records.id.desc()
+        ).execution_options(stream_results=True, yield_per=chunk_size)
+        
+        for row in db.execute(stmt):
+            yield dict(row._mapping)
     
     def get_stats(self, db: Session, user_id: int, days: int = 30) -> Dict:
-        """자세 통계 조회"""
-        start_date = datetime.now() - timedelta(days=days)
+        """
+        자세 통계 조회
         
-        # 기본 통계
-        total_records = db.query(PostureRecord).filter(
-            and_(
-                PostureRecord.user_id == user_id,
-                PostureRecord.created_at >= start_date
-            )
-        ).count()
+        원본 기록 대신 일일 집계(posture_daily_rollups)에서 계산
+        기간 경계는 날짜 단위로 적용 (시작일 전체 포함)
+        """
+        now = datetime.now()
+        start_date = (now - timedelta(days=days)).date()
+        recent_start = (now - timedelta(days=7)).date()
+        previous_start = (now - timedelta(days=14)).date()
+        
+        rollups = posture_daily_rollup.get_range(db, user_id, min(start_date, previous_start))
+        
+        total_records = 0
+        score_sum = 0.0
+        normal_records = 0
+        last_measurement = None
+        recent_count = recent_sum = 0
+        previous_count = previous_sum = 0
+        for rollup in rollups:
+            if rollup.date >= start_date:
+                total_records += rollup.record_count
+                score_sum += rollup.score_sum
+                normal_records += rollup.all_normal_count
+                if last_measurement is None or rollup.last_created_at > last_measurement:
+                    last_measurement = rollup.last_created_at
+            if rollup.date >= recent_start:
+                recent_count += rollup.record_count
+                recent_sum += rollup.score_sum
+            elif rollup.date >= previous_start:
+                previous_count += rollup.record_count
+                previous_sum += rollup.score_sum
         
         if total_records == 0:
             return {
                 "total_records": 0,
                 "average_score": 0,
                 "improvement_rate": 0,
-                "normal_posture_rate": 0
+                "normal_posture_rate": 0,
+                "last_measurement": None
             }
         
-        # 평균 점수
-        avg_score = db.query(func.avg(PostureRecord.score)).filter(
-            and_(
-                PostureRecord.user_id == user_id,
-                PostureRecord.created_at >= start_date
-            )
-        ).scalar()
+        avg_score = score_sum / total_records
+        normal_rate = (normal_records / total_records) * 100
         
-        # 정상 자세 비율
-        normal_records = db.query(PostureRecord).filter(
-            and_(
-                PostureRecord.user_id == user_id,
-                PostureRecord.created_at >= start_date,
-                PostureRecord.is_neck_angle_normal == True,
-                PostureRecord.is_forward_head_normal == True,
-                PostureRecord.is_head_tilt_normal == True
-            )
-        ).count()
+        # 개선률 계산
+        recent_avg = recent_sum / recent_count if recent_count else 0
+        previous_avg = previous_sum / previous_count if previous_count else 0
+        improvement_rate = ((recent_avg - previous_avg) / previous_avg * 100) if previous_avg > 0 else 0
         
-        normal_rate = (normal_records / total_records) * 100 if total_records > 0 else 0
+        return {
+            "total_records": total_records,
+            "average_score": round(avg_score, 2) if avg_score else 0,
+            "improvement_rate": round(improvement_rate, 2),
+            "normal_posture_rate": round(normal_rate, 2),
+            "last_measurement": last_measurement
+        }
+    
+    def get_stats_from_records(self, db: Session, user_id: int, days: int = 30) -> Dict:
+        """
+        원본 자세 기록에서 통계 조회 (정확한 시각 경계, 집계 검증용)
         
-        # 개선률 계산
-        recent_start = datetime.now() - timedelta(days=7)
+        조건부 집계(CASE)로 통계 기간과 개선률 비교 구간(최근 7일/이전 7일)을
+        단일 쿼리에서 함께 계산
+        """
+        now = datetime.now()
+        start_date = now - timedelta(days=days)
+        recent_start = now - timedelta(days=7)
         previous_start = recent_start - timedelta(days=7)
+        records = self._records(db, min(start_date, previous_start), None)
         
-        recent_avg = db.query(func.avg(PostureRecord.score)).filter(
-            and_(
-                PostureRecord.user_id == user_id,
-                PostureRecord.created_at >= recent_start
-            )
-        ).scalar() or 0
+        in_period = records.created_at >= start_date
+        in_recent = records.created_at >= recent_start
+        in_previous = and_(
+            records.created_at >= previous_start,
+            records.created_at < recent_start
+        )
+        is_normal = and_(
+            records.is_neck_angle_normal == True,
+            records.is_forward_head_normal == True,
+            records.is_head_tilt_normal == True
+        )
         
-        previous_avg = db.query(func.avg(PostureRecord.score)).filter(
+        row = db.query(
+            func.sum(case((in_period, 1), else_=0)).label('total_records'),
+            func.avg(case((in_period, records.score))).label('avg_score'),
+            func.sum(case((and_(in_period, is_normal), 1), else_=0)).label('normal_records'),
+            func.avg(case((in_recent, records.score))).label('recent_avg'),
+            func.avg(case((in_previous, records.score))).label('previous_avg'),
+            func.max(case((in_period, records.created_at))).label('last_measurement')
+        ).filter(
             and_(
-                PostureRecord.user_id == user_id,
-                PostureRecord.created_at >= previous_start,
-                PostureRecord.created_at < recent_start
+                records.user_id == user_id,
+                records.created_at >= min(start_date, previous_start)
             )
-        ).scalar() or 0
+        ).one()
         
+        total_records = int(row.total_records or 0)
+        if total_records == 0:
+            return {
+                "total_records": 0,
+                "average_score": 0,
+                "improvement_rate": 0,
+                "normal_posture_rate": 0,
+                "last_measurement": None
+            }
+        
+        # 정상 자세 비율
+        normal_rate = (int(row.normal_records or 0) / total_records) * 100
+        
+        # 개선률 계산
+        recent_avg = row.recent_avg or 0
+        previous_avg = row.previous_avg or 0
         improvement_rate = ((recent_avg - previous_avg) / previous_avg * 100) if previous_avg > 0 else 0
         
         return {
             "total_records": total_records,
-            "average_score": round(avg_score, 2) if avg_score else 0,
+            "average_score": round(row.avg_score, 2) if row.avg_score else 0,
             "improvement_rate": round(improvement_rate, 2),
-            "normal_posture_rate": round(normal_rate, 2)
+            "normal_posture_rate": round(normal_rate, 2),
+            "last_measurement": row.last_measurement
         }
     
     def get_trends(self, db: Session, user_id: int, days: int = 7) -> List[Dict]:
-        """자세 변화 트렌드 조회"""
-        start_date = datetime.now() - timedelta(days=days)
-        
-        daily_stats = db.query(
-            func.date(PostureRecord.created_at).label('date'),
-            func.avg(PostureRecord.score).label('avg_score'),
-            func.count(PostureRecord.id).label('record_count'),
-            func.avg(PostureRecord.neck_angle).label('neck_angle_avg'),
-            func.avg(PostureRecord.forward_head_distance).label('forward_head_avg')
-        ).filter(
-            and_(
-                PostureRecord.user_id == user_id,
-                PostureRecord.created_at >= start_date
-            )
-        ).group_by(func.date(PostureRecord.created_at)).all()
+        """
+        자세 변화 트렌드 조회
+        
+        일일 집계(posture_daily_rollups)에서 날짜별 평균 계산
+        """
+        start_date = (datetime.now() - timedelta(days=days)).date()
+        rollups = posture_daily_rollup.get_range(db, user_id, start_date)
         
         return [
             {
-                "date": str(stat.date),
-                "average_score": round(stat.avg_score, 2) if stat.avg_score else 0,
-                "record_count": stat.record_count,
-                "neck_angle_avg": round(stat.neck_angle_avg, 2) if stat.neck_angle_avg else 0,
-                "forward_head_distance_avg": round(stat.forward_head_avg, 2) if stat.forward_head_avg else 0
+                "date": str(rollup.date),
+                "average_score": round(rollup.score_sum / rollup.record_count, 2) if rollup.record_count else 0,
+                "record_count": rollup.record_count,
+                "neck_angle_avg": round(rollup.neck_angle_sum / rollup.record_count, 2) if rollup.record_count else 0,
+                "forward_head_distance_avg": round(rollup.forward_head_distance_sum / rollup.record_count, 2) if rollup.record_count else 0
             }
-            for stat in daily_stats
+            for rollup in rollups
         ]
 
+# 종합 점수 → 등급 (점수 이상이면 해당 등급, 모두 미만이면 F)
+GRADE_THRESHOLDS = [(90.0, "A"), (80.0, "B"), (70.0, "C"), (60.0, "D")]
+
 class CRUDPostureAnalysis:
     def create(self, db: Session, user_id: int, obj_in: PostureAnalysisCreate) -> PostureAnalysis:
-        """자세 분석 결과 생성"""
+        """자세 분석 결과 생성 (analysis_version이 없으면 현재 분석 규칙 버전 사용)"""
+        values = {"analysis_version": posture_analysis_engine.version, **obj_in.dict(exclude_none=True)}
         db_obj = PostureAnalysis(
             user_id=user_id,
-            **obj_in.dict()
+            **values
         )
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
         return db_obj
+    
+    def create_multi(self, db: Session, rows: List[Dict]) -> int:
+        """
+        자세 분석 결과 일괄 생성 (build_values 결과를 다중 행 INSERT로 저장)
+        
+        (record_id, analysis_version) 유니크 인덱스로 같은 기록의 중복 저장은 실패함
+        """
+        if not rows:
+            return 0
+        try:
+            db.execute(insert(PostureAnalysis), rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return len(rows)
+    
+    def build_values(self, records: List[Dict]) -> List[Dict]:
+        """
+        자세 기록(id, user_id, 지표 값 dict) 목록을 분석하여 posture_analyses 컬럼 값 구성
+        
+        분석 엔진의 배열 경로(analyze_arrays)로 한 번에 계산
+        """
+        if not records:
+            return []
+        engine = posture_analysis_engine
+        result = engine.analyze_arrays({
+            metric: np.array([record.get(metric) for record in records], dtype=np.float64)
+            for metric in engine.metrics
+        })
+        problems = engine.problems_for(result["problem_mask"])
+        suggestions = engine.suggestions_for(result["problem_mask"])
+        severity_levels = result["severity_level"].tolist()
+        region_scores = {region: scores.tolist() for region, scores in engine.region_scores(result).items()}
+        
+        rows = []
+        for index, record in enumerate(records):
+            score = record.get("score")
+            rows.append({
+                "record_id": record["id"],
+                "user_id": record["user_id"],
+                "overall_score": score,
+                "overall_grade": self._grade(score),
+                "risk_level": severity_levels[index].capitalize(),
+                "neck_score": region_scores["neck"][index] if "neck" in region_scores else None,
+                "shoulder_score": region_scores["shoulder"][index] if "shoulder" in region_scores else None,
+                "issues": problems[index],
+                "recommendations": suggestions[index],
+                "analysis_version": engine.version
+            })
+        return rows
+    
+    def _grade(self, score: Optional[float]) -> Optional[str]:
+        if score is None:
+            return None
+        for threshold, grade in GRADE_THRESHOLDS:
+            if score >= threshold:
+                return grade
+        return "F"
+    
+    def get_pending(
+        self,
+        db: Session,
+        after_id: int = 0,
+        limit: int = 500,
+        user_id: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        exclude_ids: Optional[List[int]] = None
+    ) -> List[Dict]:
+        """
+        현재 규칙 버전의 분석 결과가 없는 자세 기록을 id 오름차순으로 조회
+        
+        (record_id, analysis_version) 인덱스를 사용하는 NOT EXISTS로 확인
+        SQLite 기간별 테이블로 옮긴 기록도 대상 (posture_partitions.source)
+        반환값: id, user_id, 지표 값 dict 목록
+        """
+        records = posture_partitions.source(db, start_date, end_date).c
+        analyzed = select(PostureAnalysis.id).where(
+            PostureAnalysis.record_id == records.id,
+            PostureAnalysis.analysis_version == posture_analysis_engine.version
+        ).exists()
+        stmt = select(
+            records.id,
+            records.user_id,
+            *(records[metric] for metric in posture_analysis_engine.metrics)
+        ).where(records.id > after_id, ~analyzed)
+        
+        if user_id is not None:
+            stmt = stmt.where(records.user_id == user_id)
+        if start_date:
+            stmt = stmt.where(records.created_at >= start_date)
+        if end_date:
+            stmt = stmt.where(records.created_at < end_date)
+        if exclude_ids:
+            stmt = stmt.where(records.id.notin_(exclude_ids))
+        
+        stmt = stmt.order_by(records.id).limit(limit)
+        return [dict(row._mapping) for row in db.execute(stmt)]
+    
+    def get_last_analyzed_record_id(self, db: Session) -> Optional[int]:
+        """현재 규칙 버전으로 분석된 마지막 기록 ID"""
+        return db.query(func.max(PostureAnalysis.record_id)).filter(
+            PostureAnalysis.analysis_version == posture_analysis_engine.version
+        ).scalar()
+    
+    def get_by_record(self, db: Session, record_id: int, version: Optional[str] = None) -> Optional[PostureAnalysis]:
+        """기록의 분석 결과 조회 (version이 없으면 현재 규칙 버전)"""
+        return db.query(PostureAnalysis).filter(
+            PostureAnalysis.record_id == record_id,
+            PostureAnalysis.analysis_version == (version or posture_analysis_engine.version)
+        ).first()
+
+class AsyncCRUDPostureRecord:
+    """
+    자세 기록 비동기 CRUD
+    
+    AsyncSession.run_sync로 동기 CRUD 구현을 그대로 실행하여 쿼리 로직을 공유
+    (DB I/O는 비동기 드라이버를 통해 이벤트 루프에서 대기)
+    """
+    def __init__(self, sync_crud: CRUDPostureRecord):
+        self.sync_crud = sync_crud
+    
+    async def create(self, db: AsyncSession, user_id: int, obj_in: PostureRecordCreate) -> PostureRecord:
+        """
+        자세 기록 생성
+        
+        run_sync의 함수는 이벤트 루프 스레드에서 실행되므로 DB 저장만 run_sync로 하고,
+        대기할 수 있는 쓰기 지연 버퍼 put과 캐시 무효화(Redis)는 스레드 풀에서 실행
+        """
+        values = self.sync_crud._build_values(user_id, obj_in, datetime.now())
+        if posture_write_buffer.is_running:
+            await run_in_threadpool(posture_write_buffer.put, values)
+            return PostureRecord(**values)
+        
+        db_obj = await db.run_sync(self.sync_crud._insert, values)
+        await query_cache.invalidate_async(user_namespace(user_id))
+        return db_obj
+    
+    async def create_multi(self, db: AsyncSession, items: List[Tuple[int, PostureRecordCreate]]) -> int:
+        """자세 기록 일괄 생성"""
+        if not items:
+            return 0
+        rows = self.sync_crud._build_rows(items)
+        await db.run_sync(self.sync_crud._insert_rows, rows)
+        for user_id in {user_id for user_id, _ in items}:
+            await query_cache.invalidate_async(user_namespace(user_id))
+        return len(rows)
+    
+    async def get_by_user(
+        self, 
+        db: AsyncSession, 
+        user_id: int, 
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100,
+        resolution: str = "raw"
+    ) -> List[PostureRecord]:
+        """사용자의 자세 기록 조회 (resolution: raw 또는 summary)"""
+        return await db.run_sync(self.sync_crud.get_by_user, user_id, start_date, end_date, limit, resolution)
+    
+    async def get_page(
+        self,
+        db: AsyncSession,
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[PostureRecord], Optional[str]]:
+        """사용자의 자세 기록 커서 페이지 조회"""
+        return await db.run_sync(self.sync_crud.get_page, user_id, start_date, end_date, limit, cursor)
+    
+    async def get_stats(self, db: AsyncSession, user_id: int, days: int = 30) -> Dict:
+        """자세 통계 조회"""
+        return await db.run_sync(self.sync_crud.get_stats, user_id, days)
+    
+    async def get_trends(self, db: AsyncSession, user_id: int, days: int = 7) -> List[Dict]:
+        """자세 변화 트렌드 조회"""
+        return await db.run_sync(self.sync_crud.get_trends, user_id, days)
 
 # CRUD 인스턴스
 posture_record = CRUDPostureRecord()
-posture_analysis = CRUDPostureAnalysis() 
\ No newline at end of file
+posture_analysis = CRUDPostureAnalysis()
+async_posture_record = AsyncCRUDPostureRecord(posture_record) 
\ No newline at end of file
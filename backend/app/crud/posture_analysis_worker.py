@@ -0,0 +1,259 @@
+"""
+Posture Check App Backend - 자세 분석 결과 백그라운드 저장 워커
+
+저장된 자세 기록을 요청 처리와 분리된 백그라운드 스레드에서 분석하고
+posture_analyses에 다중 행 INSERT로 일괄 저장합니다.
+- 현재 규칙 버전의 분석 결과가 없는 기록을 id 순으로 찾아 batch_size씩 처리
+  (저장 경로를 건드리지 않으므로 즉시 저장 / 쓰기 지연 버퍼 / WebSocket 저장 모두 대상)
+- 마지막으로 처리한 기록 ID(watermark)부터 조회하되, 늦게 커밋된 기록을 놓치지 않도록
+  rescan_window 범위는 매번 다시 확인
+- 일괄 저장 실패 시 지수 백오프로 재시도, 그래도 실패하면 행 단위로 저장하고 실패한 기록은 건너뜀
+  (중복 저장 오류는 재시도 없이 바로 행 단위로 저장)
+- (record_id, analysis_version) 유니크 인덱스로 여러 프로세스에서 실행되어도 중복 저장되지 않음
+
+워커 시작 전의 과거 기록과 규칙 버전이 바뀐 뒤의 재분석은 replay(= replay_analyses.py)로 처리합니다.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..core.metrics import posture_analyses_saved
+from ..core.posture_analysis import posture_analysis_engine
+from ..db.session import SessionLocal
+from .posture import posture_analysis
+from .posture_partition import posture_partitions
+
+logger = logging.getLogger(__name__)
+
+
+class PostureAnalysisWorker:
+    def __init__(
+        self,
+        batch_size: int,
+        interval: float,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+        rescan_window: int = 1000,
+        session_factory=SessionLocal
+    ):
+        self.batch_size = batch_size
+        self.interval = interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.rescan_window = rescan_window
+        self.session_factory = session_factory
+
+        self.watermark: Optional[int] = None
+        self._failed_ids: Set[int] = set()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats_lock = threading.Lock()
+
+        # 카운터
+        self.analyzed = 0
+        self.failed = 0
+        self.duplicates = 0
+        self.batch_count = 0
+        self.batch_errors = 0
+        self.retries = 0
+        self.last_batch_seconds = 0.0
+        self.max_batch_seconds = 0.0
+        self.total_batch_seconds = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """백그라운드 분석 스레드 시작"""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="posture-analysis-worker", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """분석 스레드 종료 (처리 중인 배치까지 저장, 남은 기록은 다음 시작 시 처리)"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run_once(self) -> int:
+        """watermark 이후 미분석 기록을 모두 처리 (반환값: 저장한 분석 결과 수)"""
+        db = self.session_factory()
+        try:
+            if self.watermark is None:
+                self.watermark = self._initial_watermark(db)
+            after_id = max(0, self.watermark - self.rescan_window)
+            # 다시 확인하지 않는 범위의 실패 기록은 목록에서 제거
+            self._failed_ids = {record_id for record_id in self._failed_ids if record_id > after_id}
+
+            saved, last_id = self._process_range(db, after_id)
+            if last_id is not None:
+                self.watermark = max(self.watermark, last_id)
+            return saved
+        finally:
+            db.close()
+
+    def replay(
+        self,
+        user_id: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> int:
+        """
+        과거 기록 재분석 (조건에 맞는 기록 중 현재 규칙 버전의 분석 결과가 없는 기록 전체)
+
+        progress(저장 건수 누계, 마지막 기록 ID)는 배치마다 호출
+        반환값: 저장한 분석 결과 수
+        """
+        db = self.session_factory()
+        try:
+            saved, _ = self._process_range(db, 0, user_id, start_date, end_date, progress)
+            return saved
+        finally:
+            db.close()
+
+    def get_stats(self) -> Dict:
+        """워커 상태 및 카운터 반환"""
+        with self._stats_lock:
+            return {
+                "running": self.is_running,
+                "analysis_version": posture_analysis_engine.version,
+                "watermark": self.watermark,
+                "analyzed": self.analyzed,
+                "failed": self.failed,
+                "duplicates": self.duplicates,
+                "batch_count": self.batch_count,
+                "batch_errors": self.batch_errors,
+                "retries": self.retries,
+                "last_batch_ms": round(self.last_batch_seconds * 1000, 2),
+                "max_batch_ms": round(self.max_batch_seconds * 1000, 2),
+                "avg_batch_ms": round(self.total_batch_seconds / self.batch_count * 1000, 2) if self.batch_count else 0
+            }
+
+    def _run(self) -> None:
+        """interval마다 새 기록 확인"""
+        while not self._stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                with self._stats_lock:
+                    self.batch_errors += 1
+                logger.exception("자세 분석 워커 오류")
+            self._stop_event.wait(self.interval)
+
+    def _initial_watermark(self, db: Session) -> int:
+        """
+        시작 위치: 현재 규칙 버전으로 마지막 분석한 기록 ID
+
+        분석 결과가 없으면(처음 실행 또는 규칙 버전 변경) 현재 마지막 기록 ID(SQLite 기간별 테이블 포함)부터 시작하고
+        이전 기록은 replay로 처리 (건너뛴 범위를 경고 로그로 남김)
+        """
+        last_analyzed = posture_analysis.get_last_analyzed_record_id(db)
+        if last_analyzed is not None:
+            return last_analyzed
+        records = posture_partitions.source(db).c
+        last_id = db.execute(select(func.max(records.id))).scalar() or 0
+        if last_id:
+            logger.warning(
+                "규칙 버전 %s의 분석 결과가 없어 기록 ID %d 이후부터 분석합니다 "
+                "(이전 기록은 replay_analyses.py로 재분석하세요)",
+                posture_analysis_engine.version, last_id,
+                extra={"analysis_version": posture_analysis_engine.version, "skipped_up_to_id": last_id}
+            )
+        return last_id
+
+    def _process_range(
+        self,
+        db: Session,
+        after_id: int,
+        user_id: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> Tuple[int, Optional[int]]:
+        """after_id 이후 미분석 기록을 batch_size씩 분석/저장 (반환값: (저장 건수, 마지막 기록 ID))"""
+        saved = 0
+        last_id = None
+        while True:
+            records = posture_analysis.get_pending(
+                db, after_id, self.batch_size, user_id, start_date, end_date,
+                exclude_ids=list(self._failed_ids) or None
+            )
+            if not records:
+                break
+            saved += self._write(db, records)
+            last_id = after_id = records[-1]["id"]
+            if progress:
+                progress(saved, last_id)
+            if len(records) < self.batch_size or self._stop_event.is_set():
+                break
+        return saved, last_id
+
+    def _write(self, db: Session, records: List[Dict]) -> int:
+        """분석 결과 일괄 저장 (실패 시 재시도 후 행 단위로 저장)"""
+        started = time.perf_counter()
+        rows = posture_analysis.build_values(records)
+        saved = 0
+        failed = 0
+        duplicates = 0
+        for attempt in range(self.max_retries + 1):
+            try:
+                saved = posture_analysis.create_multi(db, rows)
+                break
+            except Exception as e:
+                with self._stats_lock:
+                    self.batch_errors += 1
+                # 중복(유니크 인덱스) 오류는 재시도해도 같으므로 바로 행 단위로 저장
+                if attempt < self.max_retries and not isinstance(e, IntegrityError):
+                    with self._stats_lock:
+                        self.retries += 1
+                    logger.warning("자세 분석 결과 저장 실패, 재시도 (%d/%d): %s", attempt + 1, self.max_retries, e)
+                    self._stop_event.wait(self.retry_backoff * (2 ** attempt))
+                    continue
+
+                logger.error("자세 분석 결과 일괄 저장 실패, 행 단위로 재시도: %s", e, extra={"batch_size": len(rows)})
+                for row in rows:
+                    try:
+                        saved += posture_analysis.create_multi(db, [row])
+                    except IntegrityError:
+                        # 다른 프로세스가 이미 저장한 기록
+                        duplicates += 1
+                    except Exception as row_error:
+                        failed += 1
+                        self._failed_ids.add(row["record_id"])
+                        logger.error("자세 분석 결과 저장 실패: %s", row_error, extra={"record_id": row["record_id"]})
+                break
+
+        posture_analyses_saved.inc(amount=saved)
+        elapsed = time.perf_counter() - started
+        with self._stats_lock:
+            self.analyzed += saved
+            self.failed += failed
+            self.duplicates += duplicates
+            self.batch_count += 1
+            self.last_batch_seconds = elapsed
+            self.max_batch_seconds = max(self.max_batch_seconds, elapsed)
+            self.total_batch_seconds += elapsed
+        return saved
+
+
+# 분석 워커 인스턴스 (POSTURE_ANALYSIS_WORKER_ENABLED일 때 애플리케이션 시작 시 start)
+posture_analysis_worker = PostureAnalysisWorker(
+    batch_size=settings.POSTURE_ANALYSIS_WORKER_BATCH_SIZE,
+    interval=settings.POSTURE_ANALYSIS_WORKER_INTERVAL,
+    max_retries=settings.POSTURE_ANALYSIS_WORKER_MAX_RETRIES,
+    retry_backoff=settings.POSTURE_ANALYSIS_WORKER_RETRY_BACKOFF,
+    rescan_window=settings.POSTURE_ANALYSIS_WORKER_RESCAN_WINDOW
+)
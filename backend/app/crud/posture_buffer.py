@@ -0,0 +1,213 @@
+"""
+Posture Check App Backend - 자세 기록 쓰기 지연(write-behind) 버퍼
+
+검증이 끝난 자세 기록 값을 제한된 크기의 프로세스 내 큐에 넣고,
+백그라운드 스레드가 크기/시간 임계값에 도달하면 다중 행 INSERT로 일괄 저장합니다.
+- 큐가 가득 차면 지정 시간만큼 대기 후 WriteBufferFullError 발생 (API에서 503 응답)
+- 애플리케이션 종료 시 남은 기록을 모두 저장
+- 큐 깊이, 저장 건수, 저장 지연 시간 등의 카운터 제공
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Dict, List, Optional
+
+from sqlalchemy import insert
+
+from ..core.config import settings
+from ..core.cache import query_cache, user_namespace
+from ..core.metrics import posture_records_saved
+from ..db.session import SessionLocal
+from ..models.posture import PostureRecord
+from .posture_rollup import posture_daily_rollup
+from .posture_session import posture_session
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBufferFullError(Exception):
+    """쓰기 버퍼가 가득 차서 기록을 받을 수 없음"""
+
+
+class PostureWriteBuffer:
+    def __init__(
+        self,
+        max_size: int,
+        batch_size: int,
+        flush_interval: float,
+        put_timeout: float = 0.0,
+        session_factory=SessionLocal
+    ):
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+        self.session_factory = session_factory
+
+        self._queue: "queue.Queue[Dict]" = queue.Queue(maxsize=max_size)
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats_lock = threading.Lock()
+
+        # 카운터
+        self.enqueued = 0
+        self.rejected = 0
+        self.flushed_records = 0
+        self.failed_records = 0
+        self.flush_count = 0
+        self.flush_errors = 0
+        self.last_flush_seconds = 0.0
+        self.max_flush_seconds = 0.0
+        self.total_flush_seconds = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """백그라운드 저장 스레드 시작"""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="posture-write-buffer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """저장 스레드 종료 (큐에 남은 기록은 모두 저장)"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        # 스레드 종료 후 남은 기록 저장
+        self._drain()
+
+    def put(self, values: Dict) -> None:
+        """
+        자세 기록 값을 큐에 추가
+
+        큐가 가득 차면 put_timeout 동안 대기하고, 그래도 자리가 없으면 WriteBufferFullError 발생
+        """
+        try:
+            if self.put_timeout > 0:
+                self._queue.put(values, timeout=self.put_timeout)
+            else:
+                self._queue.put_nowait(values)
+        except queue.Full:
+            with self._stats_lock:
+                self.rejected += 1
+            raise WriteBufferFullError("자세 기록 쓰기 버퍼가 가득 찼습니다")
+        with self._stats_lock:
+            self.enqueued += 1
+
+    def flush(self) -> None:
+        """큐에 쌓인 기록을 즉시 저장"""
+        self._drain()
+
+    def get_stats(self) -> Dict:
+        """버퍼 상태 및 카운터 반환"""
+        with self._stats_lock:
+            return {
+                "running": self.is_running,
+                "queue_depth": self._queue.qsize(),
+                "queue_max_size": self.max_size,
+                "enqueued": self.enqueued,
+                "rejected": self.rejected,
+                "flushed_records": self.flushed_records,
+                "failed_records": self.failed_records,
+                "flush_count": self.flush_count,
+                "flush_errors": self.flush_errors,
+                "last_flush_ms": round(self.last_flush_seconds * 1000, 2),
+                "max_flush_ms": round(self.max_flush_seconds * 1000, 2),
+                "avg_flush_ms": round(self.total_flush_seconds / self.flush_count * 1000, 2) if self.flush_count else 0
+            }
+
+    def _run(self) -> None:
+        """배치 크기 또는 저장 주기에 도달할 때마다 저장"""
+        while not self._stop_event.is_set():
+            batch = self._collect()
+            if batch:
+                self._write(batch)
+
+    def _collect(self) -> List[Dict]:
+        """flush_interval 동안 최대 batch_size개의 기록 수집"""
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _drain(self) -> None:
+        """큐가 빌 때까지 batch_size 단위로 저장"""
+        while True:
+            batch = []
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                return
+            self._write(batch)
+
+    def _write(self, batch: List[Dict]) -> None:
+        """다중 행 INSERT로 저장 (실패 시 문제 행을 찾기 위해 행 단위로 재시도)"""
+        started = time.perf_counter()
+        db = self.session_factory()
+        saved = 0
+        failed = 0
+        try:
+            try:
+                db.execute(insert(PostureRecord), batch)
+                posture_daily_rollup.apply(db, batch)
+                posture_session.apply(db, batch)
+                db.commit()
+                saved = len(batch)
+            except Exception as e:
+                db.rollback()
+                logger.error("자세 기록 일괄 저장 실패, 행 단위로 재시도: %s", e, extra={"batch_size": len(batch)})
+                with self._stats_lock:
+                    self.flush_errors += 1
+                for values in batch:
+                    try:
+                        db.execute(insert(PostureRecord), [values])
+                        posture_daily_rollup.apply(db, [values])
+                        posture_session.apply(db, [values])
+                        db.commit()
+                        saved += 1
+                    except Exception as row_error:
+                        db.rollback()
+                        failed += 1
+                        logger.error("자세 기록 저장 실패: %s", row_error, extra={"user_id": values.get("user_id")})
+        finally:
+            db.close()
+
+        # 저장된 사용자의 조회 캐시 무효화
+        for user_id in {values["user_id"] for values in batch}:
+            query_cache.invalidate(user_namespace(user_id))
+
+        posture_records_saved.inc("write_behind", amount=saved)
+        elapsed = time.perf_counter() - started
+        with self._stats_lock:
+            self.flushed_records += saved
+            self.failed_records += failed
+            self.flush_count += 1
+            self.last_flush_seconds = elapsed
+            self.max_flush_seconds = max(self.max_flush_seconds, elapsed)
+            self.total_flush_seconds += elapsed
+
+
+# 쓰기 버퍼 인스턴스 (POSTURE_WRITE_BEHIND_ENABLED일 때 애플리케이션 시작 시 start)
+posture_write_buffer = PostureWriteBuffer(
+    max_size=settings.POSTURE_WRITE_BEHIND_MAX_QUEUE,
+    batch_size=settings.POSTURE_WRITE_BEHIND_BATCH_SIZE,
+    flush_interval=settings.POSTURE_WRITE_BEHIND_FLUSH_INTERVAL,
+    put_timeout=settings.POSTURE_WRITE_BEHIND_PUT_TIMEOUT
+)
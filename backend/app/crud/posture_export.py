@@ -0,0 +1,196 @@
+"""
+Posture Check App Backend - 자세 기록 대량 내보내기
+
+posture_records를 서버 측 커서에서 고정 크기 청크로 읽어 바로 직렬화합니다.
+ORM 객체나 Pydantic 모델을 만들지 않고 컬럼 튜플을 그대로 사용하므로
+메모리 사용량은 청크 크기로 제한됩니다.
+- csv: 표준 라이브러리만 사용
+- arrow (IPC stream) / parquet: pyarrow 패키지 필요 (pip install pyarrow)
+
+13개 자세 지표는 float64 컬럼으로 내보냅니다.
+"""
+
+import csv
+import io
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .posture_partition import posture_partitions
+
+# 13개 자세 지표 (float 컬럼)
+METRIC_COLUMNS = [
+    "neck_angle",
+    "shoulder_slope",
+    "head_forward",
+    "shoulder_height_diff",
+    "score",
+    "cervical_lordosis",
+    "forward_head_distance",
+    "head_tilt",
+    "left_shoulder_height_diff",
+    "left_scapular_winging",
+    "right_scapular_winging",
+    "shoulder_forward_movement",
+    "head_rotation",
+]
+
+FLAG_COLUMNS = ["is_neck_angle_normal", "is_forward_head_normal", "is_head_tilt_normal"]
+
+EXPORT_COLUMNS = ["id", "user_id", "created_at", "session_id", *METRIC_COLUMNS, *FLAG_COLUMNS]
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "arrow": "application/vnd.apache.arrow.stream",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+class _ChunkSink:
+    """pyarrow writer 출력 버퍼 (청크를 쓸 때마다 비워서 전송)"""
+
+    def __init__(self):
+        self._parts: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._parts.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._parts)
+        self._parts = []
+        return data
+
+
+class PostureRecordExporter:
+    def iter_chunks(
+        self,
+        db: Session,
+        user_id: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        chunk_size: int = 10000
+    ) -> Iterator[List[tuple]]:
+        """
+        내보낼 기록을 (created_at, id) 오름차순으로 chunk_size개씩 반환 (EXPORT_COLUMNS 순서의 튜플)
+
+        user_id가 없으면 기간 내 전체 사용자
+        """
+        records = posture_partitions.source(db, start_date, end_date).c
+        stmt = select(*(records[column] for column in EXPORT_COLUMNS))
+        if user_id is not None:
+            stmt = stmt.where(records.user_id == user_id)
+        if start_date:
+            stmt = stmt.where(records.created_at >= start_date)
+        if end_date:
+            stmt = stmt.where(records.created_at < end_date)
+        stmt = stmt.order_by(records.created_at, records.id).execution_options(
+            stream_results=True, yield_per=chunk_size
+        )
+
+        for partition in db.execute(stmt).partitions(chunk_size):
+            yield [tuple(row) for row in partition]
+
+    def iter_csv(self, chunks: Iterator[List[tuple]]) -> Iterator[bytes]:
+        """CSV 직렬화 (헤더 포함, 청크 단위로 반환)"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_COLUMNS)
+        for rows in chunks:
+            writer.writerows(rows)
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+
+    def iter_arrow(self, chunks: Iterator[List[tuple]], format: str = "arrow") -> Iterator[bytes]:
+        """
+        Arrow IPC stream 또는 Parquet 직렬화 (청크 = 레코드 배치 / row group)
+
+        pyarrow가 없으면 RuntimeError
+        """
+        pa = _import_pyarrow()
+        schema = self.arrow_schema()
+        sink = _ChunkSink()
+        if format == "parquet":
+            import pyarrow.parquet as pq
+            writer = pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema)
+        else:
+            writer = pa.ipc.new_stream(pa.PythonFile(sink, mode="w"), schema)
+
+        try:
+            for rows in chunks:
+                columns = list(zip(*rows))
+                batch = pa.RecordBatch.from_arrays(
+                    [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+                    schema=schema
+                )
+                if format == "parquet":
+                    writer.write_table(pa.Table.from_batches([batch]))
+                else:
+                    writer.write_batch(batch)
+                yield sink.drain()
+        finally:
+            writer.close()
+        yield sink.drain()
+
+    def arrow_schema(self):
+        pa = _import_pyarrow()
+        return pa.schema(
+            [
+                pa.field("id", pa.int64()),
+                pa.field("user_id", pa.int64()),
+                pa.field("created_at", pa.timestamp("us")),
+                pa.field("session_id", pa.string()),
+            ]
+            + [pa.field(column, pa.float64()) for column in METRIC_COLUMNS]
+            + [pa.field(column, pa.bool_()) for column in FLAG_COLUMNS]
+        )
+
+    def export(
+        self,
+        db: Session,
+        format: str = "csv",
+        user_id: Optional[int] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        chunk_size: int = 10000
+    ) -> Iterator[bytes]:
+        """지정한 형식으로 내보내기 (바이트 청크 반환)"""
+        if format not in EXPORT_FORMATS:
+            raise ValueError(f"지원하지 않는 형식입니다: {format} (csv, arrow, parquet)")
+        if format != "csv":
+            _import_pyarrow()
+
+        chunks = self.iter_chunks(db, user_id, start_date, end_date, chunk_size)
+        if format == "csv":
+            return self.iter_csv(chunks)
+        return self.iter_arrow(chunks, format)
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise RuntimeError("Arrow/Parquet 내보내기를 사용하려면 pyarrow 패키지를 설치해주세요 (pip install pyarrow)") from e
+    return pyarrow
+
+
+# 내보내기 인스턴스
+posture_exporter = PostureRecordExporter()
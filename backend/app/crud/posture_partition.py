@@ -0,0 +1,427 @@
+"""
+Posture Check App Backend - posture_records 월 단위 파티션 / 보존 정책
+
+posture_records는 추가만 되고 모든 조회가 created_at 범위로 제한되므로
+created_at 기준 월 단위 범위 파티션으로 나누어 관리합니다. (maintain_partitions.py에서 실행)
+- MySQL: RANGE COLUMNS(created_at) 파티션 pYYYYMM + 미리 만들지 못한 기간을 받는 p_future (MAXVALUE)
+- PostgreSQL: 선언적 파티션 posture_records_pYYYYMM + posture_records_default
+  (기존 데이터는 posture_records_legacy 파티션)
+- SQLite: 파티션이 없으므로 기간별 테이블로 흉내냄
+  지난 달까지의 기록을 posture_records_pYYYYMM 테이블로 옮기고(rotate),
+  조회 시 기간이 겹치는 테이블만 UNION ALL로 읽음 (source, 분석 워커/replay 포함)
+MySQL/PostgreSQL 테이블 변환은 alembic 0004에서 합니다.
+
+보존 정책(POSTURE_RETENTION_MONTHS)은 DELETE 대신 보존 기간이 지난 파티션을 통째로
+삭제(drop)하거나 별도 테이블 posture_records_archive_YYYYMM으로 분리(archive)하므로
+기록 수와 관계없이 메타데이터 변경만 발생합니다.
+일일 집계(posture_daily_rollups)는 그대로 두고, drop 모드에서는 삭제된 기록의 분석 결과도 정리합니다.
+"""
+
+import logging
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import Column, Index, MetaData, Table, delete, exists, func, insert, select, text, union_all
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import FromClause
+
+from ..core.config import settings
+from ..models.posture import PostureAnalysis, PostureRecord
+
+logger = logging.getLogger(__name__)
+
+TABLE_NAME = "posture_records"
+FUTURE_PARTITION = "p_future"                 # MySQL MAXVALUE 파티션
+DEFAULT_PARTITION = f"{TABLE_NAME}_default"   # PostgreSQL DEFAULT 파티션
+RETENTION_MODES = ("drop", "archive")
+
+_MONTH_NAME = re.compile(r"^(?:posture_records_)?p(\d{6})$")
+_PG_BOUND = re.compile(r"FROM \((.+?)\) TO \((.+?)\)")
+
+
+def month_start(value: datetime) -> datetime:
+    return datetime(value.year, value.month, 1)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+
+def _parse_bound(value: str) -> Optional[datetime]:
+    """파티션 경계 값 ("'2026-11-01 00:00:00'", MAXVALUE 등) → datetime (무한대는 None)"""
+    value = value.strip().strip("'")
+    if value.upper() in ("MAXVALUE", "MINVALUE"):
+        return None
+    return datetime.fromisoformat(value[:19])
+
+
+def _literal(value: datetime) -> str:
+    return f"'{value:%Y-%m-%d %H:%M:%S}'"
+
+
+class PostureRecordPartitions:
+    def __init__(self, cache_seconds: float = 60.0):
+        self.table = PostureRecord.__table__
+        self.cache_seconds = cache_seconds
+        self._period_tables: Dict[str, Table] = {}
+        self._sqlite_partitions: Optional[List[Dict]] = None
+        self._sqlite_loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def backend(self, db: Session) -> str:
+        return db.get_bind().dialect.name
+
+    # ==================== 파티션 목록 ====================
+    def list_partitions(self, db: Session) -> List[Dict]:
+        """
+        파티션 목록 (created_at 오름차순)
+
+        각 항목: name, label(YYYYMM 등), kind(range / future / base), start(포함), end(제외), rows(추정치)
+        start/end가 None이면 하한/상한 없음, 파티션 테이블이 아니면 빈 목록 (SQLite는 원본 테이블 포함)
+        """
+        dialect = self.backend(db)
+        if dialect == "mysql":
+            return self._mysql_partitions(db)
+        if dialect == "postgresql":
+            return self._postgresql_partitions(db)
+        if dialect == "sqlite":
+            return self._sqlite_list(db)
+        return []
+
+    def _partition(self, name: str, start: Optional[datetime], end: Optional[datetime], rows: int) -> Dict:
+        match = _MONTH_NAME.match(name)
+        if match:
+            label, kind = match.group(1), "range"
+        elif end is None:
+            label, kind = name.rsplit("_", 1)[-1], "future"
+        else:
+            label, kind = name.replace(f"{TABLE_NAME}_", ""), "range"
+        return {"name": name, "label": label, "kind": kind, "start": start, "end": end, "rows": rows}
+
+    def _mysql_partitions(self, db: Session) -> List[Dict]:
+        rows = db.execute(text(
+            "SELECT PARTITION_NAME, PARTITION_DESCRIPTION, TABLE_ROWS FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table AND PARTITION_NAME IS NOT NULL "
+            "ORDER BY PARTITION_ORDINAL_POSITION"
+        ), {"table": TABLE_NAME}).all()
+
+        partitions = []
+        previous_end = None
+        for name, description, table_rows in rows:
+            end = _parse_bound(description)
+            partitions.append(self._partition(name, previous_end, end, int(table_rows or 0)))
+            previous_end = end
+        return partitions
+
+    def _postgresql_partitions(self, db: Session) -> List[Dict]:
+        rows = db.execute(text(
+            "SELECT child.relname, pg_get_expr(child.relpartbound, child.oid), child.reltuples "
+            "FROM pg_inherits JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :table"
+        ), {"table": TABLE_NAME}).all()
+
+        partitions = []
+        for name, bound, reltuples in rows:
+            match = _PG_BOUND.search(bound or "")
+            start, end = (_parse_bound(match.group(1)), _parse_bound(match.group(2))) if match else (None, None)
+            partitions.append(self._partition(name, start, end, max(int(reltuples or 0), 0)))
+        # DEFAULT 파티션을 마지막으로
+        return sorted(partitions, key=lambda p: (p["end"] is None, p["start"] or datetime.min))
+
+    def _sqlite_list(self, db: Session) -> List[Dict]:
+        partitions = [
+            self._partition(period["name"], period["start"], period["end"], 0)
+            for period in self._sqlite_periods(db)
+        ]
+        partitions.append({"name": TABLE_NAME, "label": "current", "kind": "base", "start": None, "end": None, "rows": 0})
+        for partition in partitions:
+            partition["rows"] = db.execute(text(f'SELECT COUNT(*) FROM "{partition["name"]}"')).scalar()
+        return partitions
+
+    def _sqlite_periods(self, db: Session) -> List[Dict]:
+        """SQLite 기간별 테이블 (name, start, end) 목록 (start 오름차순)"""
+        names = db.execute(text(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE 'posture\\_records\\_p%' ESCAPE '\\'"
+        )).scalars().all()
+        periods = []
+        for name in names:
+            match = _MONTH_NAME.match(name)
+            if match:
+                start = datetime.strptime(match.group(1), "%Y%m")
+                periods.append({"name": name, "start": start, "end": add_months(start, 1)})
+        return sorted(periods, key=lambda period: period["start"])
+
+    # ==================== 조회 대상 (파티션 제외) ====================
+    def source(self, db: Session, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> FromClause:
+        """
+        created_at 범위 [start_date, end_date]의 기록을 읽을 테이블
+
+        MySQL/PostgreSQL은 posture_records 자체 (created_at 조건으로 DB가 파티션 제외)
+        SQLite는 기간이 겹치는 기간별 테이블만 원본 테이블과 UNION ALL (겹치는 테이블이 없으면 원본 테이블)
+        """
+        tables = self.tables(db, start_date, end_date)
+        if len(tables) == 1:
+            return self.table
+        columns = [column.name for column in self.table.columns]
+        return union_all(*(
+            select(*(table.c[column] for column in columns)) for table in tables
+        )).subquery(f"{TABLE_NAME}_all")
+
+    def tables(self, db: Session, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> List[Table]:
+        """created_at 범위 [start_date, end_date]의 기록이 있을 수 있는 물리 테이블 (SQLite 외에는 posture_records만)"""
+        if self.backend(db) != "sqlite":
+            return [self.table]
+        return [self.table] + [
+            self.period_table(partition["name"])
+            for partition in self._cached_sqlite_partitions(db)
+            if (start_date is None or partition["end"] > start_date)
+            and (end_date is None or partition["start"] <= end_date)
+        ]
+
+    def user_ids(self, db: Session, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> List[int]:
+        """created_at 범위 [start_date, end_date]의 기록이 있는 사용자 ID (물리 테이블별 DISTINCT를 합쳐 오름차순)"""
+        user_ids = set()
+        for table in self.tables(db, start_date, end_date):
+            stmt = select(table.c.user_id).distinct()
+            if start_date:
+                stmt = stmt.where(table.c.created_at >= start_date)
+            if end_date:
+                stmt = stmt.where(table.c.created_at <= end_date)
+            user_ids.update(db.execute(stmt).scalars())
+        return sorted(user_ids)
+
+    def period_tables(self, db: Session) -> List[Table]:
+        """SQLite 기간별 테이블 목록 (다른 백엔드는 빈 목록)"""
+        if self.backend(db) != "sqlite":
+            return []
+        return [self.period_table(partition["name"]) for partition in self._cached_sqlite_partitions(db)]
+
+    def period_table(self, name: str) -> Table:
+        """SQLite 기간별 테이블 정의 (posture_records와 같은 컬럼, 외래 키 제외)"""
+        table = self._period_tables.get(name)
+        if table is None:
+            table = Table(
+                name, MetaData(),
+                *(Column(column.name, column.type, primary_key=column.primary_key, nullable=column.nullable)
+                  for column in self.table.columns),
+                Index(f"ix_{name}_user_id_created_at", "user_id", "created_at"),
+                Index(f"ix_{name}_session_id", "session_id")
+            )
+            self._period_tables[name] = table
+        return table
+
+    def _cached_sqlite_partitions(self, db: Session) -> List[Dict]:
+        """
+        SQLite 기간별 테이블 목록 (cache_seconds 동안 재사용)
+
+        조회마다 sqlite_master를 읽지 않도록 캐시 (애플리케이션 시작 시 warm_up)
+        다른 프로세스에서 rotate/보존 정책을 실행하면 최대 cache_seconds 동안 이전 목록을 사용
+        """
+        with self._lock:
+            if self._sqlite_partitions is not None and time.monotonic() - self._sqlite_loaded_at < self.cache_seconds:
+                return self._sqlite_partitions
+        partitions = self._sqlite_periods(db)
+        with self._lock:
+            self._sqlite_partitions = partitions
+            self._sqlite_loaded_at = time.monotonic()
+        return partitions
+
+    def warm_up(self, db: Session) -> None:
+        """SQLite 기간별 테이블 목록 미리 읽기 (첫 요청에 쿼리가 추가되지 않도록)"""
+        if self.backend(db) == "sqlite":
+            self.invalidate()
+            self._cached_sqlite_partitions(db)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._sqlite_partitions = None
+
+    # ==================== 파티션 생성 ====================
+    def ensure_future(self, db: Session, months_ahead: int, now: Optional[datetime] = None) -> List[str]:
+        """
+        이번 달부터 months_ahead개월 뒤까지의 월 파티션을 미리 생성 (반환값: 새로 만든 파티션 이름)
+
+        이미 있는 달은 건너뜀, SQLite는 rotate에서 기간별 테이블을 만들므로 생성하지 않음
+        """
+        dialect = self.backend(db)
+        if dialect not in ("mysql", "postgresql"):
+            return []
+
+        partitions = self.list_partitions(db)
+        if not partitions:
+            raise RuntimeError(f"{TABLE_NAME} 테이블이 파티션 테이블이 아닙니다 (alembic upgrade head 실행 필요)")
+
+        current = month_start(now or datetime.now())
+        last_end = max((p["end"] for p in partitions if p["end"] is not None), default=None)
+        first = max(last_end, current) if last_end else current
+        months = []
+        month = first
+        while month <= add_months(current, months_ahead):
+            months.append(month)
+            month = add_months(month, 1)
+        if not months:
+            return []
+
+        if dialect == "mysql":
+            names = [f"p{month:%Y%m}" for month in months]
+            definitions = ", ".join(
+                f"PARTITION {name} VALUES LESS THAN ({_literal(add_months(month, 1))})"
+                for name, month in zip(names, months)
+            )
+            if any(p["name"] == FUTURE_PARTITION for p in partitions):
+                # p_future에 들어간 기록(미리 만들지 못한 기간)은 새 파티션으로 옮겨짐
+                db.execute(text(
+                    f"ALTER TABLE {TABLE_NAME} REORGANIZE PARTITION {FUTURE_PARTITION} INTO "
+                    f"({definitions}, PARTITION {FUTURE_PARTITION} VALUES LESS THAN (MAXVALUE))"
+                ))
+            else:
+                db.execute(text(f"ALTER TABLE {TABLE_NAME} ADD PARTITION ({definitions})"))
+        else:
+            names = [f"{TABLE_NAME}_p{month:%Y%m}" for month in months]
+            has_default = any(p["name"] == DEFAULT_PARTITION for p in partitions)
+            for name, month in zip(names, months):
+                bounds = f"FROM ({_literal(month)}) TO ({_literal(add_months(month, 1))})"
+                if not has_default:
+                    db.execute(text(f"CREATE TABLE {name} PARTITION OF {TABLE_NAME} FOR VALUES {bounds}"))
+                    continue
+                # DEFAULT 파티션에 같은 기간 기록이 있으면 파티션을 만들 수 없으므로
+                # 별도 테이블로 옮긴 뒤 파티션으로 연결
+                db.execute(text(f"CREATE TABLE {name} (LIKE {TABLE_NAME} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+                db.execute(text(
+                    f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+                    f"WHERE created_at >= {_literal(month)} AND created_at < {_literal(add_months(month, 1))} RETURNING *) "
+                    f"INSERT INTO {name} SELECT * FROM moved"
+                ))
+                db.execute(text(f"ALTER TABLE {TABLE_NAME} ATTACH PARTITION {name} FOR VALUES {bounds}"))
+        db.commit()
+        logger.info("자세 기록 파티션 생성: %s", ", ".join(names))
+        return names
+
+    def rotate(self, db: Session, now: Optional[datetime] = None) -> List[str]:
+        """
+        SQLite: 원본 테이블의 지난 달까지 기록을 월별 기간별 테이블로 이동 (반환값: 기록을 옮긴 테이블 이름)
+
+        이번 달 기록은 원본 테이블에 남음, 다른 백엔드는 DB 파티션을 사용하므로 아무것도 하지 않음
+        """
+        if self.backend(db) != "sqlite":
+            return []
+
+        table_sql = db.execute(text(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :table"
+        ), {"table": TABLE_NAME}).scalar() or ""
+        if "AUTOINCREMENT" not in table_sql.upper():
+            # 원본 테이블이 비면 ID가 다시 1부터 할당되어 옮긴 기록(분석 결과의 record_id)과 겹침
+            raise RuntimeError(
+                f"{TABLE_NAME} 테이블에 AUTOINCREMENT가 없어 기간별 테이블로 옮길 수 없습니다 "
+                "(init_db로 테이블을 다시 생성해야 합니다)"
+            )
+
+        current = month_start(now or datetime.now())
+        months = db.execute(
+            select(func.strftime("%Y%m", PostureRecord.created_at).label("month"))
+            .where(PostureRecord.created_at < current)
+            .group_by("month")
+        ).scalars().all()
+
+        names = []
+        columns = [column.name for column in self.table.columns]
+        try:
+            for label in months:
+                start = datetime.strptime(label, "%Y%m")
+                end = add_months(start, 1)
+                table = self.period_table(f"{TABLE_NAME}_p{label}")
+                table.create(db.connection(), checkfirst=True)
+                in_month = (PostureRecord.created_at >= start, PostureRecord.created_at < end)
+                db.execute(insert(table).from_select(columns, select(self.table).where(*in_month)))
+                db.execute(delete(PostureRecord).where(*in_month))
+                names.append(table.name)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            self.invalidate()
+        if names:
+            logger.info("자세 기록 기간별 테이블로 이동: %s", ", ".join(names))
+        return names
+
+    # ==================== 보존 정책 ====================
+    def expired(self, db: Session, retention_months: int, now: Optional[datetime] = None) -> List[Dict]:
+        """보존 기간이 지난 파티션 (이번 달 이전 retention_months개월보다 오래된 파티션, 0 이하면 없음)"""
+        if retention_months <= 0:
+            return []
+        cutoff = add_months(month_start(now or datetime.now()), -retention_months)
+        return [
+            partition for partition in self.list_partitions(db)
+            if partition["kind"] == "range" and partition["end"] is not None and partition["end"] <= cutoff
+        ]
+
+    def apply_retention(
+        self,
+        db: Session,
+        retention_months: int,
+        mode: str = "drop",
+        now: Optional[datetime] = None
+    ) -> List[str]:
+        """
+        보존 기간이 지난 파티션을 삭제(drop)하거나 보관 테이블로 분리(archive)
+
+        반환값: 처리한 파티션 이름
+        drop 모드에서는 삭제된 기록을 가리키는 분석 결과(posture_analyses)도 정리
+        """
+        if mode not in RETENTION_MODES:
+            raise ValueError(f"지원하지 않는 보존 정책입니다: {mode} (drop 또는 archive)")
+
+        dialect = self.backend(db)
+        names = []
+        try:
+            for partition in self.expired(db, retention_months, now):
+                name = partition["name"]
+                archive = f"{TABLE_NAME}_archive_{partition['label']}"
+                id_range = db.execute(text(
+                    f"SELECT MIN(id), MAX(id) FROM {TABLE_NAME} PARTITION ({name})" if dialect == "mysql"
+                    else f'SELECT MIN(id), MAX(id) FROM "{name}"'
+                )).one()
+
+                if dialect == "mysql":
+                    if mode == "archive":
+                        # 빈 보관 테이블과 파티션을 교환 (데이터 복사 없음)
+                        db.execute(text(f"CREATE TABLE {archive} LIKE {TABLE_NAME}"))
+                        db.execute(text(f"ALTER TABLE {archive} REMOVE PARTITIONING"))
+                        db.execute(text(f"ALTER TABLE {TABLE_NAME} EXCHANGE PARTITION {name} WITH TABLE {archive}"))
+                    db.execute(text(f"ALTER TABLE {TABLE_NAME} DROP PARTITION {name}"))
+                elif dialect == "postgresql":
+                    db.execute(text(f"ALTER TABLE {TABLE_NAME} DETACH PARTITION {name}"))
+                    db.execute(text(f"ALTER TABLE {name} RENAME TO {archive}" if mode == "archive" else f"DROP TABLE {name}"))
+                else:
+                    db.execute(text(f'ALTER TABLE "{name}" RENAME TO "{archive}"' if mode == "archive" else f'DROP TABLE "{name}"'))
+                    self.invalidate()
+
+                if mode == "drop" and id_range[0] is not None:
+                    self._delete_orphan_analyses(db, id_range[0], id_range[1])
+                db.commit()
+                names.append(name)
+                logger.info("자세 기록 파티션 %s: %s", "보관" if mode == "archive" else "삭제", name)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            self.invalidate()
+        return names
+
+    def _delete_orphan_analyses(self, db: Session, low_id: int, high_id: int) -> None:
+        """삭제된 파티션의 ID 범위에서 기록이 없어진 분석 결과 삭제 (다른 파티션에 남은 기록의 분석 결과는 유지)"""
+        records = self.source(db)
+        db.execute(delete(PostureAnalysis).where(
+            PostureAnalysis.record_id.between(low_id, high_id),
+            ~exists().where(records.c.id == PostureAnalysis.record_id)
+        ))
+
+
+# 파티션 관리 인스턴스
+posture_partitions = PostureRecordPartitions(cache_seconds=settings.POSTURE_PARTITION_CACHE_SECONDS)
@@ -0,0 +1,171 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func, and_, case, insert, select, delete
+from typing import List, Optional, Dict, Tuple
+from datetime import date, datetime, time, timedelta
+from ..models.posture import PostureDailyRollup, PostureRecordSummary
+from ..core.cache import query_cache, user_namespace
+from .posture_partition import posture_partitions
+
+# 저장 시 더해지는 누적 컬럼
+SUM_COLUMNS = [
+    "record_count",
+    "score_sum",
+    "neck_angle_sum",
+    "forward_head_distance_sum",
+    "neck_angle_normal_count",
+    "forward_head_normal_count",
+    "head_tilt_normal_count",
+    "all_normal_count",
+]
+
+class CRUDPostureDailyRollup:
+    def _aggregate(self, rows: List[Dict]) -> List[Dict]:
+        """자세 기록 값 목록을 (user_id, date)별 증분으로 합산"""
+        totals: Dict[Tuple[int, date], Dict] = {}
+        for row in rows:
+            key = (row["user_id"], row["created_at"].date())
+            total = totals.get(key)
+            if total is None:
+                total = {"user_id": key[0], "date": key[1], "last_created_at": row["created_at"]}
+                total.update({column: 0 for column in SUM_COLUMNS})
+                totals[key] = total
+
+            is_neck_angle_normal = bool(row["is_neck_angle_normal"])
+            is_forward_head_normal = bool(row["is_forward_head_normal"])
+            is_head_tilt_normal = bool(row["is_head_tilt_normal"])
+
+            total["record_count"] += 1
+            total["score_sum"] += row["score"] or 0.0
+            total["neck_angle_sum"] += row["neck_angle"] or 0.0
+            total["forward_head_distance_sum"] += row["forward_head_distance"] or 0.0
+            total["neck_angle_normal_count"] += is_neck_angle_normal
+            total["forward_head_normal_count"] += is_forward_head_normal
+            total["head_tilt_normal_count"] += is_head_tilt_normal
+            total["all_normal_count"] += is_neck_angle_normal and is_forward_head_normal and is_head_tilt_normal
+            total["last_created_at"] = max(total["last_created_at"], row["created_at"])
+        return list(totals.values())
+
+    def apply(self, db: Session, rows: List[Dict]) -> None:
+        """
+        새로 저장되는 자세 기록을 일일 집계에 반영 (커밋은 호출자가 담당)
+
+        기록 INSERT와 같은 트랜잭션에서 호출하여 원본과 집계가 함께 커밋되도록 함
+        """
+        increments = self._aggregate(rows)
+        if not increments:
+            return
+
+        dialect = db.get_bind().dialect.name
+        if dialect == "mysql":
+            from sqlalchemy.dialects.mysql import insert as mysql_insert
+            stmt = mysql_insert(PostureDailyRollup).values(increments)
+            update = {
+                column: getattr(PostureDailyRollup, column) + stmt.inserted[column]
+                for column in SUM_COLUMNS
+            }
+            update["last_created_at"] = func.greatest(
+                func.coalesce(PostureDailyRollup.last_created_at, stmt.inserted.last_created_at),
+                stmt.inserted.last_created_at
+            )
+            db.execute(stmt.on_duplicate_key_update(**update))
+        elif dialect in ("sqlite", "postgresql"):
+            if dialect == "sqlite":
+                from sqlalchemy.dialects.sqlite import insert as upsert_insert
+                latest = func.max
+            else:
+                from sqlalchemy.dialects.postgresql import insert as upsert_insert
+                latest = func.greatest
+            stmt = upsert_insert(PostureDailyRollup).values(increments)
+            update = {
+                column: getattr(PostureDailyRollup, column) + stmt.excluded[column]
+                for column in SUM_COLUMNS
+            }
+            update["last_created_at"] = latest(
+                func.coalesce(PostureDailyRollup.last_created_at, stmt.excluded.last_created_at),
+                stmt.excluded.last_created_at
+            )
+            db.execute(stmt.on_conflict_do_update(index_elements=["user_id", "date"], set_=update))
+        else:
+            # UPSERT를 지원하지 않는 백엔드: 조회 후 갱신
+            for increment in increments:
+                rollup = db.get(PostureDailyRollup, (increment["user_id"], increment["date"]))
+                if rollup is None:
+                    db.add(PostureDailyRollup(**increment))
+                    continue
+                for column in SUM_COLUMNS:
+                    setattr(rollup, column, getattr(rollup, column) + increment[column])
+                if rollup.last_created_at is None or increment["last_created_at"] > rollup.last_created_at:
+                    rollup.last_created_at = increment["last_created_at"]
+            db.flush()
+
+    def get_range(
+        self,
+        db: Session,
+        user_id: int,
+        start_date: date,
+        end_date: Optional[date] = None
+    ) -> List[PostureDailyRollup]:
+        """사용자의 기간별 일일 집계 조회 (날짜 오름차순)"""
+        query = db.query(PostureDailyRollup).filter(
+            and_(
+                PostureDailyRollup.user_id == user_id,
+                PostureDailyRollup.date >= start_date
+            )
+        )
+        if end_date:
+            query = query.filter(PostureDailyRollup.date < end_date)
+        return query.order_by(PostureDailyRollup.date).all()
+
+    def rebuild(self, db: Session, user_id: int) -> int:
+        """
+        원본 자세 기록으로 사용자의 일일 집계 재생성 (백필)
+
+        반환값: 생성된 일일 집계 행 수 (SQLite 기간별 테이블의 기록 포함)
+        압축(crud/posture_summary.py)으로 원본이 삭제된 날짜의 집계는 유지하고 그 다음 날부터 재생성
+        """
+        compacted_until = db.query(func.max(PostureRecordSummary.period_end)).filter(
+            PostureRecordSummary.user_id == user_id
+        ).scalar()
+        since = datetime.combine(compacted_until.date() + timedelta(days=1), time()) if compacted_until else None
+        records = posture_partitions.source(db, since).c
+        is_normal = and_(
+            records.is_neck_angle_normal == True,
+            records.is_forward_head_normal == True,
+            records.is_head_tilt_normal == True
+        )
+        day = func.date(records.created_at)
+        source = select(
+            records.user_id,
+            day,
+            func.count(records.id),
+            func.coalesce(func.sum(records.score), 0.0),
+            func.coalesce(func.sum(records.neck_angle), 0.0),
+            func.coalesce(func.sum(records.forward_head_distance), 0.0),
+            func.sum(case((records.is_neck_angle_normal == True, 1), else_=0)),
+            func.sum(case((records.is_forward_head_normal == True, 1), else_=0)),
+            func.sum(case((records.is_head_tilt_normal == True, 1), else_=0)),
+            func.sum(case((is_normal, 1), else_=0)),
+            func.max(records.created_at)
+        ).where(records.user_id == user_id).group_by(records.user_id, day)
+        stale = delete(PostureDailyRollup).where(PostureDailyRollup.user_id == user_id)
+        if since:
+            source = source.where(records.created_at >= since)
+            stale = stale.where(PostureDailyRollup.date >= since.date())
+
+        try:
+            db.execute(stale)
+            result = db.execute(
+                insert(PostureDailyRollup).from_select(
+                    ["user_id", "date", *SUM_COLUMNS, "last_created_at"],
+                    source
+                )
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        query_cache.invalidate(user_namespace(user_id))
+        return result.rowcount
+
+# CRUD 인스턴스
+posture_daily_rollup = CRUDPostureDailyRollup()
@@ -0,0 +1,147 @@
+"""
+Posture Check App Backend - 자세 측정 세션 저장/누적 집계
+
+/analysis/start에서 posture_sessions 행을 만들고 /analysis/stop에서 종료 시간과 세션 길이를 기록합니다.
+기록 수/점수 합계/평균 점수 등 누적 컬럼은 기록을 저장하는 트랜잭션에서 함께 증분 갱신하므로
+(즉시 저장 / 일괄 저장 / 쓰기 지연 버퍼 / WebSocket 저장 모두) 세션 조회와 종료 시 기록을 다시 읽지 않습니다.
+세션 ID가 없거나 posture_sessions에 없는 세션 ID의 기록은 집계하지 않습니다.
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import bindparam, case, update
+from sqlalchemy.orm import Session
+
+from ..models.posture import PostureSession
+
+_sessions = PostureSession.__table__
+
+# 세션별 증분을 executemany 한 번으로 반영하는 UPDATE
+# (MySQL은 SET 절을 왼쪽부터 적용하여 뒤의 식이 갱신된 값을 보므로 평균/마지막 측정 시간을 먼저 계산)
+_APPLY_STATEMENT = update(_sessions).where(
+    _sessions.c.session_id == bindparam("b_session_id"),
+    _sessions.c.user_id == bindparam("b_user_id")
+).ordered_values(
+    (_sessions.c.average_score,
+     (_sessions.c.score_sum + bindparam("b_score_sum")) / (_sessions.c.total_records + bindparam("b_record_count"))),
+    (_sessions.c.last_record_at, case(
+        (_sessions.c.last_record_at == None, bindparam("b_last_record_at")),
+        (_sessions.c.last_record_at < bindparam("b_last_record_at"), bindparam("b_last_record_at")),
+        else_=_sessions.c.last_record_at
+    )),
+    (_sessions.c.total_records, _sessions.c.total_records + bindparam("b_record_count")),
+    (_sessions.c.score_sum, _sessions.c.score_sum + bindparam("b_score_sum")),
+    (_sessions.c.all_normal_count, _sessions.c.all_normal_count + bindparam("b_all_normal_count")),
+)
+
+
+class CRUDPostureSession:
+    def get(self, db: Session, session_id: str) -> Optional[PostureSession]:
+        """세션 ID로 세션 조회"""
+        return db.query(PostureSession).filter(PostureSession.session_id == session_id).first()
+
+    def get_by_user(self, db: Session, user_id: int, limit: int = 50) -> List[PostureSession]:
+        """사용자의 세션 목록 조회 (최근 시작 순)"""
+        return db.query(PostureSession).filter(PostureSession.user_id == user_id).order_by(
+            PostureSession.start_time.desc(), PostureSession.id.desc()
+        ).limit(limit).all()
+
+    def get_active(self, db: Session, limit: int = 100) -> List[PostureSession]:
+        """활성 세션 목록 조회 (최근 시작 순)"""
+        return db.query(PostureSession).filter(PostureSession.is_active == True).order_by(
+            PostureSession.start_time.desc(), PostureSession.id.desc()
+        ).limit(limit).all()
+
+    def start(
+        self,
+        db: Session,
+        session_id: str,
+        user_id: int,
+        start_time: datetime,
+        device_info: Optional[str] = None
+    ) -> PostureSession:
+        """
+        세션 시작 (행 생성)
+
+        같은 세션 ID의 활성 세션이 있으면 그대로 반환 (시작 요청 재시도)
+        다른 사용자의 세션 ID이거나 이미 종료된 세션 ID면 ValueError
+        (종료된 세션의 세션 길이와 누적 집계는 확정된 값이므로 다시 활성화하지 않음)
+        """
+        db_obj = self.get(db, session_id)
+        if db_obj is None:
+            db_obj = PostureSession(
+                session_id=session_id,
+                user_id=user_id,
+                device_info=device_info,
+                start_time=start_time,
+                is_active=True,
+                total_records=0,
+                score_sum=0.0,
+                all_normal_count=0
+            )
+            db.add(db_obj)
+        elif db_obj.user_id != user_id:
+            raise ValueError("다른 사용자의 세션 ID입니다")
+        elif not db_obj.is_active:
+            raise ValueError("이미 종료된 세션 ID입니다")
+        else:
+            return db_obj
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+    def stop(self, db: Session, session_id: str, end_time: datetime) -> Optional[PostureSession]:
+        """
+        세션 종료 (종료 시간과 세션 길이 기록, 누적 집계는 저장 시 갱신된 값 그대로)
+
+        세션이 없으면 None, 이미 종료된 세션은 그대로 반환
+        """
+        db_obj = self.get(db, session_id)
+        if db_obj is None or not db_obj.is_active:
+            return db_obj
+        db_obj.is_active = False
+        db_obj.end_time = end_time
+        db_obj.duration_seconds = max(0, int((end_time - db_obj.start_time).total_seconds()))
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+    def _aggregate(self, rows: List[Dict]) -> List[Dict]:
+        """자세 기록 값 목록을 (user_id, session_id)별 증분으로 합산 (세션 ID가 없는 기록 제외)"""
+        totals: Dict[Tuple[int, str], Dict] = {}
+        for row in rows:
+            if not row.get("session_id"):
+                continue
+            key = (row["user_id"], row["session_id"])
+            total = totals.get(key)
+            if total is None:
+                total = totals[key] = {
+                    "b_user_id": key[0],
+                    "b_session_id": key[1],
+                    "b_record_count": 0,
+                    "b_score_sum": 0.0,
+                    "b_all_normal_count": 0,
+                    "b_last_record_at": row["created_at"]
+                }
+            total["b_record_count"] += 1
+            total["b_score_sum"] += row["score"] or 0.0
+            total["b_all_normal_count"] += bool(
+                row["is_neck_angle_normal"] and row["is_forward_head_normal"] and row["is_head_tilt_normal"]
+            )
+            total["b_last_record_at"] = max(total["b_last_record_at"], row["created_at"])
+        return list(totals.values())
+
+    def apply(self, db: Session, rows: List[Dict]) -> None:
+        """
+        새로 저장되는 자세 기록을 세션 누적 집계에 반영 (커밋은 호출자가 담당)
+
+        기록 INSERT와 같은 트랜잭션에서 호출하여 원본과 집계가 함께 커밋되도록 함
+        """
+        increments = self._aggregate(rows)
+        if increments:
+            db.execute(_APPLY_STATEMENT, increments)
+
+
+# CRUD 인스턴스
+posture_session = CRUDPostureSession()
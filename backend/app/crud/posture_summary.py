@@ -0,0 +1,253 @@
+"""
+Posture Check App Backend - 자세 기록 압축 (세션/분 단위 요약)
+
+실시간 분석은 analysis_interval(기본 5초)마다 거의 같은 기록을 저장하므로
+오래된 원본 기록을 요약 행으로 묶어 저장 공간과 조회 비용을 줄입니다.
+- session: (세션, 날짜)별 1행 (1시간 세션의 기록 수백 건 → 1행)
+- minute: (세션, 분)별 1행
+요약 행에는 13개 지표별 건수/최소/최대/평균/표준편차(모표준편차)와 정상 여부 기준별 정상 기록 수를 저장합니다.
+
+압축(compact_user)은 기준 시각 이전 원본 기록을 기간 창 단위로 요약 저장하고 같은 트랜잭션에서
+원본 기록과 그 분석 결과를 삭제합니다. (compact_records.py에서 실행)
+기준 시각은 자정으로 맞추므로 요약 구간이 압축된 기간과 남은 원본 기간에 걸치지 않으며,
+남아 있는 원본 기록은 모두 압축 전 기록입니다.
+일일 집계(posture_daily_rollups)는 유지되므로 통계/트렌드 조회는 영향이 없습니다.
+
+요약 해상도 조회(get_by_user)는 남아 있는 최근 원본 기록을 같은 방식으로 요약한 행과
+저장된 요약 행을 이어서 반환합니다.
+"""
+
+import logging
+from datetime import datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from ..core.config import settings
+from ..models.posture import PostureAnalysis, PostureRecordSummary
+from .posture_export import FLAG_COLUMNS, METRIC_COLUMNS
+from .posture_partition import posture_partitions
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_RESOLUTIONS = ("session", "minute")
+
+# 정상 여부 컬럼 → 요약 테이블 정상 기록 수 컬럼
+FLAG_COUNT_COLUMNS = {
+    "is_neck_angle_normal": "neck_angle_normal_count",
+    "is_forward_head_normal": "forward_head_normal_count",
+    "is_head_tilt_normal": "head_tilt_normal_count",
+}
+
+# 요약에 필요한 원본 기록 컬럼
+SOURCE_COLUMNS = ["created_at", "session_id", *METRIC_COLUMNS, *FLAG_COLUMNS]
+
+
+class CRUDPostureRecordSummary:
+    def summarize(self, user_id: int, rows: List[Dict], resolution: str) -> List[Dict]:
+        """
+        원본 기록(SOURCE_COLUMNS dict) 목록을 요약 행 컬럼 값 목록으로 변환 (period_start 내림차순)
+
+        구간별 통계는 NumPy bincount / ufunc.at으로 한 번에 계산
+        """
+        if resolution not in SUMMARY_RESOLUTIONS:
+            raise ValueError(f"지원하지 않는 요약 단위입니다: {resolution} (session 또는 minute)")
+        if not rows:
+            return []
+
+        created_at = np.array([row["created_at"] for row in rows], dtype="datetime64[us]")
+        bucket = created_at.astype("datetime64[D]" if resolution == "session" else "datetime64[m]")
+        keys = list(zip((row["session_id"] for row in rows), bucket.tolist()))
+        index: Dict[Tuple, int] = {}
+        inverse = np.fromiter((index.setdefault(key, len(index)) for key in keys), dtype=np.int64, count=len(keys))
+        groups = len(index)
+
+        counts = np.bincount(inverse, minlength=groups)
+        timestamps = created_at.astype(np.int64)
+        period_start = np.full(groups, np.iinfo(np.int64).max)
+        period_end = np.full(groups, np.iinfo(np.int64).min)
+        np.minimum.at(period_start, inverse, timestamps)
+        np.maximum.at(period_end, inverse, timestamps)
+
+        metrics = {}
+        for metric in METRIC_COLUMNS:
+            values = np.array([row[metric] for row in rows], dtype=np.float64)
+            valid = ~np.isnan(values)
+            filled = np.where(valid, values, 0.0)
+            metric_counts = np.bincount(inverse, weights=valid, minlength=groups)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                mean = np.bincount(inverse, weights=filled, minlength=groups) / metric_counts
+                square_mean = np.bincount(inverse, weights=filled * filled, minlength=groups) / metric_counts
+            minimum = np.full(groups, np.inf)
+            maximum = np.full(groups, -np.inf)
+            np.minimum.at(minimum, inverse, np.where(valid, values, np.inf))
+            np.maximum.at(maximum, inverse, np.where(valid, values, -np.inf))
+            metrics[metric] = (
+                metric_counts.astype(np.int64), minimum, maximum, mean,
+                np.sqrt(np.maximum(square_mean - mean * mean, 0.0))
+            )
+
+        flag_counts = {
+            column: np.bincount(
+                inverse, weights=np.array([bool(row[flag]) for row in rows]), minlength=groups
+            ).astype(np.int64)
+            for flag, column in FLAG_COUNT_COLUMNS.items()
+        }
+
+        summaries = []
+        for group, (session_id, _) in enumerate(index):
+            summary = {
+                "user_id": user_id,
+                "resolution": resolution,
+                "session_id": session_id,
+                "period_start": _to_datetime(period_start[group]),
+                "period_end": _to_datetime(period_end[group]),
+                "record_count": int(counts[group]),
+                **{column: int(values[group]) for column, values in flag_counts.items()},
+                "metrics": {}
+            }
+            for metric, (metric_counts, minimum, maximum, mean, std) in metrics.items():
+                count = int(metric_counts[group])
+                summary["metrics"][metric] = {
+                    "count": count,
+                    "min": round(float(minimum[group]), 4) if count else None,
+                    "max": round(float(maximum[group]), 4) if count else None,
+                    "mean": round(float(mean[group]), 4) if count else None,
+                    "std": round(float(std[group]), 4) if count else None
+                }
+            summaries.append(summary)
+        summaries.sort(key=lambda summary: summary["period_start"], reverse=True)
+        return summaries
+
+    def _select_records(self, db: Session, user_id: int, start_date: Optional[datetime], end_date: Optional[datetime]):
+        records = posture_partitions.source(db, start_date, end_date).c
+        stmt = select(*(records[column] for column in SOURCE_COLUMNS)).where(records.user_id == user_id)
+        if start_date:
+            stmt = stmt.where(records.created_at >= start_date)
+        return records, stmt
+
+    def compact_user(
+        self,
+        db: Session,
+        user_id: int,
+        before: datetime,
+        resolution: str = "session",
+        window_days: int = 7
+    ) -> Tuple[int, int]:
+        """
+        사용자의 before(자정으로 내림) 이전 원본 기록을 요약 행으로 압축하고 원본 기록과 분석 결과 삭제
+
+        window_days일 단위로 나누어 창마다 커밋 (반환값: (압축한 원본 기록 수, 저장한 요약 행 수))
+        """
+        if resolution not in SUMMARY_RESOLUTIONS:
+            raise ValueError(f"지원하지 않는 요약 단위입니다: {resolution} (session 또는 minute)")
+        before = datetime.combine(before.date(), time())
+        records = posture_partitions.source(db, None, before).c
+        oldest = db.execute(
+            select(func.min(records.created_at)).where(records.user_id == user_id, records.created_at < before)
+        ).scalar()
+        if oldest is None:
+            return 0, 0
+
+        compacted = saved = 0
+        window_start = datetime.combine(oldest.date(), time())
+        while window_start < before:
+            window_end = min(window_start + timedelta(days=window_days), before)
+            try:
+                records, stmt = self._select_records(db, user_id, window_start, window_end)
+                rows = [dict(row._mapping) for row in db.execute(stmt.where(records.created_at < window_end))]
+                summaries = self.summarize(user_id, rows, resolution)
+                if summaries:
+                    db.execute(insert(PostureRecordSummary), summaries)
+                    for table in posture_partitions.tables(db, window_start, window_end):
+                        in_window = (
+                            table.c.user_id == user_id,
+                            table.c.created_at >= window_start,
+                            table.c.created_at < window_end
+                        )
+                        db.execute(delete(PostureAnalysis).where(
+                            PostureAnalysis.record_id.in_(select(table.c.id).where(*in_window))
+                        ))
+                        db.execute(delete(table).where(*in_window))
+                db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            compacted += len(rows)
+            saved += len(summaries)
+            window_start = window_end
+
+        logger.info(
+            "자세 기록 압축: user_id=%s 원본 %d건 → 요약 %d행", user_id, compacted, saved,
+            extra={"user_id": user_id, "resolution": resolution}
+        )
+        return compacted, saved
+
+    def get_by_user(
+        self,
+        db: Session,
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 100,
+        resolution: Optional[str] = None
+    ) -> List[PostureRecordSummary]:
+        """
+        사용자의 요약 해상도 자세 기록 조회 (period_start 내림차순, 최대 limit행)
+
+        남아 있는 원본 기록을 최신순으로 읽어 resolution 단위로 요약한 행(저장 전 객체, id 없음)을 먼저 채우고,
+        부족하면 압축 작업이 저장한 요약 행으로 채움
+        resolution이 없으면 POSTURE_COMPACTION_RESOLUTION (저장된 요약 행은 압축 당시 단위 그대로)
+        """
+        resolution = resolution or settings.POSTURE_COMPACTION_RESOLUTION
+        records, stmt = self._select_records(db, user_id, start_date, end_date)
+        if end_date:
+            stmt = stmt.where(records.created_at <= end_date)
+        stmt = stmt.order_by(records.created_at.desc()).execution_options(
+            stream_results=True, yield_per=settings.POSTURE_RECORDS_STREAM_CHUNK_SIZE
+        )
+        rows = self._complete_buckets(db.execute(stmt), resolution, limit)
+        results = [PostureRecordSummary(**values) for values in self.summarize(user_id, rows, resolution)[:limit]]
+
+        if len(results) < limit:
+            query = db.query(PostureRecordSummary).filter(PostureRecordSummary.user_id == user_id)
+            if start_date:
+                query = query.filter(PostureRecordSummary.period_start >= start_date)
+            if end_date:
+                query = query.filter(PostureRecordSummary.period_start <= end_date)
+            results += query.order_by(
+                PostureRecordSummary.period_start.desc(), PostureRecordSummary.id.desc()
+            ).limit(limit - len(results)).all()
+        return results
+
+    def _complete_buckets(self, result: Iterable, resolution: str, limit: int) -> List[Dict]:
+        """
+        최신순 원본 기록에서 요약 구간 limit개가 완성될 때까지만 읽기
+
+        구간 경계(분/날짜)를 넘어 더 오래된 기록이 나오면 이전 구간은 모두 완성된 것이므로
+        그때까지 모은 구간이 limit개 이상이면 중단
+        """
+        unit = "datetime64[D]" if resolution == "session" else "datetime64[m]"
+        rows: List[Dict] = []
+        keys = set()
+        current_bucket = None
+        for row in result:
+            values = dict(row._mapping)
+            bucket = np.datetime64(values["created_at"]).astype(unit)
+            if bucket != current_bucket:
+                if len(keys) >= limit:
+                    break
+                current_bucket = bucket
+            keys.add((values["session_id"], bucket.item()))
+            rows.append(values)
+        return rows
+
+
+def _to_datetime(value: np.int64) -> datetime:
+    return np.datetime64(int(value), "us").astype(datetime)
+
+
+# CRUD 인스턴스
+posture_record_summary = CRUDPostureRecordSummary()
@@ -1,8 +1,16 @@
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
+import logging
 from ..models.user import User
+from ..models.posture import PostureAnalysis, PostureDailyRollup, PostureRecord, PostureRecordSummary, PostureSession
 from ..schemas.user import UserCreate, UserUpdate
-from ..core.security import get_password_hash, verify_password
+from ..core.security import get_password_hash, verify_password, verify_password_async, invalidate_principal
+from ..core.cache import query_cache, user_namespace
+from .posture_partition import posture_partitions
+
+logger = logging.getLogger(__name__)
 
 class CRUDUser:
     def __init__(self):
@@ -44,8 +52,27 @@ class CRUDUser:
         db.add(db_obj)
         db.commit()
         db.refresh(db_obj)
+        invalidate_principal(db_obj.id)
         return db_obj
     
+    def remove(self, db: Session, db_obj: User) -> None:
+        """
+        사용자 삭제 (자세 분석 결과/일일 집계/기록 요약/기록/세션, SQLite 기간별 테이블의 기록 포함)
+        
+        db.delete(user)는 지연 로딩 관계(posture_records 등)를 전부 불러와 외래 키를 NULL로 바꾸려 하므로
+        (기록이 많을수록 느리고 user_id NOT NULL 제약으로 실패) 하위 테이블부터 DELETE 문으로 일괄 삭제
+        """
+        user_id = db_obj.id
+        for model in (PostureAnalysis, PostureDailyRollup, PostureRecordSummary, PostureRecord, PostureSession):
+            db.query(model).filter(model.user_id == user_id).delete(synchronize_session=False)
+        for table in posture_partitions.period_tables(db):
+            db.execute(delete(table).where(table.c.user_id == user_id))
+        db.query(User).filter(User.id == user_id).delete(synchronize_session=False)
+        db.commit()
+        db.expunge(db_obj)
+        invalidate_principal(user_id)
+        query_cache.invalidate(user_namespace(user_id))
+    
     def authenticate(self, db: Session, username: str, password: str) -> Optional[User]:
         """사용자명으로 사용자 인증"""
         user = self.get_by_username(db, username=username)
@@ -57,20 +84,55 @@ class CRUDUser:
     
     def authenticate_by_email(self, db: Session, email: str, password: str) -> Optional[User]:
         """이메일로 사용자 인증"""
-        print(f"🔍 인증 시도: email={email}")
+        logger.debug("인증 시도: email=%s", email)
         
         user = self.get_by_email(db, email=email)
         if not user:
-            print(f"❌ 사용자를 찾을 수 없음: {email}")
+            logger.debug("사용자를 찾을 수 없음: %s", email)
             return None
         
-        print(f"✅ 사용자 발견: username={user.username}, user_id={user.id}")
+        logger.debug("사용자 발견: username=%s, user_id=%s", user.username, user.id)
         
         if not verify_password(password, user.hashed_password):
-            print(f"❌ 비밀번호 불일치: {email}")
+            logger.debug("비밀번호 불일치: %s", email)
             return None
         
-        print(f"✅ 인증 성공: {email}")
+        logger.debug("인증 성공: %s", email)
+        return user
+    
+    def is_active(self, user: User) -> bool:
+        """사용자 활성 상태 확인"""
+        return user.is_active
+
+class AsyncCRUDUser:
+    """
+    사용자 비동기 CRUD
+    
+    조회는 AsyncSession.run_sync로 동기 CRUD를 재사용하고,
+    CPU를 오래 사용하는 bcrypt 검증은 해싱 워커 풀에서 실행하여 이벤트 루프를 막지 않음
+    """
+    def __init__(self, sync_crud: CRUDUser):
+        self.sync_crud = sync_crud
+    
+    async def get(self, db: AsyncSession, id: int) -> Optional[User]:
+        """ID로 사용자 조회"""
+        return await db.run_sync(self.sync_crud.get, id)
+    
+    async def get_by_email(self, db: AsyncSession, email: str) -> Optional[User]:
+        """이메일로 사용자 조회"""
+        return await db.run_sync(self.sync_crud.get_by_email, email)
+    
+    async def get_by_username(self, db: AsyncSession, username: str) -> Optional[User]:
+        """사용자명으로 사용자 조회"""
+        return await db.run_sync(self.sync_crud.get_by_username, username)
+    
+    async def authenticate_by_email(self, db: AsyncSession, email: str, password: str) -> Optional[User]:
+        """이메일로 사용자 인증"""
+        user = await self.get_by_email(db, email=email)
+        if not user:
+            return None
+        if not await verify_password_async(password, user.hashed_password):
+            return None
         return user
     
     def is_active(self, user: User) -> bool:
@@ -78,4 +140,5 @@ class CRUDUser:
         return user.is_active
 
 # CRUD 인스턴스
-user = CRUDUser() 
\ No newline at end of file
+user = CRUDUser()
+async_user = AsyncCRUDUser(user) 
\ No newline at end of file
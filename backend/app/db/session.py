@@ -2,12 +2,16 @@
 Posture Check App Backend - 데이터베이스 세션 관리 모듈
 
 이 모듈은 SQLAlchemy를 사용한 데이터베이스 연결 및 세션 관리를 담당합니다.
-- 데이터베이스 엔진 생성
+- 데이터베이스 엔진 생성 (동기 + 비동기)
 - 세션 팩토리 설정
 - 연결 풀 관리
+
+비동기 엔진(asyncio)은 API 핫 패스 엔드포인트에서 사용하고,
+동기 엔진은 migrate_db.py 같은 스크립트와 나머지 엔드포인트에서 사용합니다.
 """
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from ..core.config import settings
@@ -36,6 +40,37 @@ engine = create_engine(
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 드라이버 매핑 (동기 드라이버 → asyncio 드라이버)
+ASYNC_DRIVERS = {
+    "mysql+pymysql": "mysql+aiomysql",
+    "mysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+}
+
+def get_async_database_url(url: str) -> str:
+    """동기 데이터베이스 URL을 비동기 드라이버 URL로 변환"""
+    scheme, sep, rest = url.partition("://")
+    return ASYNC_DRIVERS.get(scheme, scheme) + sep + rest
+
+# 비동기 SQLAlchemy 엔진 생성 (연결 풀 설정은 동기 엔진과 동일)
+async_engine = create_async_engine(
+    get_async_database_url(DATABASE_URL),
+    pool_pre_ping=True,
+    pool_recycle=300,
+    pool_size=10,
+    max_overflow=20,
+    echo=False
+)
+
+# 비동기 세션 팩토리 생성
+# expire_on_commit=False: 커밋 후 응답 직렬화 시 지연 로딩(I/O)이 발생하지 않도록 함
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False, class_=AsyncSession
+)
+
 # 베이스 클래스 생성
 Base = declarative_base()
 
@@ -51,6 +86,15 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    """
+    비동기 데이터베이스 세션 생성기
+    
+    각 요청마다 새로운 AsyncSession을 생성하고 요청 완료 후 자동으로 닫힘
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
 def init_db():
     """
     데이터베이스 초기화
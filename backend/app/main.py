@@ -9,15 +9,28 @@ Posture Check App Backend - 메인 애플리케이션
 """
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-from contextlib import contextmanager
-import pymysql
+import logging
 import os
 
 # 설정 및 데이터베이스 모듈 import
 from .core.config import settings
-from .db.session import init_db, get_db
+from .core.log import logging_manager
+from .db.session import init_db, get_db, engine, async_engine, SessionLocal
 from .api.v1.routers import api_router
+from .crud.posture_buffer import posture_write_buffer
+from .crud.posture_analysis_worker import posture_analysis_worker
+from .crud.posture_partition import posture_partitions
+from .core.session_store import session_store
+from .core.password_hasher import password_hasher
+from .core.health import readiness_checker
+from .core.metrics import MetricsMiddleware, metrics_registry, setup_metrics
+from .core.query_budget import QueryProfilerMiddleware, setup_query_profiling
+
+# 로깅 설정 (JSON Lines, 출력은 백그라운드 스레드에서 수행)
+logging_manager.setup()
+logger = logging.getLogger(__name__)
 
 # FastAPI 애플리케이션 인스턴스 생성
 app = FastAPI(
@@ -66,6 +79,16 @@ app.add_middleware(
     max_age=86400,  # CORS 프리플라이트 캐시 시간 (24시간)
 )
 
+# 성능 지표 미들웨어 (라우트별 처리 시간, 처리 중 요청 수, 요청별 SQL 통계)
+if settings.METRICS_ENABLED:
+    setup_metrics()
+    app.add_middleware(MetricsMiddleware)
+
+# 요청별 SQL 프로파일링 / 쿼리 예산 검사 (로컬/테스트/스테이징)
+if settings.QUERY_PROFILING_ENABLED:
+    setup_query_profiling()
+    app.add_middleware(QueryProfilerMiddleware, strict=settings.QUERY_BUDGET_STRICT)
+
 # API 라우터 등록
 # v1 API의 모든 엔드포인트를 /api/v1 경로에 등록
 app.include_router(api_router, prefix=settings.API_V1_STR)
@@ -77,12 +100,11 @@ def get_db_config():
     """
     # USE_LOCAL_CONFIG 환경 변수로 로컬/배포 환경 구분
     use_local_config = os.environ.get("USE_LOCAL_CONFIG", "false").lower() == "true"
-    print(f"🔧 USE_LOCAL_CONFIG: {os.environ.get('USE_LOCAL_CONFIG')}")
-    print(f"🔧 use_local_config: {use_local_config}")
+    logger.debug("USE_LOCAL_CONFIG: %s (use_local_config=%s)", os.environ.get('USE_LOCAL_CONFIG'), use_local_config)
     
     if use_local_config:
         # 로컬 환경에서는 기본 설정 사용
-        print(f"🔧 로컬 설정 사용: {settings.DB_USER}@{settings.DB_HOST}:{settings.DB_PORT}")
+        logger.debug("로컬 설정 사용: %s@%s:%s", settings.DB_USER, settings.DB_HOST, settings.DB_PORT)
         return {
             'host': settings.DB_HOST,
             'port': settings.DB_PORT,
@@ -134,27 +156,6 @@ def get_db_config():
         'charset': 'utf8mb4'
     }
 
-@contextmanager
-def get_db_connection():
-    """
-    데이터베이스 연결을 관리하는 컨텍스트 매니저
-    
-    PyMySQL을 사용한 직접 데이터베이스 연결
-    SQLAlchemy와 별도로 헬스 체크용으로 사용
-    """
-    connection = None
-    try:
-        db_config = get_db_config()
-        print(f"데이터베이스 연결 시도: {db_config['host']}:{db_config['port']}")
-        connection = pymysql.connect(**db_config)
-        yield connection
-    except Exception as e:
-        print(f"데이터베이스 연결 오류: {e}")
-        raise
-    finally:
-        if connection:
-            connection.close()
-
 @app.on_event("startup")
 async def startup_event():
     """
@@ -163,21 +164,61 @@ async def startup_event():
     - 데이터베이스 테이블 자동 생성
     - 초기 설정 및 로그 출력
     """
-    print("🚀 Posture Check App Backend 시작 중...")
+    logger.info("Posture Check App Backend 시작 중")
     
     # 데이터베이스 설정 정보 출력
     db_config = get_db_config()
-    print(f"📊 데이터베이스 설정: {db_config['host']}:{db_config['port']}")
+    logger.info("데이터베이스 설정: %s:%s", db_config['host'], db_config['port'])
     
     try:
         # SQLAlchemy를 사용한 데이터베이스 테이블 생성
         init_db()
-        print("✅ 데이터베이스 테이블 생성 완료")
+        logger.info("데이터베이스 테이블 생성 완료")
+        
+        # SQLite 기간별 테이블 목록 미리 읽기 (자세 기록 조회 시 추가 쿼리 방지)
+        with SessionLocal() as db:
+            posture_partitions.warm_up(db)
     except Exception as e:
-        print(f"❌ 데이터베이스 초기화 실패: {e}")
-        print("💡 환경 변수 설정을 확인해주세요:")
-        print("   - DATABASE_URL 또는 MYSQL_PUBLIC_URL 설정")
-        print("   - 또는 DB_HOST, DB_PORT, DB_USER, DB_PASSWORD, DB_NAME 설정")
+        logger.error(
+            "데이터베이스 초기화 실패: %s (환경 변수 DATABASE_URL 또는 MYSQL_PUBLIC_URL, "
+            "또는 DB_HOST, DB_PORT, DB_USER, DB_PASSWORD, DB_NAME 설정을 확인해주세요)", e
+        )
+    
+    # 실시간 분석 세션 만료 정리 스레드 시작
+    session_store.start_sweeper()
+    
+    # 쓰기 지연 모드: 자세 기록 일괄 저장 스레드 시작
+    if settings.POSTURE_WRITE_BEHIND_ENABLED:
+        posture_write_buffer.start()
+        logger.info("자세 기록 쓰기 지연 버퍼 시작")
+    
+    # 저장된 자세 기록 백그라운드 분석 스레드 시작
+    if settings.POSTURE_ANALYSIS_WORKER_ENABLED:
+        posture_analysis_worker.start()
+        logger.info("자세 분석 워커 시작")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """
+    애플리케이션 종료 시 실행되는 이벤트 핸들러
+    
+    - 쓰기 지연 버퍼에 남은 자세 기록 저장
+    - 자세 분석 워커 종료
+    - 세션 만료 정리 스레드 종료
+    - 비밀번호 해싱 워커 프로세스 종료
+    - 비동기 데이터베이스 연결 풀 정리
+    """
+    session_store.stop_sweeper()
+    password_hasher.shutdown()
+    await async_engine.dispose()
+    
+    if posture_write_buffer.is_running:
+        posture_write_buffer.stop()
+        logger.info("자세 기록 쓰기 지연 버퍼 종료 (남은 기록 저장 완료)")
+    
+    if posture_analysis_worker.is_running:
+        posture_analysis_worker.stop()
+        logger.info("자세 분석 워커 종료")
 
 @app.get("/")
 @app.head("/")
@@ -198,40 +239,60 @@ def read_root():
 @app.head("/health")
 def health_check():
     """
-    헬스 체크 엔드포인트
+    헬스 체크 엔드포인트 (기존 응답 형식 유지)
     
     애플리케이션과 데이터베이스 연결 상태를 확인
+    readiness와 같은 캐시된 결과를 사용하므로 매 호출마다 DB에 접근하지 않음
     """
-    try:
-        # 데이터베이스 연결 테스트
-        with get_db_connection() as conn:
-            with conn.cursor() as cursor:
-                cursor.execute("SELECT 1")
-                result = cursor.fetchone()
-                if result[0] == 1:
-                    db_config = get_db_config()
-                    return {
-                        "status": "healthy",
-                        "database": "connected",
-                        "database_host": db_config['host'],
-                        "database_port": db_config['port'],
-                        "message": "애플리케이션이 정상적으로 작동 중입니다."
-                    }
-    except Exception as e:
-        db_config = get_db_config()
-        return {
-            "status": "unhealthy",
-            "database": "disconnected",
-            "database_host": db_config['host'],
-            "database_port": db_config['port'],
-            "error": str(e),
-            "message": "데이터베이스 연결에 문제가 있습니다."
-        }
-    
-    return {
-        "status": "unhealthy",
-        "message": "알 수 없는 오류가 발생했습니다."
+    result = readiness_checker.check()
+    response = {
+        "status": "healthy" if result["ready"] else "unhealthy",
+        "database": result["database"],
+        "database_host": engine.url.host,
+        "database_port": engine.url.port,
+        "message": "애플리케이션이 정상적으로 작동 중입니다." if result["ready"] else "데이터베이스 연결에 문제가 있습니다."
     }
+    if not result["ready"]:
+        response["error"] = result.get("error")
+    return response
+
+@app.get("/health/live")
+@app.head("/health/live")
+def liveness_check():
+    """
+    liveness 엔드포인트
+    
+    프로세스가 요청에 응답하는지만 확인 (DB에 접근하지 않음)
+    """
+    return {"status": "alive"}
+
+@app.get("/health/ready")
+@app.head("/health/ready")
+def readiness_check():
+    """
+    readiness 엔드포인트
+    
+    연결 풀에서 빌린 연결로 DB 상태를 확인하고(HEALTH_READINESS_CACHE_SECONDS 동안 캐시)
+    연결 풀 상태(크기, 사용 중, 오버플로우)를 함께 반환
+    DB에 연결할 수 없으면 503
+    """
+    report = readiness_checker.report()
+    return JSONResponse(
+        status_code=200 if report["ready"] else 503,
+        content={"status": "ready" if report["ready"] else "not_ready", **report}
+    )
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """
+    Prometheus 형식 성능 지표
+    
+    라우트별 처리 시간 히스토그램, 처리 중 요청 수, 라우트별 SQL 실행 횟수/시간,
+    연결 풀 상태, 비밀번호 해싱 시간, 자세 기록/분석 저장 건수
+    """
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=404, detail="성능 지표가 비활성화되어 있습니다")
+    return PlainTextResponse(metrics_registry.render(), media_type="text/plain; version=0.0.4")
 
 @app.get("/api/test")
 def api_test():
@@ -5,11 +5,13 @@ Posture Check App Backend - 모델 패키지
 """
 
 from .user import User
-from .posture import PostureRecord, PostureSession, PostureAnalysis
+from .posture import PostureRecord, PostureSession, PostureAnalysis, PostureDailyRollup, PostureRecordSummary
 
 __all__ = [
     "User",
     "PostureRecord", 
     "PostureSession", 
-    "PostureAnalysis"
+    "PostureAnalysis",
+    "PostureDailyRollup",
+    "PostureRecordSummary"
 ] 
\ No newline at end of file
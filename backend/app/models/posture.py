@@ -5,9 +5,11 @@ Posture Check App Backend - 자세 모델
 - PostureRecord: 개별 자세 측정 기록 (13개 지표)
 - PostureSession: 자세 측정 세션 관리
 - PostureAnalysis: 자세 분석 결과 및 통계
+- PostureDailyRollup: 사용자별 일일 자세 집계 (트렌드/통계 조회용)
+- PostureRecordSummary: 압축된 오래된 자세 기록의 세션/분 단위 요약
 """
 
-from sqlalchemy import Column, Integer, BigInteger, String, Float, DateTime, Boolean, Text, ForeignKey, JSON
+from sqlalchemy import Column, Integer, BigInteger, String, Float, Date, DateTime, Boolean, Text, ForeignKey, JSON, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from ..db.session import Base
@@ -16,22 +18,41 @@ class PostureSession(Base):
     """
     자세 측정 세션 모델
     
-    자세 측정 세션의 기본 정보를 관리
+    /analysis/start에서 생성하고 /analysis/stop에서 종료
+    기록 저장 시 같은 트랜잭션에서 누적 컬럼을 증분 갱신하므로 세션 조회 시 기록을 다시 읽지 않음 (crud/posture_session.py)
     """
     __tablename__ = "posture_sessions"
     
     id = Column(Integer, primary_key=True, index=True, comment="세션 고유 ID")
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, comment="사용자 ID")
+    session_id = Column(String(50), nullable=False, comment="세션 ID (posture_records.session_id)")
     session_name = Column(String(200), nullable=True, comment="세션 이름")
+    device_info = Column(String(200), nullable=True, comment="기기 정보")
     start_time = Column(DateTime(timezone=True), server_default=func.now(), comment="세션 시작 시간")
     end_time = Column(DateTime(timezone=True), nullable=True, comment="세션 종료 시간")
     is_active = Column(Boolean, default=True, comment="세션 활성화 상태")
     
+    # ==================== 누적 집계 (기록 저장 시 증분 갱신) ====================
+    total_records = Column(Integer, nullable=False, default=0, comment="기록 수")
+    score_sum = Column(Float, nullable=False, default=0.0, comment="종합 점수 합계")
+    all_normal_count = Column(Integer, nullable=False, default=0, comment="세 기준 모두 정상인 기록 수")
+    average_score = Column(Float, nullable=True, comment="평균 종합 점수")
+    last_record_at = Column(DateTime(timezone=True), nullable=True, comment="마지막 측정 시간")
+    duration_seconds = Column(Integer, nullable=True, comment="세션 길이 (초, 종료 시 계산)")
+    
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), comment="생성 시간")
+    
     # 관계 설정
     user = relationship("User", back_populates="posture_sessions")
     
+    # 인덱스: 세션 ID로 누적 갱신/조회, 사용자별 최근 세션 목록 (alembic 0006)
+    __table_args__ = (
+        Index("uq_posture_sessions_session_id", "session_id", unique=True),
+        Index("ix_posture_sessions_user_id_start_time", "user_id", "start_time"),
+    )
+    
     def __repr__(self):
-        return f"<PostureSession(id={self.id}, user_id={self.user_id}, name='{self.session_name}')>"
+        return f"<PostureSession(id={self.id}, user_id={self.user_id}, session_id='{self.session_id}', total_records={self.total_records})>"
 
 class PostureRecord(Base):
     """
@@ -103,6 +124,15 @@ class PostureRecord(Base):
     # 관계 설정
     user = relationship("User", back_populates="posture_records")
     
+    # 인덱스: 모든 조회가 user_id + created_at 범위로 필터링 (alembic 0001에서 운영 DB에 추가), 세션별 기록 조회 (alembic 0006)
+    # MySQL/PostgreSQL은 alembic 0004에서 created_at 월 단위 파티션으로 변환 (기본 키 (id, created_at))
+    # SQLite는 기간별 테이블로 옮긴 뒤에도 ID가 재사용되지 않도록 AUTOINCREMENT 사용 (crud/posture_partition.py)
+    __table_args__ = (
+        Index("ix_posture_records_user_id_created_at", "user_id", "created_at"),
+        Index("ix_posture_records_session_id", "session_id"),
+        {"sqlite_autoincrement": True},
+    )
+    
     def __repr__(self):
         return f"<PostureRecord(id={self.id}, user_id={self.user_id}, score={self.score})>"
 
@@ -142,5 +172,75 @@ class PostureAnalysis(Base):
     # 관계 설정
     user = relationship("User", back_populates="posture_analyses")
     
+    # 인덱스: 기록별 분석 결과 조회와 미분석 기록 확인(NOT EXISTS), 규칙 버전별 중복 저장 방지 (alembic 0003)
+    __table_args__ = (
+        Index("uq_posture_analyses_record_version", "record_id", "analysis_version", unique=True),
+    )
+    
+    def __repr__(self):
+        return f"<PostureAnalysis(id={self.id}, record_id={self.record_id}, score={self.overall_score})>" 
+
+class PostureDailyRollup(Base):
+    """
+    일일 자세 집계 모델
+    
+    (user_id, date)별 누적 합계와 건수를 저장하며, 자세 기록 저장 시 함께 갱신됨
+    트렌드/통계 조회는 원본 기록 대신 이 테이블을 사용
+    """
+    __tablename__ = "posture_daily_rollups"
+    
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True, comment="사용자 ID")
+    date = Column(Date, primary_key=True, comment="집계 날짜")
+    
+    # ==================== 누적 건수 / 합계 ====================
+    record_count = Column(Integer, nullable=False, default=0, comment="기록 수")
+    score_sum = Column(Float, nullable=False, default=0.0, comment="종합 점수 합계")
+    neck_angle_sum = Column(Float, nullable=False, default=0.0, comment="목 각도 합계")
+    forward_head_distance_sum = Column(Float, nullable=False, default=0.0, comment="전방 머리 거리 합계")
+    
+    # ==================== 정상 여부 건수 ====================
+    neck_angle_normal_count = Column(Integer, nullable=False, default=0, comment="목 각도 정상 기록 수")
+    forward_head_normal_count = Column(Integer, nullable=False, default=0, comment="전방 머리 정상 기록 수")
+    head_tilt_normal_count = Column(Integer, nullable=False, default=0, comment="머리 기울기 정상 기록 수")
+    all_normal_count = Column(Integer, nullable=False, default=0, comment="세 기준 모두 정상인 기록 수")
+    
+    # 시간 정보
+    last_created_at = Column(DateTime(timezone=True), nullable=True, comment="해당 날짜 마지막 측정 시간")
+    
+    def __repr__(self):
+        return f"<PostureDailyRollup(user_id={self.user_id}, date={self.date}, record_count={self.record_count})>"
+
+class PostureRecordSummary(Base):
+    """
+    자세 기록 요약 모델
+    
+    압축 작업(compact_records.py)이 오래된 원본 기록을 (세션, 날짜) 또는 (세션, 분) 단위로 묶어 저장하고
+    원본 기록은 삭제함 (지표별 통계는 metrics JSON: {지표: {count, min, max, mean, std}})
+    """
+    __tablename__ = "posture_record_summaries"
+    
+    id = Column(Integer, primary_key=True, index=True, comment="요약 고유 ID")
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, comment="사용자 ID")
+    resolution = Column(String(10), nullable=False, comment="요약 단위 (session, minute)")
+    session_id = Column(String(50), nullable=True, comment="세션 ID")
+    
+    # ==================== 요약 구간 ====================
+    period_start = Column(DateTime(timezone=True), nullable=False, comment="구간 첫 측정 시간")
+    period_end = Column(DateTime(timezone=True), nullable=False, comment="구간 마지막 측정 시간")
+    
+    # ==================== 건수 ====================
+    record_count = Column(Integer, nullable=False, comment="원본 기록 수")
+    neck_angle_normal_count = Column(Integer, nullable=False, default=0, comment="목 각도 정상 기록 수")
+    forward_head_normal_count = Column(Integer, nullable=False, default=0, comment="전방 머리 정상 기록 수")
+    head_tilt_normal_count = Column(Integer, nullable=False, default=0, comment="머리 기울기 정상 기록 수")
+    
+    # ==================== 지표별 통계 ====================
+    metrics = Column(JSON, nullable=False, comment="지표별 건수/최소/최대/평균/표준편차")
+    
+    # 인덱스: 사용자별 기간 조회
+    __table_args__ = (
+        Index("ix_posture_record_summaries_user_id_period_start", "user_id", "period_start"),
+    )
+    
     def __repr__(self):
-        return f"<PostureAnalysis(id={self.id}, record_id={self.record_id}, score={self.overall_score})>" 
\ No newline at end of file
+        return f"<PostureRecordSummary(id={self.id}, user_id={self.user_id}, resolution='{self.resolution}', record_count={self.record_count})>"
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, validator
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from datetime import datetime
 
 # Posture Record 관련 스키마 (프론트엔드 13개 필드 반영)
@@ -32,7 +32,7 @@ class PostureRecordCreate(PostureRecordBase):
     pass
 
 class PostureRecord(PostureRecordBase):
-    id: int
+    id: Optional[int] = None  # 쓰기 지연 모드에서는 저장 전이므로 None
     user_id: int
     is_neck_angle_normal: Optional[bool] = None
     is_forward_head_normal: Optional[bool] = None
@@ -42,6 +42,33 @@ class PostureRecord(PostureRecordBase):
     class Config:
         from_attributes = True
 
+class PostureRecordPage(BaseModel):
+    items: List[PostureRecord]
+    next_cursor: Optional[str] = None  # 다음 페이지 요청 시 cursor로 전달 (마지막 페이지면 None)
+
+class MetricSummary(BaseModel):
+    count: int  # 값이 있는 기록 수 (0이면 나머지는 None)
+    min: Optional[float] = None
+    max: Optional[float] = None
+    mean: Optional[float] = None
+    std: Optional[float] = None  # 모표준편차
+
+class PostureRecordSummary(BaseModel):
+    id: Optional[int] = None  # 압축 전 원본 기록을 요약한 행은 저장 전이므로 None
+    user_id: int
+    resolution: str  # session (세션/날짜별) 또는 minute (세션/분별)
+    session_id: Optional[str] = None
+    period_start: datetime
+    period_end: datetime
+    record_count: int
+    neck_angle_normal_count: int
+    forward_head_normal_count: int
+    head_tilt_normal_count: int
+    metrics: Dict[str, MetricSummary]  # 지표 컬럼명 → 요약 통계
+    
+    class Config:
+        from_attributes = True
+
 # 프론트엔드 요구사항에 맞는 새로운 스키마 (camelCase 필드명 사용)
 class PostureDataSave(BaseModel):
     userId: int = Field(..., description="사용자 ID")
@@ -92,6 +119,23 @@ class PostureDataSave(BaseModel):
         return v
 
 
+# 배치 저장 관련 스키마
+class PostureBatchSave(BaseModel):
+    # 개별 항목은 엔드포인트에서 PostureDataSave로 검증하여 항목별 결과를 반환
+    items: List[dict] = Field(..., min_length=1, description="PostureDataSave 형식의 측정 데이터 목록")
+
+class PostureBatchItemResult(BaseModel):
+    index: int
+    status: str  # saved, invalid, failed
+    error: Optional[str] = None
+
+class PostureBatchSaveResult(BaseModel):
+    total: int
+    saved: int
+    failed: int
+    results: List[PostureBatchItemResult]
+
+
 class PostureAnalysisConfig(BaseModel):
     user_id: int = Field(..., description="사용자 ID")
     session_id: Optional[str] = Field(None, description="세션 ID")
@@ -118,31 +162,51 @@ class PostureSession(PostureSessionBase):
     user_id: int
     start_time: datetime
     end_time: Optional[datetime] = None
-    duration_seconds: Optional[int] = None
+    is_active: bool
+    duration_seconds: Optional[int] = None  # 종료 시 계산 (진행 중이면 None)
     total_records: int
     average_score: Optional[float] = None
+    all_normal_count: int
+    last_record_at: Optional[datetime] = None
     created_at: datetime
     
     class Config:
         from_attributes = True
 
-# Posture Analysis 관련 스키마
+# 자세 일괄 분석 스키마 (지표별 배열)
+class PostureAnalyzeBatch(BaseModel):
+    columns: Dict[str, List[float]] = Field(..., description="지표 이름 → 값 배열 (13개 지표 중 없는 지표와 NaN은 측정 안 됨으로 처리)")
+
+class PostureAnalyzeBatchResult(BaseModel):
+    count: int
+    results: Dict[str, List[Any]]  # 정상 여부 플래그, 편차, severity_level 배열
+    problems: List[List[str]]
+    suggestions: List[List[str]]
+    medical_standards: Dict[str, Any]
+
+# Posture Analysis 관련 스키마 (posture_analyses 컬럼 반영)
 class PostureAnalysisBase(BaseModel):
-    problem_description: str
-    solution_suggestion: str
-    severity_level: str = Field(..., pattern="^(low|medium|high)$")
-    neck_angle_deviation: float
-    forward_head_deviation: float
-    head_tilt_deviation: float
+    overall_score: Optional[float] = None
+    overall_grade: Optional[str] = Field(None, pattern="^[ABCDF]$")
+    risk_level: Optional[str] = Field(None, pattern="^(Low|Medium|High)$")
+    neck_score: Optional[float] = None
+    shoulder_score: Optional[float] = None
+    back_score: Optional[float] = None
+    hip_score: Optional[float] = None
+    knee_score: Optional[float] = None
+    ankle_score: Optional[float] = None
+    issues: Optional[List[str]] = None           # 문제점 목록
+    recommendations: Optional[List[str]] = None  # 개선 권장사항 목록
+    analysis_version: Optional[str] = None
 
 class PostureAnalysisCreate(PostureAnalysisBase):
-    session_id: str
+    record_id: int
 
 class PostureAnalysis(PostureAnalysisBase):
     id: int
+    record_id: int
     user_id: int
-    session_id: str
-    created_at: datetime
+    analysis_time: Optional[datetime] = None
     
     class Config:
         from_attributes = True
@@ -168,7 +232,19 @@ class PostureTrend(BaseModel):
     forward_head_distance_avg: float
 
 # 의학적 기준 상수
+class MedicalStandardMetric(BaseModel):
+    metric: str
+    label: str
+    unit: str
+    region: Optional[str] = None  # 부위 (neck, shoulder)
+    min: Optional[float] = None   # 정상 범위 최소값 (None이면 검사하지 않음)
+    max: Optional[float] = None   # 정상 범위 최대값 (None이면 검사하지 않음)
+    weight: float                 # 심각도 계산 가중치
+
 class MedicalStandards(BaseModel):
-    neck_angle_normal_range: tuple = (-30, 30)  # 목 각도 정상 범위 (도)
-    forward_head_normal_max: float = 100.0  # 전방 머리 거리 최대 정상값 (mm)
-    head_tilt_normal_range: tuple = (-15, 15)  # 머리 기울기 정상 범위 (도) 
\ No newline at end of file
+    """의학적 기준 (분석 규칙 세트에서 생성)"""
+    neck_angle_normal_range: tuple  # 목 각도 정상 범위 (도)
+    forward_head_normal_max: float  # 전방 머리 거리 최대 정상값 (mm)
+    head_tilt_normal_range: tuple  # 머리 기울기 정상 범위 (도)
+    version: str  # 분석 규칙 버전
+    metrics: List[MedicalStandardMetric] = []  # 13개 지표별 기준 
\ No newline at end of file
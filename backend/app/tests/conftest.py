@@ -0,0 +1,17 @@
+"""
+테스트 공통 설정
+
+app 모듈이 설정을 읽기 전에 쿼리 예산 검사용 환경(임시 SQLite, strict 모드, 캐시 끔)을 지정합니다.
+"""
+
+import os
+import sys
+import tempfile
+
+# backend 디렉토리를 Python 경로에 추가
+backend_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, backend_dir)
+
+from benchmarks.check_query_budgets import configure_environment
+
+configure_environment(os.path.join(tempfile.mkdtemp(prefix="query_budget_"), "test.db"))
@@ -0,0 +1,30 @@
+"""
+자세 분석 엔진 테스트
+
+지표별 NumPy 배열로 실행하는 경로(analyze_arrays)의 결과가
+기록 1건씩 실행하는 경로(analyze)와 정확히 같은지 확인합니다.
+"""
+
+import numpy as np
+
+from app.core.posture_analysis import posture_analysis_engine
+from benchmarks.bench_posture_analysis import generate_columns
+
+
+def test_analyze_arrays_matches_scalar():
+    engine = posture_analysis_engine
+    columns = generate_columns(engine, 5000)
+    rows = [dict(zip(columns.keys(), values)) for values in zip(*(columns[metric].tolist() for metric in columns))]
+
+    scalar_results = [engine.analyze(values) for values in rows]
+    array_records = engine.to_records(engine.analyze_arrays(columns))
+
+    assert array_records == scalar_results
+
+
+def test_analyze_arrays_handles_missing_metrics():
+    engine = posture_analysis_engine
+    columns = {"neck_angle": np.array([10.0, 30.0, np.nan]), "head_tilt": np.array([1.0, 9.0, 2.0])}
+    rows = [{"neck_angle": 10.0, "head_tilt": 1.0}, {"neck_angle": 30.0, "head_tilt": 9.0}, {"neck_angle": float("nan"), "head_tilt": 2.0}]
+
+    assert engine.to_records(engine.analyze_arrays(columns)) == [engine.analyze(values) for values in rows]
@@ -0,0 +1,42 @@
+"""
+엔드포인트별 쿼리 예산 테스트
+
+benchmarks/check_query_budgets.py와 같은 시드/호출로 모든 HTTP 엔드포인트를 strict 모드에서 호출하여
+요청별 SQL 실행 횟수가 QUERY_BUDGETS 이내인지 확인합니다.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.query_budget import query_budget_tracker
+from app.db.session import init_db
+from app.main import app
+from benchmarks.check_query_budgets import missing_budgets, run_requests
+
+
+@pytest.fixture(scope="module")
+def results():
+    init_db()
+    with TestClient(app) as client:
+        return run_requests(client, settings.API_V1_STR, records=200)
+
+
+def test_all_endpoints_have_budgets():
+    assert missing_budgets(settings.API_V1_STR) == []
+
+
+def test_no_server_errors(results):
+    # strict 모드에서는 예산을 넘은 요청이 500으로 응답
+    errors = [(method, path, status_code) for method, path, status_code, _, _ in results if status_code >= 500]
+    assert errors == []
+
+
+def test_queries_within_budget(results):
+    over_budget = [
+        (method, path, queries, budget)
+        for method, path, _, queries, budget in results
+        if budget == "-" or queries > int(budget)
+    ]
+    assert over_budget == []
+    assert query_budget_tracker.recent_violations() == []
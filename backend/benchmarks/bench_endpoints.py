@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+수집/대시보드 엔드포인트 부하 벤치마크
+
+사용자와 자세 기록을 시드한 데이터베이스(기본: 임시 SQLite, --database-url로 MySQL 호환 DB)에 대해
+/posture/save, /posture/records, /posture/stats, /posture/trends, /users/login을
+ASGI 클라이언트(httpx.ASGITransport)로 프로세스 안에서 고정 동시성으로 호출하고
+엔드포인트/동시성별 처리량(req/s), p50/p95/p99 지연 시간, 요청당 SQL 실행 횟수를 출력합니다.
+(요청당 SQL 실행 횟수는 쿼리 프로파일링 응답 헤더 X-DB-Query-Count 사용)
+
+결과는 JSON 기준선으로 저장하고(--output), 이전 커밋의 기준선과 비교하여(--compare)
+p95 지연 시간 증가나 처리량 감소가 --max-regression(%)을 넘거나 요청당 SQL 실행 횟수가 늘면
+종료 코드 1로 끝납니다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_endpoints.py --users 20 --records 200000 --concurrency 1,8,32 --output baseline.json
+    python benchmarks/bench_endpoints.py --users 20 --records 200000 --concurrency 1,8,32 --compare baseline.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# backend 디렉토리를 Python 경로에 추가
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+ENDPOINTS = ("save", "records", "stats", "trends", "login")
+PASSWORD = "bench-password"
+
+
+def configure_environment(database_url: str, query_cache: bool) -> None:
+    """app import 전에 벤치마크용 설정 지정 (쿼리 프로파일링은 헤더 수집용, 예산 초과로 실패시키지 않음)"""
+    os.environ["USE_LOCAL_CONFIG"] = "false"
+    os.environ["DATABASE_URL"] = database_url
+    os.environ["QUERY_PROFILING_ENABLED"] = "true"
+    os.environ["QUERY_BUDGET_STRICT"] = "false"
+    os.environ["QUERY_CACHE_ENABLED"] = "true" if query_cache else "false"
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+
+def seed(users: int, records: int, days: int, chunk_size: int = 50000) -> None:
+    """사용자(비밀번호 PASSWORD)와 자세 기록 시드 (최근 days일에 균등 분포) 및 일일 집계 백필"""
+    from sqlalchemy import insert
+
+    from app.core.security import get_password_hash
+    from app.crud.posture_rollup import posture_daily_rollup
+    from app.db.session import SessionLocal, engine, init_db
+    from app.models.posture import PostureRecord
+    from app.models.user import User
+
+    init_db()
+    hashed_password = get_password_hash(PASSWORD)
+    now = datetime.now()
+    rng = random.Random(42)
+
+    with engine.begin() as conn:
+        conn.execute(insert(User), [
+            {"id": i, "email": f"bench{i}@example.com", "username": f"bench{i}", "hashed_password": hashed_password}
+            for i in range(1, users + 1)
+        ])
+
+    for offset in range(0, records, chunk_size):
+        batch = []
+        for _ in range(min(chunk_size, records - offset)):
+            neck_angle = rng.gauss(10, 15)
+            forward_head_distance = rng.gauss(80, 25)
+            head_tilt = rng.gauss(0, 8)
+            batch.append({
+                "user_id": rng.randint(1, users),
+                "neck_angle": neck_angle,
+                "shoulder_slope": rng.gauss(0, 3),
+                "head_forward": rng.gauss(5, 3),
+                "shoulder_height_diff": rng.gauss(0, 5),
+                "score": min(100.0, max(0.0, rng.gauss(75, 12))),
+                "forward_head_distance": forward_head_distance,
+                "head_tilt": head_tilt,
+                "cervical_lordosis": rng.gauss(35, 8),
+                "left_shoulder_height_diff": rng.gauss(0, 4),
+                "left_scapular_winging": abs(rng.gauss(1, 1)),
+                "right_scapular_winging": abs(rng.gauss(1, 1)),
+                "shoulder_forward_movement": rng.gauss(2, 2),
+                "head_rotation": rng.gauss(0, 6),
+                "session_id": "bench",
+                "is_neck_angle_normal": -30 <= neck_angle <= 30,
+                "is_forward_head_normal": forward_head_distance <= 100,
+                "is_head_tilt_normal": -15 <= head_tilt <= 15,
+                "created_at": now - timedelta(seconds=rng.uniform(0, days * 86400))
+            })
+        with engine.begin() as conn:
+            conn.execute(insert(PostureRecord), batch)
+
+    db = SessionLocal()
+    try:
+        for user_id in range(1, users + 1):
+            posture_daily_rollup.rebuild(db, user_id)
+    finally:
+        db.close()
+
+
+def request_factories(api: str, users: int, rng: random.Random) -> Dict[str, Callable[[], Tuple[str, str, dict]]]:
+    """엔드포인트별 요청 생성 함수 (메서드, 경로, httpx 요청 인자)"""
+
+    def save():
+        user_id = rng.randint(1, users)
+        return "POST", f"{api}/posture/save", {"json": {
+            "userId": user_id,
+            "score": round(rng.uniform(40, 100), 1),
+            "neckAngle": rng.gauss(10, 15),
+            "shoulderSlope": rng.gauss(0, 3),
+            "headForward": rng.gauss(5, 3),
+            "shoulderHeightDiff": rng.gauss(0, 5),
+            "forwardHeadDistance": rng.gauss(80, 25),
+            "headTilt": rng.gauss(0, 8),
+            "sessionId": f"bench-{user_id}"
+        }}
+
+    def records():
+        return "GET", f"{api}/posture/records", {"params": {"user_id": rng.randint(1, users), "limit": 100}}
+
+    def stats():
+        return "GET", f"{api}/posture/stats", {"params": {"user_id": rng.randint(1, users), "days": 30}}
+
+    def trends():
+        return "GET", f"{api}/posture/trends", {"params": {"user_id": rng.randint(1, users), "days": 7}}
+
+    def login():
+        return "POST", f"{api}/users/login", {"json": {"email": f"bench{rng.randint(1, users)}@example.com", "password": PASSWORD}}
+
+    return {"save": save, "records": records, "stats": stats, "trends": trends, "login": login}
+
+
+async def run_level(client, factory, concurrency: int, requests: int) -> Dict:
+    """동시성 concurrency로 requests건 호출 후 처리량/지연 시간/쿼리 수 집계"""
+    latencies: List[float] = []
+    queries: List[int] = []
+    errors = 0
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            method, url, kwargs = factory()
+            started = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            latencies.append((time.perf_counter() - started) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+            if "X-DB-Query-Count" in response.headers:
+                queries.append(int(response.headers["X-DB-Query-Count"]))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    values = np.array(latencies)
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 2),
+        "mean_ms": round(float(values.mean()), 2),
+        "p50_ms": round(float(np.percentile(values, 50)), 2),
+        "p95_ms": round(float(np.percentile(values, 95)), 2),
+        "p99_ms": round(float(np.percentile(values, 99)), 2),
+        "queries_per_request": round(sum(queries) / len(queries), 2) if queries else None
+    }
+
+
+async def run_benchmark(endpoints: List[str], levels: List[int], requests: int, warmup: int, users: int) -> List[Dict]:
+    import httpx
+
+    from app.core.config import settings
+    from app.main import app
+
+    factories = request_factories(settings.API_V1_STR, users, random.Random(7))
+    results = []
+    # 시작/종료 이벤트(쓰기 지연 버퍼, 분석 워커 등)도 실제 서버와 같이 실행
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            for name in endpoints:
+                await run_level(client, factories[name], 1, warmup)
+                for concurrency in levels:
+                    result = {"endpoint": name, **await run_level(client, factories[name], concurrency, requests)}
+                    results.append(result)
+                    print(
+                        f"{name:<8}{concurrency:>6}{result['throughput_rps']:>10.1f}{result['p50_ms']:>10.2f}"
+                        f"{result['p95_ms']:>10.2f}{result['p99_ms']:>10.2f}"
+                        f"{result['queries_per_request'] if result['queries_per_request'] is not None else '-':>8}"
+                        f"{result['errors']:>7}"
+                    )
+    return results
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=backend_dir, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: List[Dict], baseline_path: str, max_regression: float) -> bool:
+    """기준선과 비교 출력 (반환값: 허용 범위를 넘은 회귀가 있으면 True)"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    previous = {(item["endpoint"], item["concurrency"]): item for item in baseline["results"]}
+
+    print(f"\n=== 기준선 비교 ({baseline['meta'].get('commit') or baseline_path}) ===")
+    print(f"{'엔드포인트':<10}{'동시성':>6}{'p95 변화':>12}{'처리량 변화':>12}{'쿼리':>14}")
+    regressed = False
+    for result in results:
+        before = previous.get((result["endpoint"], result["concurrency"]))
+        if before is None:
+            continue
+        p95_change = (result["p95_ms"] - before["p95_ms"]) / before["p95_ms"] * 100 if before["p95_ms"] else 0.0
+        rps_change = (result["throughput_rps"] - before["throughput_rps"]) / before["throughput_rps"] * 100 if before["throughput_rps"] else 0.0
+        # 요청당 쿼리 수는 지연 시간과 달리 실행 환경에 따라 흔들리지 않으므로 0.5회 이상 늘면 회귀
+        queries_before = before.get("queries_per_request")
+        queries_after = result["queries_per_request"]
+        queries_increased = queries_before is not None and queries_after is not None and queries_after - queries_before >= 0.5
+        flag = ""
+        if p95_change > max_regression or -rps_change > max_regression or queries_increased:
+            regressed = True
+            flag = " ❌"
+        queries = f"{queries_before if queries_before is not None else '-'}→{queries_after if queries_after is not None else '-'}"
+        print(f"{result['endpoint']:<10}{result['concurrency']:>6}{p95_change:>+11.1f}%{rps_change:>+11.1f}%{queries:>14}{flag}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수집/대시보드 엔드포인트 부하 벤치마크")
+    parser.add_argument("--users", type=int, default=20, help="시드할 사용자 수")
+    parser.add_argument("--records", type=int, default=100_000, help="시드할 자세 기록 수")
+    parser.add_argument("--days", type=int, default=60, help="기록을 분포시킬 기간 (일)")
+    parser.add_argument("--endpoints", type=str, default=",".join(ENDPOINTS), help=f"측정할 엔드포인트 ({','.join(ENDPOINTS)})")
+    parser.add_argument("--concurrency", type=str, default="1,8,32", help="동시성 수준 (쉼표로 구분)")
+    parser.add_argument("--requests", type=int, default=300, help="엔드포인트/동시성별 요청 수")
+    parser.add_argument("--warmup", type=int, default=20, help="엔드포인트별 워밍업 요청 수")
+    parser.add_argument("--database-url", type=str, default=None, help="데이터베이스 URL (기본: 임시 SQLite, 기존 DB면 시드 생략)")
+    parser.add_argument("--no-query-cache", action="store_true", help="통계/트렌드 조회 캐시 비활성화")
+    parser.add_argument("--output", type=str, default=None, help="결과 JSON 기준선 저장 경로")
+    parser.add_argument("--compare", type=str, default=None, help="비교할 기준선 JSON 경로")
+    parser.add_argument("--max-regression", type=float, default=20.0, help="허용할 p95 증가/처리량 감소 비율 (%%)")
+    args = parser.parse_args()
+
+    endpoints = [name.strip() for name in args.endpoints.split(",") if name.strip()]
+    unknown = [name for name in endpoints if name not in ENDPOINTS]
+    if unknown:
+        parser.error(f"지원하지 않는 엔드포인트: {', '.join(unknown)}")
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    database_url = args.database_url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench_endpoints.db')}"
+    configure_environment(database_url, not args.no_query_cache)
+
+    from sqlalchemy import func
+
+    from app.db.session import SessionLocal, init_db
+    from app.models.user import User
+
+    init_db()
+    db = SessionLocal()
+    try:
+        existing_users = db.query(func.count(User.id)).scalar()
+    finally:
+        db.close()
+    if existing_users == 0:
+        print(f"🔄 사용자 {args.users:,}명, 기록 {args.records:,}건 시드 중...")
+        started = time.perf_counter()
+        seed(args.users, args.records, args.days)
+        print(f"✅ 시드 완료 ({time.perf_counter() - started:.1f}s)")
+    else:
+        args.users = existing_users
+        print(f"ℹ️ 기존 데이터베이스 사용 (사용자 {existing_users:,}명, 시드 생략)")
+
+    print(f"\n{'엔드포인트':<8}{'동시성':>6}{'req/s':>10}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}{'쿼리':>8}{'오류':>7}")
+    results = asyncio.run(run_benchmark(endpoints, levels, args.requests, args.warmup, args.users))
+
+    if args.output:
+        report = {
+            "meta": {
+                "commit": git_commit(),
+                "created_at": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "database": database_url.split(":", 1)[0],
+                "users": args.users,
+                "records": args.records,
+                "requests": args.requests,
+                "query_cache": not args.no_query_cache
+            },
+            "results": results
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 기준선 저장: {args.output}")
+
+    if args.compare and compare(results, args.compare, args.max_regression):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
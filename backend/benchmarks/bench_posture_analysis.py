@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+자세 분석 엔진 벤치마크
+
+같은 규칙을 기록 1건씩 실행하는 경로(analyze)와 지표별 NumPy 배열로 실행하는 경로
+(analyze_arrays)의 처리량(rows/sec)을 비교하고, 두 경로의 결과가 정확히 같은지 확인합니다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_posture_analysis.py --rows 1000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# backend 디렉토리를 Python 경로에 추가
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+from app.core.posture_analysis import posture_analysis_engine
+
+
+def generate_columns(engine, rows: int, seed: int = 42) -> dict:
+    """규칙 세트의 모든 지표에 대해 정상/비정상, 경계값, 측정 안 됨(NaN)이 섞인 배열 생성"""
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for rule in engine.rules:
+        low = rule.minimum if rule.minimum is not None else rule.maximum - 20
+        high = rule.maximum if rule.maximum is not None else rule.minimum + 20
+        center = (low + high) / 2
+        values = rng.normal(center, (high - low) * 0.4, rows)
+        # 경계값 포함 (정상 범위 양 끝)
+        boundaries = [bound for bound in (rule.minimum, rule.maximum) if bound is not None]
+        values[: len(boundaries)] = boundaries
+        values[rng.random(rows) < 0.01] = np.nan
+        columns[rule.metric] = values
+    return columns
+
+
+def main():
+    parser = argparse.ArgumentParser(description="자세 분석 엔진 스칼라/배열 경로 처리량 비교")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="분석할 행 수")
+    parser.add_argument("--scalar-rows", type=int, default=200_000, help="스칼라 경로로 측정할 행 수 (앞부분)")
+    args = parser.parse_args()
+
+    engine = posture_analysis_engine
+    columns = generate_columns(engine, args.rows)
+
+    # 스칼라 경로 (기록 1건씩, Python float 입력)
+    scalar_rows = min(args.scalar_rows, args.rows)
+    row_values = [
+        dict(zip(columns.keys(), values))
+        for values in zip(*(columns[metric][:scalar_rows].tolist() for metric in columns))
+    ]
+    started = time.perf_counter()
+    scalar_results = [engine.analyze(values) for values in row_values]
+    scalar_elapsed = time.perf_counter() - started
+
+    # 배열 경로
+    started = time.perf_counter()
+    array_result = engine.analyze_arrays(columns)
+    array_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    array_records = engine.to_records({name: values[:scalar_rows] for name, values in array_result.items()})
+    to_records_elapsed = time.perf_counter() - started
+
+    mismatches = sum(1 for scalar, vector in zip(scalar_results, array_records) if scalar != vector)
+
+    print(f"\n{'경로':<28}{'행 수':>12}{'시간(s)':>12}{'rows/sec':>16}")
+    print(f"{'scalar (analyze)':<28}{scalar_rows:>12,}{scalar_elapsed:>12.3f}{scalar_rows / scalar_elapsed:>16,.0f}")
+    print(f"{'numpy (analyze_arrays)':<28}{args.rows:>12,}{array_elapsed:>12.3f}{args.rows / array_elapsed:>16,.0f}")
+    print(f"{'numpy → 행별 dict':<28}{scalar_rows:>12,}{to_records_elapsed:>12.3f}{scalar_rows / to_records_elapsed:>16,.0f}")
+    print(f"\n규칙 버전: {engine.version} (지표 {len(engine.rules)}개)")
+    print(f"결과 비교 ({scalar_rows:,}행): {'✅ 일치' if mismatches == 0 else f'❌ 불일치 {mismatches}건'}")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
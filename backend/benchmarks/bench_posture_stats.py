@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+자세 통계 조회 벤치마크
+
+기존 get_stats(기간별 개별 쿼리 5회), 원본 기록 조건부 집계 단일 쿼리,
+일일 집계(posture_daily_rollups) 기반 구현의 쿼리 수와 지연 시간을
+시드된 SQLite 데이터베이스에서 비교합니다.
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/bench_posture_stats.py --rows 1000000 --users 10
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+# backend 디렉토리를 Python 경로에 추가
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+from sqlalchemy import create_engine, event, func, and_, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.db.session import Base
+from app.models.user import User
+from app.models.posture import PostureRecord
+from app.crud.posture import posture_record
+from app.crud.posture_rollup import posture_daily_rollup
+
+
+def legacy_get_stats(db, user_id: int, days: int = 30):
+    """기존 get_stats 구현 (비교용, 쿼리 5회)"""
+    start_date = datetime.now() - timedelta(days=days)
+
+    total_records = db.query(PostureRecord).filter(
+        and_(PostureRecord.user_id == user_id, PostureRecord.created_at >= start_date)
+    ).count()
+    if total_records == 0:
+        return {"total_records": 0, "average_score": 0, "improvement_rate": 0, "normal_posture_rate": 0}
+
+    avg_score = db.query(func.avg(PostureRecord.score)).filter(
+        and_(PostureRecord.user_id == user_id, PostureRecord.created_at >= start_date)
+    ).scalar()
+
+    normal_records = db.query(PostureRecord).filter(
+        and_(
+            PostureRecord.user_id == user_id,
+            PostureRecord.created_at >= start_date,
+            PostureRecord.is_neck_angle_normal == True,
+            PostureRecord.is_forward_head_normal == True,
+            PostureRecord.is_head_tilt_normal == True
+        )
+    ).count()
+    normal_rate = (normal_records / total_records) * 100
+
+    recent_start = datetime.now() - timedelta(days=7)
+    previous_start = recent_start - timedelta(days=7)
+    recent_avg = db.query(func.avg(PostureRecord.score)).filter(
+        and_(PostureRecord.user_id == user_id, PostureRecord.created_at >= recent_start)
+    ).scalar() or 0
+    previous_avg = db.query(func.avg(PostureRecord.score)).filter(
+        and_(
+            PostureRecord.user_id == user_id,
+            PostureRecord.created_at >= previous_start,
+            PostureRecord.created_at < recent_start
+        )
+    ).scalar() or 0
+    improvement_rate = ((recent_avg - previous_avg) / previous_avg * 100) if previous_avg > 0 else 0
+
+    return {
+        "total_records": total_records,
+        "average_score": round(avg_score, 2) if avg_score else 0,
+        "improvement_rate": round(improvement_rate, 2),
+        "normal_posture_rate": round(normal_rate, 2)
+    }
+
+
+def seed(engine, rows: int, users: int, days: int, chunk_size: int = 50000):
+    """사용자와 자세 기록 시드 (최근 days일에 균등 분포)"""
+    Base.metadata.create_all(bind=engine)
+    now = datetime.now()
+    rng = random.Random(42)
+
+    with engine.begin() as conn:
+        conn.execute(insert(User), [
+            {"id": i, "email": f"bench{i}@example.com", "username": f"bench{i}", "hashed_password": "x"}
+            for i in range(1, users + 1)
+        ])
+
+    for offset in range(0, rows, chunk_size):
+        batch = []
+        for _ in range(min(chunk_size, rows - offset)):
+            neck_angle = rng.gauss(10, 15)
+            forward_head_distance = rng.gauss(80, 25)
+            head_tilt = rng.gauss(0, 8)
+            batch.append({
+                "user_id": rng.randint(1, users),
+                "neck_angle": neck_angle,
+                "shoulder_slope": rng.gauss(0, 3),
+                "head_forward": rng.gauss(5, 3),
+                "shoulder_height_diff": rng.gauss(0, 5),
+                "score": min(100.0, max(0.0, rng.gauss(75, 12))),
+                "forward_head_distance": forward_head_distance,
+                "head_tilt": head_tilt,
+                "session_id": "bench",
+                "is_neck_angle_normal": -30 <= neck_angle <= 30,
+                "is_forward_head_normal": forward_head_distance <= 100,
+                "is_head_tilt_normal": -15 <= head_tilt <= 15,
+                "created_at": now - timedelta(seconds=rng.uniform(0, days * 86400))
+            })
+        with engine.begin() as conn:
+            conn.execute(insert(PostureRecord), batch)
+
+    # 일일 집계 백필
+    db = sessionmaker(bind=engine)()
+    try:
+        for user_id in range(1, users + 1):
+            posture_daily_rollup.rebuild(db, user_id)
+    finally:
+        db.close()
+
+
+def measure(session_factory, fn, user_ids, repeat: int, counter: dict):
+    """호출당 지연 시간(ms)과 쿼리 수 측정"""
+    latencies = []
+    counter["count"] = 0
+    for _ in range(repeat):
+        for user_id in user_ids:
+            db = session_factory()
+            try:
+                started = time.perf_counter()
+                fn(db, user_id, 30)
+                latencies.append((time.perf_counter() - started) * 1000)
+            finally:
+                db.close()
+    calls = len(latencies)
+    return {
+        "queries_per_call": counter["count"] / calls,
+        "mean_ms": statistics.mean(latencies),
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": sorted(latencies)[int(calls * 0.95) - 1] if calls >= 20 else max(latencies)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="get_stats 구현별 쿼리 수와 지연 시간 비교")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="시드할 자세 기록 수")
+    parser.add_argument("--users", type=int, default=10, help="시드할 사용자 수")
+    parser.add_argument("--days", type=int, default=60, help="기록을 분포시킬 기간 (일)")
+    parser.add_argument("--repeat", type=int, default=5, help="사용자별 반복 횟수")
+    parser.add_argument("--db", type=str, default=None, help="SQLite 파일 경로 (기본: 임시 파일)")
+    args = parser.parse_args()
+
+    db_path = args.db or os.path.join(tempfile.mkdtemp(), "bench_posture_stats.db")
+    engine = create_engine(f"sqlite:///{db_path}")
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    if not os.path.exists(db_path) or os.path.getsize(db_path) == 0:
+        print(f"🔄 {args.rows:,}건 시드 중... ({db_path})")
+        started = time.perf_counter()
+        seed(engine, args.rows, args.users, args.days)
+        print(f"✅ 시드 완료 ({time.perf_counter() - started:.1f}s)")
+
+    counter = {"count": 0}
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_queries(conn, cursor, statement, parameters, context, executemany):
+        counter["count"] += 1
+
+    user_ids = list(range(1, args.users + 1))
+
+    # 두 구현의 결과가 같은지 먼저 확인
+    db = session_factory()
+    try:
+        for user_id in user_ids:
+            legacy = legacy_get_stats(db, user_id, 30)
+            current = posture_record.get_stats_from_records(db, user_id, 30)
+            for key, value in legacy.items():
+                if abs(value - current[key]) > 0.01:
+                    print(f"⚠️ 결과 불일치 user_id={user_id} {key}: {value} != {current[key]}")
+    finally:
+        db.close()
+
+    results = {
+        "legacy (5 queries)": measure(session_factory, legacy_get_stats, user_ids, args.repeat, counter),
+        "single-pass": measure(session_factory, posture_record.get_stats_from_records, user_ids, args.repeat, counter),
+        "daily rollup": measure(session_factory, posture_record.get_stats, user_ids, args.repeat, counter)
+    }
+
+    print(f"\n{'구현':<20}{'쿼리/호출':>12}{'평균(ms)':>12}{'p50(ms)':>12}{'p95(ms)':>12}")
+    for name, result in results.items():
+        print(
+            f"{name:<20}{result['queries_per_call']:>12.1f}{result['mean_ms']:>12.2f}"
+            f"{result['p50_ms']:>12.2f}{result['p95_ms']:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
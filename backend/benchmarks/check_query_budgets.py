@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+엔드포인트별 쿼리 예산 검사
+
+임시 SQLite 데이터베이스에 사용자 1명과 자세 기록을 시드한 뒤
+endpoints/posture.py, endpoints/user.py의 모든 HTTP 엔드포인트를 한 번씩 호출하여
+요청별 SQL 실행 횟수를 app/core/query_budget.py의 QUERY_BUDGETS와 비교합니다.
+(QUERY_BUDGET_STRICT 모드로 실행하므로 예산을 넘으면 응답이 500)
+
+예산을 넘은 엔드포인트나 예산이 없는 엔드포인트가 있으면 종료 코드 1로 끝나므로
+테스트/CI에서 N+1 쿼리(지연 로딩 관계 접근 등) 회귀 검사로 사용할 수 있습니다.
+인증 캐시와 조회 캐시는 끄고 실행합니다 (캐시가 비어 있을 때가 기준).
+같은 검사를 pytest로도 실행합니다 (app/tests/test_query_budgets.py).
+
+사용법 (backend 디렉토리에서):
+    python benchmarks/check_query_budgets.py --records 200
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from datetime import date, timedelta
+
+# backend 디렉토리를 Python 경로에 추가
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, backend_dir)
+
+
+def configure_environment(db_path: str) -> None:
+    """app import 전에 검사용 설정 지정"""
+    os.environ["USE_LOCAL_CONFIG"] = "false"
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ["QUERY_PROFILING_ENABLED"] = "true"
+    os.environ["QUERY_BUDGET_STRICT"] = "true"
+    os.environ["AUTH_CACHE_ENABLED"] = "false"
+    os.environ["QUERY_CACHE_ENABLED"] = "false"
+    os.environ["POSTURE_WRITE_BEHIND_ENABLED"] = "false"
+    os.environ["POSTURE_ANALYSIS_WORKER_ENABLED"] = "false"
+    os.environ["PASSWORD_HASH_WORKERS"] = "0"
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+
+def measurement(user_id: int, session_id: str, index: int) -> dict:
+    """/save 형식 측정 데이터"""
+    return {
+        "userId": user_id,
+        "score": 60 + index % 40,
+        "neckAngle": 10 + index % 30,
+        "shoulderSlope": 1.5,
+        "headForward": 3.0,
+        "shoulderHeightDiff": 0.8,
+        "forwardHeadDistance": 15 + index % 20,
+        "headTilt": 2.0,
+        "sessionId": session_id
+    }
+
+
+def record_create(session_id: str) -> dict:
+    """/record, /analyze 형식 자세 기록"""
+    return {
+        "neck_angle": 18.0, "shoulder_slope": 1.5, "head_forward": 3.0, "shoulder_height_diff": 0.8,
+        "score": 72.0, "cervical_lordosis": 35.0, "forward_head_distance": 20.0, "head_tilt": 2.0,
+        "left_shoulder_height_diff": 0.5, "left_scapular_winging": 1.0, "right_scapular_winging": 1.0,
+        "shoulder_forward_movement": 1.5, "head_rotation": 3.0, "session_id": session_id
+    }
+
+
+def run_requests(client, api: str, records: int) -> list:
+    """
+    사용자/자세 기록을 시드한 뒤 모든 HTTP 엔드포인트를 한 번씩 호출
+
+    요청별 (메서드, 경로, 상태 코드, 쿼리 수, 예산) 목록 반환
+    """
+    from app.crud.posture_analysis_worker import PostureAnalysisWorker
+
+    session_id = "budget-check"
+    email, password = "budget@example.com", "budget-password"
+    today = date.today()
+    period = {"start_date": (today - timedelta(days=30)).isoformat(), "end_date": today.isoformat()}
+    results = []
+
+    def call(method: str, path: str, **kwargs):
+        response = client.request(method, f"{api}{path}", **kwargs)
+        if "X-DB-Query-Count" not in response.headers:
+            raise RuntimeError("쿼리 프로파일링이 활성화되지 않았습니다 (QUERY_PROFILING_ENABLED)")
+        results.append((
+            method, path, response.status_code,
+            int(response.headers["X-DB-Query-Count"]),
+            response.headers.get("X-DB-Query-Budget", "-")
+        ))
+        return response
+
+    # 시드: 사용자, 자세 기록, 분석 결과
+    user = call("POST", "/users/register", json={"username": "budget", "email": email, "password": password}).json()
+    user_id = user["id"]
+    token = call("POST", "/users/login", json={"email": email, "password": password}).json()["access_token"]
+    auth = {"Authorization": f"Bearer {token}"}
+
+    call("POST", "/posture/analysis/start", json={"user_id": user_id, "session_id": session_id})
+    call("POST", "/posture/save", json=measurement(user_id, session_id, 0))
+    for start in range(1, records, 100):
+        items = [measurement(user_id, session_id, i) for i in range(start, min(start + 100, records))]
+        call("POST", "/posture/save/batch", json={"items": items})
+    record = call("POST", "/posture/record", params={"user_id": user_id}, json=record_create(session_id)).json()
+    PostureAnalysisWorker(batch_size=500, interval=0).replay(user_id)
+
+    # 조회
+    call("GET", "/posture/records", params={"user_id": user_id, **period})
+    page = call("GET", "/posture/records/page", params={"user_id": user_id, "limit": 50}).json()
+    call("GET", "/posture/records/page", params={"user_id": user_id, "limit": 50, "cursor": page["next_cursor"]})
+    call("GET", "/posture/records/summary", params={"user_id": user_id, **period})
+    call("GET", "/posture/records/stream", params={"user_id": user_id})
+    call("GET", f"/posture/records/{record['id']}/analysis")
+    call("GET", "/posture/export", params={"user_id": user_id})
+    call("GET", "/posture/stats", params={"user_id": user_id})
+    call("GET", "/posture/trends", params={"user_id": user_id})
+    call("POST", "/posture/analyze", json=record_create(session_id))
+    call("POST", "/posture/analyze/batch", json={"columns": {"neck_angle": [10.0, 30.0], "head_tilt": [1.0, 9.0]}})
+    call("GET", "/posture/medical-standards")
+    call("GET", "/posture/analysis/sessions")
+    call("GET", "/posture/write-buffer")
+    call("GET", "/posture/analysis-worker")
+    call("GET", "/posture/cache")
+    call("POST", "/posture/analysis/stop", params={"session_id": session_id})
+    call("GET", "/posture/sessions", params={"user_id": user_id})
+    call("GET", f"/posture/sessions/{session_id}")
+
+    call("POST", "/users/check-password", json={"email": email, "password": password})
+    reset_token = call("POST", "/users/forgot-password", json={"email": email}).json()["reset_token"]
+    call("POST", "/users/reset-password", json={"email": email, "reset_token": reset_token, "new_password": password})
+    call("GET", "/users/me", headers=auth)
+    call("GET", f"/users/{user_id}")
+    call("PUT", "/users/me", headers=auth, json={"email": "budget2@example.com"})
+    call("GET", "/users/")
+    call("DELETE", "/users/me", headers=auth)
+    return results
+
+
+def missing_budgets(api: str) -> list:
+    """예산이 없는 엔드포인트 (엔드포인트를 추가하면 QUERY_BUDGETS에도 추가)"""
+    from fastapi.routing import APIRoute
+
+    from app.api.v1.routers import api_router
+    from app.core.query_budget import QUERY_BUDGETS
+
+    return [
+        f"{method} {api}{route.path}"
+        for route in api_router.routes if isinstance(route, APIRoute)
+        for method in route.methods
+        if f"{method} {api}{route.path}" not in QUERY_BUDGETS
+    ]
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="엔드포인트별 쿼리 예산 검사")
+    parser.add_argument("--records", type=int, default=200, help="시드할 자세 기록 수 (N+1이 드러나도록 1보다 크게)")
+    args = parser.parse_args()
+
+    db_dir = tempfile.mkdtemp(prefix="query_budget_")
+    configure_environment(os.path.join(db_dir, "check.db"))
+
+    from fastapi.testclient import TestClient
+
+    from app.core.config import settings
+    from app.core.query_budget import query_budget_tracker
+    from app.db.session import init_db
+    from app.main import app
+
+    init_db()
+    api = settings.API_V1_STR
+
+    print("=== 엔드포인트별 쿼리 예산 검사 ===")
+    with TestClient(app) as client:
+        results = run_requests(client, api, args.records)
+
+    print(f"{'메서드':<7} {'경로':<45} {'상태':>4} {'쿼리':>4} {'예산':>4}")
+    for method, path, status_code, queries, budget in results:
+        print(f"{method:<7} {path:<45} {status_code:>4} {queries:>4} {budget:>4}")
+
+    missing = missing_budgets(api)
+    violations = query_budget_tracker.recent_violations()
+    errors = [result for result in results if result[2] >= 500]
+
+    for route in missing:
+        print(f"❌ 쿼리 예산 없음: {route}")
+    for violation in violations:
+        print(f"❌ 쿼리 예산 초과: {violation['route']} {violation['queries']}회 (예산 {violation['budget']}회)")
+    for method, path, status_code, _, _ in errors:
+        print(f"❌ 오류 응답: {method} {path} ({status_code})")
+
+    if missing or violations or errors:
+        sys.exit(1)
+    print(f"\n🎉 {len(results)}건 요청 모두 쿼리 예산 이내")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+자세 기록 압축 스크립트
+--older-than-days일보다 오래된 원본 기록(posture_records)을 세션/분 단위 요약 행(posture_record_summaries)으로
+바꾸고 원본 기록과 분석 결과를 삭제 (cron 등으로 하루 한 번 실행, 동작 방식은 app/crud/posture_summary.py 참고)
+
+일일 집계는 유지되므로 통계/트렌드 조회 결과는 바뀌지 않습니다.
+요약 해상도 조회: GET /api/v1/posture/records/summary
+
+사용법:
+    python compact_records.py                                   # 설정값 사용
+    python compact_records.py --older-than-days 30 --resolution minute
+    python compact_records.py --older-than-days 30 --user-id 3  # 특정 사용자
+"""
+
+import argparse
+import sys
+from datetime import datetime, timedelta
+
+def main():
+    """메인 함수"""
+    from app.core.config import settings
+
+    parser = argparse.ArgumentParser(description="자세 기록 압축")
+    parser.add_argument("--older-than-days", type=int, default=settings.POSTURE_COMPACTION_AFTER_DAYS, help="원본 기록 보존 일수 (이보다 오래된 기록 압축, 0이면 실행 안 함)")
+    parser.add_argument("--resolution", choices=("session", "minute"), default=settings.POSTURE_COMPACTION_RESOLUTION, help="요약 단위")
+    parser.add_argument("--user-id", type=int, default=None, help="압축할 사용자 ID (기본: 전체)")
+    parser.add_argument("--window-days", type=int, default=7, help="한 트랜잭션에서 압축할 기간 (일)")
+    args = parser.parse_args()
+
+    print("=== 자세 기록 압축 ===")
+
+    if args.older_than_days <= 0:
+        print("ℹ️ 원본 기록 보존 일수가 0이므로 압축하지 않습니다 (--older-than-days 또는 POSTURE_COMPACTION_AFTER_DAYS 설정)")
+        return
+
+    try:
+        from app.db.session import SessionLocal
+        from app.crud.posture_partition import posture_partitions
+        from app.crud.posture_summary import posture_record_summary
+        from app.core.cache import query_cache, user_namespace
+
+        before = datetime.now() - timedelta(days=args.older_than_days)
+        db = SessionLocal()
+        try:
+            if args.user_id is not None:
+                user_ids = [args.user_id]
+            else:
+                user_ids = posture_partitions.user_ids(db, None, before)
+
+            print(f"기준: {before:%Y-%m-%d} 이전 기록 → {args.resolution} 단위 요약")
+            total_records = total_summaries = 0
+            for user_id in user_ids:
+                records, summaries = posture_record_summary.compact_user(
+                    db, user_id, before, args.resolution, args.window_days
+                )
+                if records:
+                    query_cache.invalidate(user_namespace(user_id))
+                    print(f"  - user_id={user_id}: 원본 {records:,}건 → 요약 {summaries:,}행")
+                total_records += records
+                total_summaries += summaries
+        finally:
+            db.close()
+
+        ratio = f", {total_records / total_summaries:.1f}:1" if total_summaries else ""
+        print(f"\n🎉 자세 기록 압축 완료! (사용자 {len(user_ids)}명, 원본 {total_records:,}건 → 요약 {total_summaries:,}행{ratio})")
+
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+자세 기록 대량 내보내기 스크립트 (분석용)
+posture_records를 DB 커서에서 청크 단위로 읽어 CSV / Arrow / Parquet 파일로 저장
+(arrow, parquet 형식은 pyarrow 패키지 필요)
+
+사용법:
+    python export_records.py --output records.csv
+    python export_records.py --user-id 3 --start-date 2024-01-01 --end-date 2024-12-31 --format parquet --output user3.parquet
+"""
+
+import argparse
+import sys
+from datetime import datetime, timedelta
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="자세 기록 대량 내보내기")
+    parser.add_argument("--output", required=True, help="저장할 파일 경로 ('-'이면 표준 출력)")
+    parser.add_argument("--format", choices=["csv", "arrow", "parquet"], default=None, help="형식 (기본: 파일 확장자, 없으면 csv)")
+    parser.add_argument("--user-id", type=int, default=None, help="사용자 ID (기본: 전체)")
+    parser.add_argument("--start-date", default=None, help="시작 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--end-date", default=None, help="종료 날짜 (YYYY-MM-DD, 해당 일 포함)")
+    parser.add_argument("--chunk-size", type=int, default=None, help="청크 크기 (기본: POSTURE_EXPORT_CHUNK_SIZE)")
+    args = parser.parse_args()
+
+    export_format = args.format
+    if export_format is None:
+        extension = args.output.rsplit(".", 1)[-1].lower() if "." in args.output else ""
+        export_format = extension if extension in ("csv", "arrow", "parquet") else "csv"
+
+    try:
+        from app.core.config import settings
+        from app.db.session import SessionLocal
+        from app.crud.posture_export import posture_exporter
+
+        start_dt = datetime.strptime(args.start_date, "%Y-%m-%d") if args.start_date else None
+        end_dt = datetime.strptime(args.end_date, "%Y-%m-%d") + timedelta(days=1) if args.end_date else None
+        chunk_size = args.chunk_size or settings.POSTURE_EXPORT_CHUNK_SIZE
+
+        db = SessionLocal()
+        try:
+            content = posture_exporter.export(db, export_format, args.user_id, start_dt, end_dt, chunk_size)
+            output = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+            total_bytes = 0
+            try:
+                for data in content:
+                    output.write(data)
+                    total_bytes += len(data)
+            finally:
+                if output is not sys.stdout.buffer:
+                    output.close()
+        finally:
+            db.close()
+
+        if args.output != "-":
+            print(f"🎉 내보내기 완료! ({export_format}, {total_bytes:,} bytes → {args.output})")
+
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}", file=sys.stderr)
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
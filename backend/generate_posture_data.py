@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+합성 자세 데이터 생성/적재 스크립트
+벤치마크와 용량 산정을 위해 사용자와 실제와 비슷한 분포의 자세 측정 기록(posture_records)을 생성
+(분포와 생성 방식은 app/core/posture_synthetic.py 참고)
+
+사용자는 DB가 ID를 할당하도록 일반 INSERT로 만들고(사용자명 synthetic-<실행 태그>-<번호>),
+사용자를 워커 프로세스 수만큼 나누어 병렬로 기록을 생성합니다.
+- insert: 각 워커가 다중 행 INSERT(청크 단위 트랜잭션)로 바로 적재한 뒤 측정 세션 행 저장, 일일 집계 재생성
+- csv: 워커별 기록/측정 세션 CSV 파일과 MySQL LOAD DATA 문을 출력 (적재 후 rebuild_rollups.py 실행)
+측정 세션 행(posture_sessions)은 생성한 기록을 세션별로 합산한 누적 집계로 만듭니다.
+
+SQLite는 동시 쓰기가 안 되므로 insert 형식에서는 워커 1개로 실행합니다.
+분석 결과(posture_analyses)는 적재 후 replay_analyses.py로 생성합니다.
+
+사용법:
+    python generate_posture_data.py --users 1000 --days 30 --workers 8
+    python generate_posture_data.py --users 50000 --days 90 --workers 16 --format csv --output-dir ./synthetic
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from typing import List, Sequence, Tuple
+
+PASSWORD = "synthetic-password"
+
+
+def _generator(args):
+    from app.core.posture_synthetic import PostureDataGenerator
+
+    start = datetime.strptime(args.start_date, "%Y-%m-%d") if args.start_date else \
+        datetime.now().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=args.days)
+    return PostureDataGenerator(start, args.days, args.sample_interval, args.seed)
+
+
+def _init_worker():
+    """워커 프로세스 시작 시 부모 프로세스에서 복사된 연결 풀을 버림 (연결 공유 방지)"""
+    from app.db.session import engine
+
+    engine.dispose(close=False)
+
+
+def insert_users(args, user_ids: List[int]) -> Tuple[int, float]:
+    """워커: 사용자 범위의 기록을 생성하여 다중 행 INSERT로 적재하고 측정 세션 행 저장 (반환값: (행 수, 초))"""
+    from sqlalchemy import insert
+
+    from app.core.posture_synthetic import SessionTotals, to_rows
+    from app.crud.posture_rollup import posture_daily_rollup
+    from app.db.session import SessionLocal, engine
+    from app.models.posture import PostureRecord, PostureSession
+
+    started = time.perf_counter()
+    saved = 0
+    sessions = SessionTotals()
+    for columns in _generator(args).iter_chunks(user_ids, args.chunk_size):
+        with engine.begin() as conn:
+            conn.execute(insert(PostureRecord), to_rows(columns))
+        sessions.add(columns)
+        saved += len(columns["user_id"])
+
+    session_rows = sessions.rows()
+    for offset in range(0, len(session_rows), args.chunk_size):
+        with engine.begin() as conn:
+            conn.execute(insert(PostureSession), session_rows[offset:offset + args.chunk_size])
+
+    if not args.skip_rollups:
+        db = SessionLocal()
+        try:
+            for user_id in user_ids:
+                posture_daily_rollup.rebuild(db, user_id)
+        finally:
+            db.close()
+    return saved, time.perf_counter() - started
+
+
+def write_csv(args, user_ids: List[int], index: int) -> Tuple[int, float]:
+    """워커: 사용자 범위의 기록과 측정 세션 행을 LOAD DATA용 CSV 파일로 저장 (반환값: (행 수, 초))"""
+    import numpy as np
+
+    from app.core.posture_synthetic import RECORD_COLUMNS, SESSION_COLUMNS, SessionTotals
+
+    started = time.perf_counter()
+    saved = 0
+    sessions = SessionTotals()
+    path = os.path.join(args.output_dir, f"posture_records_{index:04d}.csv")
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(RECORD_COLUMNS)
+        for columns in _generator(args).iter_chunks(user_ids, args.chunk_size):
+            values = []
+            for column in RECORD_COLUMNS:
+                array = columns[column]
+                if column == "created_at":
+                    values.append(np.char.replace(array.astype("datetime64[us]").astype(str), "T", " ").tolist())
+                elif array.dtype == bool:
+                    values.append(array.astype(int).tolist())
+                else:
+                    values.append(array.tolist())
+            writer.writerows(zip(*values))
+            sessions.add(columns)
+            saved += len(columns["user_id"])
+
+    path = os.path.join(args.output_dir, f"posture_sessions_{index:04d}.csv")
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(SESSION_COLUMNS)
+        for row in sessions.rows():
+            writer.writerow([int(row[column]) if isinstance(row[column], bool) else row[column] for column in SESSION_COLUMNS])
+    return saved, time.perf_counter() - started
+
+
+def create_users(count: int, hashed_password: str) -> List[int]:
+    """
+    합성 사용자 생성 (비밀번호는 PASSWORD, 반환값: 생성한 사용자 ID 오름차순)
+
+    ID는 DB가 할당하므로(AUTO_INCREMENT / 시퀀스) 실행 중인 서버의 회원가입과 겹치지 않음
+    생성한 사용자는 이번 실행의 태그가 붙은 사용자명(synthetic-<태그>-<번호>)으로 다시 조회
+    """
+    from sqlalchemy import insert, select
+
+    from app.db.session import engine
+    from app.models.user import User
+
+    prefix = f"synthetic-{uuid.uuid4().hex[:8]}-"
+    with engine.begin() as conn:
+        for offset in range(0, count, 10000):
+            conn.execute(insert(User), [
+                {
+                    "email": f"{prefix}{number}@example.com",
+                    "username": f"{prefix}{number}",
+                    "hashed_password": hashed_password
+                }
+                for number in range(offset + 1, min(offset + 10000, count) + 1)
+            ])
+        return list(conn.execute(
+            select(User.id).where(User.username.like(f"{prefix}%")).order_by(User.id)
+        ).scalars())
+
+
+def load_data_statement(path: str, table: str, columns: Sequence[str]) -> str:
+    return (
+        f"LOAD DATA LOCAL INFILE '{os.path.abspath(path)}' INTO TABLE {table} "
+        f"CHARACTER SET utf8mb4 FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' "
+        f"LINES TERMINATED BY '\\n' IGNORE 1 LINES ({', '.join(columns)});"
+    )
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="합성 자세 데이터 생성/적재")
+    parser.add_argument("--users", type=int, default=100, help="생성할 사용자 수")
+    parser.add_argument("--days", type=int, default=30, help="기록 기간 (일)")
+    parser.add_argument("--start-date", default=None, help="기록 시작 날짜 (YYYY-MM-DD, 기본: 오늘부터 --days일 전)")
+    parser.add_argument("--sample-interval", type=float, default=5.0, help="세션 내 측정 간격 (초, 작을수록 기록 증가)")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="워커 프로세스 수")
+    parser.add_argument("--chunk-size", type=int, default=20000, help="INSERT 트랜잭션 / CSV 쓰기 단위 행 수")
+    parser.add_argument("--format", choices=("insert", "csv"), default="insert", help="적재 방식")
+    parser.add_argument("--output-dir", default="synthetic_data", help="csv 형식 출력 디렉토리")
+    parser.add_argument("--skip-rollups", action="store_true", help="insert 후 일일 집계 재생성 생략")
+    args = parser.parse_args()
+
+    print("=== 합성 자세 데이터 생성 ===")
+
+    try:
+        from app.core.security import get_password_hash
+        from app.db.session import engine, init_db
+
+        if args.start_date:
+            datetime.strptime(args.start_date, "%Y-%m-%d")
+
+        workers = max(1, args.workers)
+        if args.format == "insert" and engine.dialect.name == "sqlite" and workers > 1:
+            print("ℹ️ SQLite는 동시 쓰기가 안 되므로 워커 1개로 적재합니다")
+            workers = 1
+
+        init_db()
+        user_ids = create_users(args.users, get_password_hash(PASSWORD))
+        print(f"✅ 사용자 {len(user_ids):,}명 생성 (ID {user_ids[0]}~{user_ids[-1]}, 비밀번호: {PASSWORD})")
+
+        if args.format == "csv":
+            os.makedirs(args.output_dir, exist_ok=True)
+
+        # 워커당 여러 작업으로 나누어 진행 상황 출력
+        task_size = max(1, len(user_ids) // (workers * 4))
+        tasks = [user_ids[offset:offset + task_size] for offset in range(0, len(user_ids), task_size)]
+
+        started = time.perf_counter()
+        total = 0
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            if args.format == "insert":
+                futures = [executor.submit(insert_users, args, task) for task in tasks]
+            else:
+                futures = [executor.submit(write_csv, args, task, index) for index, task in enumerate(tasks)]
+            for done, future in enumerate(as_completed(futures), 1):
+                rows, _ = future.result()
+                total += rows
+                elapsed = time.perf_counter() - started
+                print(f"  - {done}/{len(tasks)} 작업 완료: 누계 {total:,}행 ({total / elapsed:,.0f}행/초)")
+
+        elapsed = time.perf_counter() - started
+        print(f"\n🎉 합성 자세 데이터 생성 완료! ({total:,}행, {elapsed:.1f}초, {total / elapsed:,.0f}행/초)")
+
+        if args.format == "csv":
+            from app.core.posture_synthetic import RECORD_COLUMNS, SESSION_COLUMNS
+
+            print("\nMySQL 적재 (local_infile 허용 필요), 적재 후 python rebuild_rollups.py 실행:")
+            for index in range(len(tasks)):
+                print(load_data_statement(
+                    os.path.join(args.output_dir, f"posture_records_{index:04d}.csv"), "posture_records", RECORD_COLUMNS
+                ))
+                print(load_data_statement(
+                    os.path.join(args.output_dir, f"posture_sessions_{index:04d}.csv"), "posture_sessions", SESSION_COLUMNS
+                ))
+
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+자세 기록(posture_records) 파티션 관리 스크립트
+월 단위 파티션을 미리 만들고 보존 기간이 지난 파티션을 삭제/보관
+(cron 등으로 하루 한 번 실행, 동작 방식은 app/crud/posture_partition.py 참고)
+
+1. SQLite: 지난 달까지의 기록을 기간별 테이블로 이동
+2. 이번 달부터 --premake개월 뒤까지의 파티션 생성
+3. --retention-months개월보다 오래된 파티션 삭제(drop) 또는 보관 테이블로 분리(archive)
+
+MySQL/PostgreSQL은 먼저 alembic upgrade head로 파티션 테이블로 변환해야 합니다.
+
+사용법:
+    python maintain_partitions.py                                  # 설정값 사용
+    python maintain_partitions.py --retention-months 12 --mode archive
+    python maintain_partitions.py --dry-run                        # 파티션 목록과 보존 정책 대상만 출력
+"""
+
+import argparse
+import sys
+
+def print_partitions(partitions):
+    for partition in partitions:
+        start = partition["start"].strftime("%Y-%m-%d") if partition["start"] else "-"
+        end = partition["end"].strftime("%Y-%m-%d") if partition["end"] else "-"
+        print(f"  - {partition['name']:<32} {start:>10} ~ {end:<10} {partition['rows']:>12,}행")
+
+def main():
+    """메인 함수"""
+    from app.core.config import settings
+
+    parser = argparse.ArgumentParser(description="자세 기록 파티션 관리")
+    parser.add_argument("--premake", type=int, default=settings.POSTURE_PARTITION_PREMAKE_MONTHS, help="미리 만들 다음 달 파티션 수")
+    parser.add_argument("--retention-months", type=int, default=settings.POSTURE_RETENTION_MONTHS, help="이번 달 외 보존 개월 수 (0이면 무기한)")
+    parser.add_argument("--mode", choices=("drop", "archive"), default=settings.POSTURE_RETENTION_MODE, help="보존 기간이 지난 파티션 처리 방식")
+    parser.add_argument("--dry-run", action="store_true", help="변경 없이 현재 파티션과 보존 정책 대상만 출력")
+    args = parser.parse_args()
+
+    print("=== 자세 기록 파티션 관리 ===")
+
+    try:
+        from app.db.session import SessionLocal
+        from app.crud.posture_partition import posture_partitions
+
+        db = SessionLocal()
+        try:
+            print(f"데이터베이스: {posture_partitions.backend(db)}")
+
+            if args.dry_run:
+                print_partitions(posture_partitions.list_partitions(db))
+                expired = posture_partitions.expired(db, args.retention_months)
+                print(f"\n보존 정책 대상 ({args.mode}): {', '.join(p['name'] for p in expired) or '없음'}")
+                return
+
+            rotated = posture_partitions.rotate(db)
+            if rotated:
+                print(f"✅ 기간별 테이블로 이동: {', '.join(rotated)}")
+
+            created = posture_partitions.ensure_future(db, args.premake)
+            print(f"✅ 파티션 생성: {', '.join(created) or '없음'}")
+
+            removed = posture_partitions.apply_retention(db, args.retention_months, args.mode)
+            action = "보관 테이블로 분리" if args.mode == "archive" else "삭제"
+            print(f"✅ 보존 기간이 지난 파티션 {action}: {', '.join(removed) or '없음'}")
+
+            print()
+            print_partitions(posture_partitions.list_partitions(db))
+        finally:
+            db.close()
+
+        print("\n🎉 자세 기록 파티션 관리 완료!")
+
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
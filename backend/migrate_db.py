@@ -1,95 +1,90 @@
 #!/usr/bin/env python3
 """
-배포 환경용 데이터베이스 초기화 스크립트
-Render/Railway 배포 시 사용
+배포 환경용 데이터베이스 마이그레이션 스크립트
+Render/Railway 배포 시 애플리케이션 시작 전에 실행
+
+기존 데이터를 유지한 채
+1. 없는 테이블만 생성 (init_db, 새 DB 첫 배포)
+2. Alembic 마이그레이션 적용 (alembic upgrade head, 이미 최신이면 변경 없음)
+하므로 배포마다 실행해도 파티션(alembic 0004) 등 적용된 스키마가 유지됩니다.
+
+--reset은 자세 데이터 테이블(posture_*: 기록/세션/분석 결과/일일 집계/요약, 기간별/보관 테이블 포함)을
+모두 삭제한 뒤 마이그레이션을 처음부터 다시 적용합니다. (개발/스테이징용, users 테이블은 유지)
+집계/요약 테이블도 함께 삭제하므로 삭제된 기록의 통계가 남지 않습니다.
+
+사용법:
+    python migrate_db.py            # 배포 시작 명령
+    python migrate_db.py --reset    # 자세 데이터 초기화
 """
 
+import argparse
 import os
 import sys
 
+def reset_posture_tables(engine) -> None:
+    """자세 데이터 테이블과 alembic_version 삭제 (외래 키 순서대로, 모델에 없는 기간별/보관 테이블 포함)"""
+    from sqlalchemy import inspect, text
+    from app.db.base import Base
+
+    model_tables = [table.name for table in reversed(Base.metadata.sorted_tables) if table.name.startswith("posture_")]
+    other_tables = sorted(
+        name for name in inspect(engine).get_table_names()
+        if name.startswith("posture_") and name not in model_tables
+    )
+    with engine.begin() as conn:
+        for name in model_tables + other_tables + ["alembic_version"]:
+            # PostgreSQL 파티션은 부모 테이블과 함께 삭제되므로 IF EXISTS
+            conn.execute(text(f"DROP TABLE IF EXISTS {name}"))
+            print(f"  - {name} 삭제")
+
 def main():
     """메인 함수"""
-    print("=== 배포 환경 데이터베이스 초기화 ===")
-    
+    parser = argparse.ArgumentParser(description="배포 환경 데이터베이스 마이그레이션")
+    parser.add_argument("--reset", action="store_true", help="자세 데이터 테이블을 모두 삭제하고 다시 생성")
+    args = parser.parse_args()
+
+    print("=== 배포 환경 데이터베이스 마이그레이션 ===")
+
     try:
         # 배포 환경 설정
         os.environ["USE_LOCAL_CONFIG"] = "false"
-        
+
+        from alembic import command
+        from alembic.config import Config
         from app.db.session import init_db, engine
-        from sqlalchemy import text
-        
+        from sqlalchemy import inspect, text
+
         # 데이터베이스 연결 테스트
         print("🔗 데이터베이스 연결 테스트...")
         with engine.connect() as conn:
-            result = conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 1"))
             print("✅ 데이터베이스 연결 성공")
-        
-        # 기존 테이블 삭제 후 새로 생성 (깨끗한 상태로 시작)
-        print("🔄 기존 테이블 삭제 중...")
-        with engine.connect() as conn:
-            try:
-                # 외래키 제약조건이 있는 테이블들을 먼저 삭제
-                conn.execute(text("DROP TABLE IF EXISTS posture_analyses"))
-                conn.execute(text("DROP TABLE IF EXISTS posture_records"))
-                conn.execute(text("DROP TABLE IF EXISTS posture_sessions"))
-                conn.commit()
-                print("✅ 기존 테이블 삭제 완료")
-            except Exception as e:
-                print(f"ℹ️ 테이블 삭제 중 오류 (무시): {e}")
-        
-        # 테이블 새로 생성 (직접 SQL로 생성하여 최신 스키마 적용)
-        print("🔄 테이블 새로 생성 중...")
-        with engine.connect() as conn:
-            # posture_records 테이블 생성 (session_id를 VARCHAR(50)으로)
-            conn.execute(text("""
-                CREATE TABLE posture_records (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    user_id INT NOT NULL,
-                    neck_angle FLOAT,
-                    shoulder_slope FLOAT,
-                    head_forward FLOAT,
-                    shoulder_height_diff FLOAT,
-                    score FLOAT,
-                    cervical_lordosis FLOAT,
-                    forward_head_distance FLOAT,
-                    head_tilt FLOAT,
-                    left_shoulder_height_diff FLOAT,
-                    left_scapular_winging FLOAT,
-                    right_scapular_winging FLOAT,
-                    shoulder_forward_movement FLOAT,
-                    head_rotation FLOAT,
-                    session_id VARCHAR(50),
-                    device_info VARCHAR(200),
-                    issues TEXT,
-                    is_neck_angle_normal BOOLEAN,
-                    is_forward_head_normal BOOLEAN,
-                    is_head_tilt_normal BOOLEAN,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    FOREIGN KEY (user_id) REFERENCES users(id)
-                )
-            """))
-            conn.commit()
-        print("✅ 테이블 새로 생성 완료")
-        
-        # 새로 생성된 테이블 구조 확인
-        print("🔧 새로 생성된 테이블 구조 확인 중...")
-        with engine.connect() as conn:
-            result = conn.execute(text("DESCRIBE posture_records"))
-            columns = result.fetchall()
-            print("posture_records 테이블 컬럼:")
-            for col in columns:
-                print(f"  - {col[0]}: {col[1]}")
-        
-        # 생성된 테이블 확인
-        print("\n📋 생성된 테이블 목록:")
-        with engine.connect() as conn:
-            result = conn.execute(text("SHOW TABLES"))
-            tables = result.fetchall()
-            for table in tables:
-                print(f"  - {table[0]}")
-        
-        print("\n🎉 배포 환경 데이터베이스 초기화 완료!")
-        
+
+        if args.reset:
+            print("🔄 자세 데이터 테이블 삭제 중...")
+            reset_posture_tables(engine)
+            print("✅ 자세 데이터 테이블 삭제 완료")
+
+        # 없는 테이블 생성 (기존 테이블은 그대로)
+        print("🔄 테이블 생성 중...")
+        init_db()
+        print("✅ 테이블 생성 완료")
+
+        # 마이그레이션 적용
+        print("🔄 마이그레이션 적용 중 (alembic upgrade head)...")
+        backend_dir = os.path.dirname(os.path.abspath(__file__))
+        alembic_config = Config(os.path.join(backend_dir, "alembic.ini"))
+        alembic_config.set_main_option("script_location", os.path.join(backend_dir, "alembic"))
+        command.upgrade(alembic_config, "head")
+        print("✅ 마이그레이션 적용 완료")
+
+        # 테이블 확인
+        print("\n📋 테이블 목록:")
+        for table in inspect(engine).get_table_names():
+            print(f"  - {table}")
+
+        print("\n🎉 배포 환경 데이터베이스 마이그레이션 완료!")
+
     except Exception as e:
         print(f"❌ 오류 발생: {e}")
         import traceback
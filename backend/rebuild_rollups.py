@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+일일 자세 집계(posture_daily_rollups) 백필 스크립트
+원본 posture_records(SQLite 기간별 테이블 포함)로부터 사용자별 일일 집계를 다시 생성
+
+사용법:
+    python rebuild_rollups.py              # 전체 사용자
+    python rebuild_rollups.py --user-id 3  # 특정 사용자
+"""
+
+import argparse
+import sys
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="일일 자세 집계 재생성")
+    parser.add_argument("--user-id", type=int, default=None, help="재생성할 사용자 ID (기본: 전체)")
+    args = parser.parse_args()
+    
+    print("=== 일일 자세 집계 재생성 ===")
+    
+    try:
+        from app.db.session import SessionLocal
+        from app.crud.posture_partition import posture_partitions
+        from app.crud.posture_rollup import posture_daily_rollup
+        
+        db = SessionLocal()
+        try:
+            if args.user_id is not None:
+                user_ids = [args.user_id]
+            else:
+                user_ids = posture_partitions.user_ids(db)
+            
+            # 사용자 단위로 커밋하여 트랜잭션 크기 제한
+            total_rows = 0
+            for user_id in user_ids:
+                rows = posture_daily_rollup.rebuild(db, user_id)
+                total_rows += rows
+                print(f"  - user_id={user_id}: {rows}일")
+        finally:
+            db.close()
+        
+        print(f"\n🎉 일일 자세 집계 재생성 완료! (사용자 {len(user_ids)}명, {total_rows}행)")
+        
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
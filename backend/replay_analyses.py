@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+자세 분석 결과(posture_analyses) 재생성 스크립트
+현재 분석 규칙 버전의 분석 결과가 없는 과거 posture_records를 분석하여 일괄 저장
+(분석 워커 도입 이전 기록, 규칙 버전 변경 후 재분석)
+
+이미 분석된 기록은 건너뛰므로 중단 후 다시 실행해도 됩니다.
+
+사용법:
+    python replay_analyses.py                                    # 전체 기록
+    python replay_analyses.py --user-id 3 --start-date 2024-01-01 --end-date 2024-12-31
+"""
+
+import argparse
+import sys
+from datetime import datetime, timedelta
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="자세 분석 결과 재생성")
+    parser.add_argument("--user-id", type=int, default=None, help="사용자 ID (기본: 전체)")
+    parser.add_argument("--start-date", default=None, help="시작 날짜 (YYYY-MM-DD)")
+    parser.add_argument("--end-date", default=None, help="종료 날짜 (YYYY-MM-DD, 해당 일 포함)")
+    parser.add_argument("--batch-size", type=int, default=None, help="배치 크기 (기본: POSTURE_ANALYSIS_WORKER_BATCH_SIZE)")
+    args = parser.parse_args()
+
+    print("=== 자세 분석 결과 재생성 ===")
+
+    try:
+        from app.core.config import settings
+        from app.core.posture_analysis import posture_analysis_engine
+        from app.crud.posture_analysis_worker import PostureAnalysisWorker
+
+        start_dt = datetime.strptime(args.start_date, "%Y-%m-%d") if args.start_date else None
+        end_dt = datetime.strptime(args.end_date, "%Y-%m-%d") + timedelta(days=1) if args.end_date else None
+
+        worker = PostureAnalysisWorker(
+            batch_size=args.batch_size or settings.POSTURE_ANALYSIS_WORKER_BATCH_SIZE,
+            interval=0,
+            max_retries=settings.POSTURE_ANALYSIS_WORKER_MAX_RETRIES,
+            retry_backoff=settings.POSTURE_ANALYSIS_WORKER_RETRY_BACKOFF
+        )
+        print(f"분석 규칙 버전: {posture_analysis_engine.version}")
+
+        def progress(saved: int, last_id: int) -> None:
+            print(f"  - {saved:,}건 저장 (마지막 기록 ID: {last_id})")
+
+        saved = worker.replay(args.user_id, start_dt, end_dt, progress)
+        stats = worker.get_stats()
+
+        print(f"\n🎉 자세 분석 결과 재생성 완료! ({saved:,}건 저장, 실패 {stats['failed']}건)")
+        if stats["failed"]:
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()